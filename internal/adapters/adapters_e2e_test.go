@@ -1,10 +1,13 @@
 package adapters
 
 import (
+	"context"
 	"encoding/json"
 	"fmt"
+	"io"
 	"net/http"
 	"net/http/httptest"
+	"net/url"
 	"strings"
 	"testing"
 	"time"
@@ -486,7 +489,7 @@ func TestErrorMalformedJSON(t *testing.T) {
 
 	t.Run("asana_malformed_connection", func(t *testing.T) {
 		cfg := &config.AsanaAdapterConfig{Enabled: true, ProjectGID: "p", TokenEnv: "T"}
-		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(malformedServer.Client()), WithEnvGetter(func(string) string { return "tok" }))
+		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(malformedServer.Client()), staticTokenEnv)
 		a.SetBaseURL(malformedServer.URL)
 
 		ok, msg := a.TestConnection()
@@ -500,7 +503,7 @@ func TestErrorMalformedJSON(t *testing.T) {
 
 	t.Run("asana_malformed_fetch", func(t *testing.T) {
 		cfg := &config.AsanaAdapterConfig{Enabled: true, ProjectGID: "p", TokenEnv: "T"}
-		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(malformedServer.Client()), WithEnvGetter(func(string) string { return "tok" }))
+		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(malformedServer.Client()), staticTokenEnv)
 		a.SetBaseURL(malformedServer.URL)
 
 		_, err := a.FetchItems(nil)
@@ -511,7 +514,7 @@ func TestErrorMalformedJSON(t *testing.T) {
 
 	t.Run("asana_malformed_getitem", func(t *testing.T) {
 		cfg := &config.AsanaAdapterConfig{Enabled: true, ProjectGID: "p", TokenEnv: "T"}
-		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(malformedServer.Client()), WithEnvGetter(func(string) string { return "tok" }))
+		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(malformedServer.Client()), staticTokenEnv)
 		a.SetBaseURL(malformedServer.URL)
 
 		_, err := a.GetItem("123")
@@ -530,7 +533,7 @@ func TestErrorMalformedJSON(t *testing.T) {
 		defer badCreateServer.Close()
 
 		cfg := &config.AsanaAdapterConfig{Enabled: true, ProjectGID: "p", TokenEnv: "T"}
-		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(badCreateServer.Client()), WithEnvGetter(func(string) string { return "tok" }))
+		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(badCreateServer.Client()), staticTokenEnv)
 		a.SetBaseURL(badCreateServer.URL)
 
 		_, err := a.CreateItem(&database.Requirement{ReqID: "REQ-X", RequirementText: "test"})
@@ -541,7 +544,7 @@ func TestErrorMalformedJSON(t *testing.T) {
 
 	t.Run("monday_malformed_fetch", func(t *testing.T) {
 		cfg := &config.MondayAdapterConfig{Enabled: true, BoardID: "b", TokenEnv: "T"}
-		m, _ := NewMondayAdapter(cfg, WithHTTPClient(malformedServer.Client()), WithEnvGetter(func(string) string { return "tok" }))
+		m, _ := NewMondayAdapter(cfg, WithHTTPClient(malformedServer.Client()), staticTokenEnv)
 		m.SetAPIURL(malformedServer.URL)
 
 		// Monday graphQL method returns error if decode fails
@@ -553,7 +556,7 @@ func TestErrorMalformedJSON(t *testing.T) {
 
 	t.Run("monday_malformed_getitem", func(t *testing.T) {
 		cfg := &config.MondayAdapterConfig{Enabled: true, BoardID: "b", TokenEnv: "T"}
-		m, _ := NewMondayAdapter(cfg, WithHTTPClient(malformedServer.Client()), WithEnvGetter(func(string) string { return "tok" }))
+		m, _ := NewMondayAdapter(cfg, WithHTTPClient(malformedServer.Client()), staticTokenEnv)
 		m.SetAPIURL(malformedServer.URL)
 
 		_, err := m.GetItem("123")
@@ -564,7 +567,7 @@ func TestErrorMalformedJSON(t *testing.T) {
 
 	t.Run("gitlab_malformed_fetch", func(t *testing.T) {
 		cfg := &config.GitLabAdapterConfig{Enabled: true, Server: malformedServer.URL, Project: "g/p"}
-		g, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		g, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		_, err := g.FetchItems(nil)
 		if err == nil {
@@ -574,7 +577,7 @@ func TestErrorMalformedJSON(t *testing.T) {
 
 	t.Run("gitlab_malformed_getitem", func(t *testing.T) {
 		cfg := &config.GitLabAdapterConfig{Enabled: true, Server: malformedServer.URL, Project: "g/p"}
-		g, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		g, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		_, err := g.GetItem("1")
 		if err == nil {
@@ -590,7 +593,7 @@ func TestErrorMalformedJSON(t *testing.T) {
 		defer badCreateServer.Close()
 
 		cfg := &config.GitLabAdapterConfig{Enabled: true, Server: badCreateServer.URL, Project: "g/p"}
-		g, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		g, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		_, err := g.CreateItem(&database.Requirement{ReqID: "REQ-X", RequirementText: "test"})
 		if err == nil {
@@ -621,7 +624,7 @@ func TestErrorHTTPStatusCodes(t *testing.T) {
 
 		t.Run(fmt.Sprintf("asana_fetch_%s", sc.name), func(t *testing.T) {
 			cfg := &config.AsanaAdapterConfig{Enabled: true, ProjectGID: "p", TokenEnv: "T"}
-			a, _ := NewAsanaAdapter(cfg, WithHTTPClient(server.Client()), WithEnvGetter(func(string) string { return "tok" }))
+			a, _ := NewAsanaAdapter(cfg, WithHTTPClient(server.Client()), staticTokenEnv)
 			a.SetBaseURL(server.URL)
 
 			_, err := a.FetchItems(nil)
@@ -635,7 +638,7 @@ func TestErrorHTTPStatusCodes(t *testing.T) {
 
 		t.Run(fmt.Sprintf("asana_create_%s", sc.name), func(t *testing.T) {
 			cfg := &config.AsanaAdapterConfig{Enabled: true, ProjectGID: "p", TokenEnv: "T"}
-			a, _ := NewAsanaAdapter(cfg, WithHTTPClient(server.Client()), WithEnvGetter(func(string) string { return "tok" }))
+			a, _ := NewAsanaAdapter(cfg, WithHTTPClient(server.Client()), staticTokenEnv)
 			a.SetBaseURL(server.URL)
 
 			_, err := a.CreateItem(&database.Requirement{ReqID: "REQ-X", RequirementText: "test"})
@@ -646,7 +649,7 @@ func TestErrorHTTPStatusCodes(t *testing.T) {
 
 		t.Run(fmt.Sprintf("asana_update_%s", sc.name), func(t *testing.T) {
 			cfg := &config.AsanaAdapterConfig{Enabled: true, ProjectGID: "p", TokenEnv: "T"}
-			a, _ := NewAsanaAdapter(cfg, WithHTTPClient(server.Client()), WithEnvGetter(func(string) string { return "tok" }))
+			a, _ := NewAsanaAdapter(cfg, WithHTTPClient(server.Client()), staticTokenEnv)
 			a.SetBaseURL(server.URL)
 
 			ok := a.UpdateItem("123", &database.Requirement{ReqID: "REQ-X", RequirementText: "test"})
@@ -657,7 +660,7 @@ func TestErrorHTTPStatusCodes(t *testing.T) {
 
 		t.Run(fmt.Sprintf("monday_fetch_%s", sc.name), func(t *testing.T) {
 			cfg := &config.MondayAdapterConfig{Enabled: true, BoardID: "b", TokenEnv: "T"}
-			m, _ := NewMondayAdapter(cfg, WithHTTPClient(server.Client()), WithEnvGetter(func(string) string { return "tok" }))
+			m, _ := NewMondayAdapter(cfg, WithHTTPClient(server.Client()), staticTokenEnv)
 			m.SetAPIURL(server.URL)
 
 			_, err := m.FetchItems(nil)
@@ -668,7 +671,7 @@ func TestErrorHTTPStatusCodes(t *testing.T) {
 
 		t.Run(fmt.Sprintf("monday_create_%s", sc.name), func(t *testing.T) {
 			cfg := &config.MondayAdapterConfig{Enabled: true, BoardID: "b", TokenEnv: "T"}
-			m, _ := NewMondayAdapter(cfg, WithHTTPClient(server.Client()), WithEnvGetter(func(string) string { return "tok" }))
+			m, _ := NewMondayAdapter(cfg, WithHTTPClient(server.Client()), staticTokenEnv)
 			m.SetAPIURL(server.URL)
 
 			_, err := m.CreateItem(&database.Requirement{ReqID: "REQ-X", RequirementText: "test"})
@@ -679,7 +682,7 @@ func TestErrorHTTPStatusCodes(t *testing.T) {
 
 		t.Run(fmt.Sprintf("gitlab_fetch_%s", sc.name), func(t *testing.T) {
 			cfg := &config.GitLabAdapterConfig{Enabled: true, Server: server.URL, Project: "g/p"}
-			g, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+			g, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 			_, err := g.FetchItems(nil)
 			if err == nil {
@@ -689,7 +692,7 @@ func TestErrorHTTPStatusCodes(t *testing.T) {
 
 		t.Run(fmt.Sprintf("gitlab_create_%s", sc.name), func(t *testing.T) {
 			cfg := &config.GitLabAdapterConfig{Enabled: true, Server: server.URL, Project: "g/p"}
-			g, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+			g, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 			_, err := g.CreateItem(&database.Requirement{ReqID: "REQ-X", RequirementText: "test"})
 			if err == nil {
@@ -699,7 +702,7 @@ func TestErrorHTTPStatusCodes(t *testing.T) {
 
 		t.Run(fmt.Sprintf("gitlab_update_%s", sc.name), func(t *testing.T) {
 			cfg := &config.GitLabAdapterConfig{Enabled: true, Server: server.URL, Project: "g/p"}
-			g, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+			g, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 			ok := g.UpdateItem("1", &database.Requirement{ReqID: "REQ-X", RequirementText: "test", Status: database.StatusComplete})
 			if ok {
@@ -715,24 +718,17 @@ func TestErrorHTTPStatusCodes(t *testing.T) {
 func TestErrorNetworkTimeout(t *testing.T) {
 	rtmx.Req(t, "REQ-ADAPT-001")
 
-	// Server that never responds (blocks until context deadline)
-	slowServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		select {
-		case <-r.Context().Done():
-			return
-		case <-time.After(30 * time.Second):
-			return
-		}
-	}))
-	defer slowServer.Close()
-
-	// Use a client with a very short timeout for this test
-	shortTimeoutClient := &http.Client{Timeout: 50 * time.Millisecond}
+	// The client fails every request the way http.Client reports an expired
+	// timeout, so no test waits on a real deadline.
+	const slowServerURL = "https://slow.example.invalid"
+	shortTimeoutClient := &MockHTTPClient{
+		Err: &url.Error{Op: "Get", URL: slowServerURL, Err: context.DeadlineExceeded},
+	}
 
 	t.Run("asana_timeout", func(t *testing.T) {
 		cfg := &config.AsanaAdapterConfig{Enabled: true, ProjectGID: "p", TokenEnv: "T"}
-		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(shortTimeoutClient), WithEnvGetter(func(string) string { return "tok" }))
-		a.SetBaseURL(slowServer.URL)
+		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(shortTimeoutClient), staticTokenEnv)
+		a.SetBaseURL(slowServerURL)
 
 		ok, _ := a.TestConnection()
 		if ok {
@@ -742,8 +738,8 @@ func TestErrorNetworkTimeout(t *testing.T) {
 
 	t.Run("monday_timeout", func(t *testing.T) {
 		cfg := &config.MondayAdapterConfig{Enabled: true, BoardID: "b", TokenEnv: "T"}
-		m, _ := NewMondayAdapter(cfg, WithHTTPClient(shortTimeoutClient), WithEnvGetter(func(string) string { return "tok" }))
-		m.SetAPIURL(slowServer.URL)
+		m, _ := NewMondayAdapter(cfg, WithHTTPClient(shortTimeoutClient), staticTokenEnv)
+		m.SetAPIURL(slowServerURL)
 
 		ok, _ := m.TestConnection()
 		if ok {
@@ -752,10 +748,10 @@ func TestErrorNetworkTimeout(t *testing.T) {
 	})
 
 	t.Run("gitlab_timeout", func(t *testing.T) {
-		cfg := &config.GitLabAdapterConfig{Enabled: true, Server: slowServer.URL, Project: "g/p"}
+		cfg := &config.GitLabAdapterConfig{Enabled: true, Server: slowServerURL, Project: "g/p"}
 		g, _ := NewGitLabAdapter(cfg,
 			WithHTTPClient(shortTimeoutClient),
-			WithEnvGetter(func(string) string { return "tok" }),
+			staticTokenEnv,
 		)
 
 		ok, _ := g.TestConnection()
@@ -769,16 +765,16 @@ func TestErrorNetworkTimeout(t *testing.T) {
 func TestErrorEmptyResponseBody(t *testing.T) {
 	rtmx.Req(t, "REQ-ADAPT-004")
 
-	emptyServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.WriteHeader(200)
-		// Return empty body (no JSON)
-	}))
-	defer emptyServer.Close()
+	// Every request gets a 200 with an empty body (no JSON)
+	const emptyServerURL = "https://empty.example.invalid"
+	emptyClient := clientFunc(func(*http.Request) (*http.Response, error) {
+		return &http.Response{StatusCode: http.StatusOK, Body: io.NopCloser(strings.NewReader(""))}, nil
+	})
 
 	t.Run("asana_empty_connection", func(t *testing.T) {
 		cfg := &config.AsanaAdapterConfig{Enabled: true, ProjectGID: "p", TokenEnv: "T"}
-		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(emptyServer.Client()), WithEnvGetter(func(string) string { return "tok" }))
-		a.SetBaseURL(emptyServer.URL)
+		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(emptyClient), staticTokenEnv)
+		a.SetBaseURL(emptyServerURL)
 
 		ok, _ := a.TestConnection()
 		if ok {
@@ -788,8 +784,8 @@ func TestErrorEmptyResponseBody(t *testing.T) {
 
 	t.Run("asana_empty_fetch", func(t *testing.T) {
 		cfg := &config.AsanaAdapterConfig{Enabled: true, ProjectGID: "p", TokenEnv: "T"}
-		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(emptyServer.Client()), WithEnvGetter(func(string) string { return "tok" }))
-		a.SetBaseURL(emptyServer.URL)
+		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(emptyClient), staticTokenEnv)
+		a.SetBaseURL(emptyServerURL)
 
 		_, err := a.FetchItems(nil)
 		if err == nil {
@@ -799,8 +795,8 @@ func TestErrorEmptyResponseBody(t *testing.T) {
 
 	t.Run("monday_empty_fetch", func(t *testing.T) {
 		cfg := &config.MondayAdapterConfig{Enabled: true, BoardID: "b", TokenEnv: "T"}
-		m, _ := NewMondayAdapter(cfg, WithHTTPClient(emptyServer.Client()), WithEnvGetter(func(string) string { return "tok" }))
-		m.SetAPIURL(emptyServer.URL)
+		m, _ := NewMondayAdapter(cfg, WithHTTPClient(emptyClient), staticTokenEnv)
+		m.SetAPIURL(emptyServerURL)
 
 		_, err := m.FetchItems(nil)
 		if err == nil {
@@ -809,8 +805,8 @@ func TestErrorEmptyResponseBody(t *testing.T) {
 	})
 
 	t.Run("gitlab_empty_fetch", func(t *testing.T) {
-		cfg := &config.GitLabAdapterConfig{Enabled: true, Server: emptyServer.URL, Project: "g/p"}
-		g, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		cfg := &config.GitLabAdapterConfig{Enabled: true, Server: emptyServerURL, Project: "g/p"}
+		g, _ := NewGitLabAdapter(cfg, WithHTTPClient(emptyClient), staticTokenEnv)
 
 		_, err := g.FetchItems(nil)
 		if err == nil {
@@ -834,7 +830,7 @@ func TestErrorMissingRequiredFields(t *testing.T) {
 		defer server.Close()
 
 		cfg := &config.AsanaAdapterConfig{Enabled: true, ProjectGID: "p", TokenEnv: "T"}
-		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(server.Client()), WithEnvGetter(func(string) string { return "tok" }))
+		a, _ := NewAsanaAdapter(cfg, WithHTTPClient(server.Client()), staticTokenEnv)
 		a.SetBaseURL(server.URL)
 
 		id, err := a.CreateItem(&database.Requirement{ReqID: "REQ-X", RequirementText: "test"})
@@ -858,7 +854,7 @@ func TestErrorMissingRequiredFields(t *testing.T) {
 		defer server.Close()
 
 		cfg := &config.MondayAdapterConfig{Enabled: true, BoardID: "b", TokenEnv: "T"}
-		m, _ := NewMondayAdapter(cfg, WithHTTPClient(server.Client()), WithEnvGetter(func(string) string { return "tok" }))
+		m, _ := NewMondayAdapter(cfg, WithHTTPClient(server.Client()), staticTokenEnv)
 		m.SetAPIURL(server.URL)
 
 		_, err := m.GetItem("999")
@@ -879,7 +875,7 @@ func TestErrorMissingRequiredFields(t *testing.T) {
 		defer server.Close()
 
 		cfg := &config.GitLabAdapterConfig{Enabled: true, Server: server.URL, Project: "g/p"}
-		g, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		g, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		id, err := g.CreateItem(&database.Requirement{ReqID: "REQ-X", RequirementText: "test"})
 		if err != nil {
@@ -938,7 +934,7 @@ func TestRoundtripAsanaFidelity(t *testing.T) {
 	defer server.Close()
 
 	cfg := &config.AsanaAdapterConfig{Enabled: true, ProjectGID: "proj-1", TokenEnv: "T"}
-	adapter, _ := NewAsanaAdapter(cfg, WithHTTPClient(server.Client()), WithEnvGetter(func(string) string { return "tok" }))
+	adapter, _ := NewAsanaAdapter(cfg, WithHTTPClient(server.Client()), staticTokenEnv)
 	adapter.SetBaseURL(server.URL)
 
 	// Create a requirement and push it to the adapter
@@ -1057,7 +1053,7 @@ func TestRoundtripMondayFidelity(t *testing.T) {
 	defer server.Close()
 
 	cfg := &config.MondayAdapterConfig{Enabled: true, BoardID: "board-1", TokenEnv: "T"}
-	adapter, _ := NewMondayAdapter(cfg, WithHTTPClient(server.Client()), WithEnvGetter(func(string) string { return "tok" }))
+	adapter, _ := NewMondayAdapter(cfg, WithHTTPClient(server.Client()), staticTokenEnv)
 	adapter.SetAPIURL(server.URL)
 
 	req := &database.Requirement{
@@ -1184,7 +1180,7 @@ func TestRoundtripGitLabFidelity(t *testing.T) {
 	defer server.Close()
 
 	cfg := &config.GitLabAdapterConfig{Enabled: true, Server: server.URL, Project: "g/p"}
-	adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+	adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 	// Create
 	req := &database.Requirement{
@@ -457,12 +457,15 @@ func (g *GitLabAdapter) extractPriority(labels []string) string {
 	return ""
 }
 
+// milestoneVersionPattern matches milestone titles that already look like a
+// version (X.Y or X.Y.Z, with or without a leading "v").
+var milestoneVersionPattern = regexp.MustCompile(`^v?\d+\.\d+(\.\d+)?$`)
+
 // MilestoneToVersion maps a GitLab milestone title to an RTMX version string.
 // This supports bidirectional sync where milestones correspond to release versions.
 func (g *GitLabAdapter) MilestoneToVersion(milestoneTitle string) string {
 	// If the milestone title already looks like a version (vX.Y.Z), return as-is.
-	versionPattern := regexp.MustCompile(`^v?\d+\.\d+(\.\d+)?$`)
-	if versionPattern.MatchString(milestoneTitle) {
+	if milestoneVersionPattern.MatchString(milestoneTitle) {
 		if !strings.HasPrefix(milestoneTitle, "v") {
 			return "v" + milestoneTitle
 		}
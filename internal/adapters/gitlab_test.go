@@ -48,7 +48,7 @@ func TestGitLabAdapter(t *testing.T) {
 			Enabled: false,
 			Project: "mygroup/myproject",
 		}
-		_, err := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		_, err := NewGitLabAdapter(cfg, staticTokenEnv)
 		if err == nil {
 			t.Error("expected error when adapter is disabled")
 		}
@@ -71,7 +71,7 @@ func TestGitLabAdapter(t *testing.T) {
 			Enabled: true,
 			Project: "",
 		}
-		_, err := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		_, err := NewGitLabAdapter(cfg, staticTokenEnv)
 		if err == nil {
 			t.Error("expected error when project is empty")
 		}
@@ -100,7 +100,7 @@ func TestGitLabAdapter(t *testing.T) {
 			Enabled: true,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 		if adapter.serverURL != "https://gitlab.com" {
 			t.Errorf("serverURL = %q, want %q", adapter.serverURL, "https://gitlab.com")
 		}
@@ -112,7 +112,7 @@ func TestGitLabAdapter(t *testing.T) {
 			Server:  "https://gitlab.example.com/",
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 		if adapter.serverURL != "https://gitlab.example.com" {
 			t.Errorf("serverURL = %q, want %q", adapter.serverURL, "https://gitlab.example.com")
 		}
@@ -176,7 +176,7 @@ func TestGitLabAdapter(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		items, err := adapter.FetchItems(nil)
 		if err != nil {
@@ -209,7 +209,7 @@ func TestGitLabAdapter(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 		_, _ = adapter.FetchItems(map[string]interface{}{"state": "opened"})
 
 		if !strings.Contains(capturedQuery, "state=opened") {
@@ -243,7 +243,7 @@ func TestGitLabAdapter(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		item, err := adapter.GetItem("42")
 		if err != nil {
@@ -276,7 +276,7 @@ func TestGitLabAdapter(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		req := &database.Requirement{
 			ReqID:           "REQ-TEST-010",
@@ -317,7 +317,7 @@ func TestGitLabAdapter(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		req := &database.Requirement{
 			ReqID:           "REQ-TEST-010",
@@ -343,7 +343,7 @@ func TestGitLabAdapter(t *testing.T) {
 			Enabled: true,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		if adapter.MapStatusToRTMX("closed") != database.StatusComplete {
 			t.Error("closed should map to COMPLETE")
@@ -368,7 +368,7 @@ func TestGitLabAdapter(t *testing.T) {
 				"closed": "COMPLETE",
 			},
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		if adapter.MapStatusToRTMX("opened") != database.StatusNotStarted {
 			t.Error("opened with custom mapping should map to NOT_STARTED")
@@ -390,7 +390,7 @@ func TestGitLabAdapter(t *testing.T) {
 			Server:  server.URL,
 			Project: "mygroup/myproject",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		ok, msg := adapter.TestConnection()
 		if !ok {
@@ -412,7 +412,7 @@ func TestGitLabAdapter(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		ok, msg := adapter.TestConnection()
 		if ok {
@@ -433,7 +433,7 @@ func TestGitLabBidirectionalSync(t *testing.T) {
 		Enabled: true,
 		Project: "g/p",
 	}
-	adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+	adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 	t.Run("MilestoneToVersion with semver", func(t *testing.T) {
 		tests := []struct {
@@ -513,7 +513,7 @@ func TestGitLabBidirectionalSync(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		serverAdapter, _ := NewGitLabAdapter(serverCfg, WithEnvGetter(func(string) string { return "tok" }))
+		serverAdapter, _ := NewGitLabAdapter(serverCfg, staticTokenEnv)
 
 		items, err := serverAdapter.FetchItems(nil)
 		if err != nil {
@@ -549,7 +549,7 @@ func TestGitLabBidirectionalSync(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		serverAdapter, _ := NewGitLabAdapter(serverCfg, WithEnvGetter(func(string) string { return "tok" }))
+		serverAdapter, _ := NewGitLabAdapter(serverCfg, staticTokenEnv)
 
 		req := &database.Requirement{
 			ReqID:           "REQ-SYNC-002",
@@ -599,7 +599,7 @@ func TestGitLabCIIntegration(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		status, err := adapter.GetPipelineStatus("1")
 		if err != nil {
@@ -624,7 +624,7 @@ func TestGitLabCIIntegration(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		status, err := adapter.GetPipelineStatus("2")
 		if err != nil {
@@ -646,7 +646,7 @@ func TestGitLabCIIntegration(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		status, err := adapter.GetPipelineStatus("3")
 		if err != nil {
@@ -671,7 +671,7 @@ func TestGitLabCIIntegration(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		status, err := adapter.GetPipelineStatus("4")
 		if err != nil {
@@ -693,7 +693,7 @@ func TestGitLabCIIntegration(t *testing.T) {
 			Server:  server.URL,
 			Project: "g/p",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		_, err := adapter.GetPipelineStatus("5")
 		if err == nil {
@@ -714,7 +714,7 @@ func TestGitLabCIIntegration(t *testing.T) {
 			Server:  server.URL,
 			Project: "mygroup/myproject",
 		}
-		adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+		adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 		_, _ = adapter.GetPipelineStatus("7")
 
@@ -743,7 +743,7 @@ func TestGitLabCIIntegration(t *testing.T) {
 				Server:  server.URL,
 				Project: "g/p",
 			}
-			adapter, _ := NewGitLabAdapter(cfg, WithEnvGetter(func(string) string { return "tok" }))
+			adapter, _ := NewGitLabAdapter(cfg, staticTokenEnv)
 
 			status, err := adapter.GetPipelineStatus("1")
 			server.Close()
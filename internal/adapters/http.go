@@ -22,6 +22,7 @@ func DefaultHTTPClient() HTTPClient {
 type adapterOptions struct {
 	httpClient HTTPClient
 	getEnv     func(string) string
+	sleep      func(time.Duration)
 }
 
 // AdapterOption configures optional adapter dependencies.
@@ -43,11 +44,20 @@ func WithEnvGetter(fn func(string) string) AdapterOption {
 	}
 }
 
+// WithSleep sets the function used to wait between retry attempts.
+// Use this in tests to skip real backoff delays.
+func WithSleep(fn func(time.Duration)) AdapterOption {
+	return func(o *adapterOptions) {
+		o.sleep = fn
+	}
+}
+
 // defaultOptions returns adapter options with production defaults.
 func defaultOptions() *adapterOptions {
 	return &adapterOptions{
 		httpClient: DefaultHTTPClient(),
 		getEnv:     defaultGetEnv,
+		sleep:      time.Sleep,
 	}
 }
 
@@ -23,6 +23,19 @@ func (m *MockHTTPClient) Do(req *http.Request) (*http.Response, error) {
 	return m.Response, m.Err
 }
 
+// clientFunc adapts a function to HTTPClient, for tests that build a fresh
+// response per request without running a server.
+type clientFunc func(*http.Request) (*http.Response, error)
+
+// Do calls f with the request.
+func (f clientFunc) Do(req *http.Request) (*http.Response, error) {
+	return f(req)
+}
+
+// staticTokenEnv resolves every environment variable to "tok", for tests
+// that only need an adapter to find some token.
+var staticTokenEnv = WithEnvGetter(func(string) string { return "tok" })
+
 // TestHTTPClientInterface validates that http.Client satisfies HTTPClient.
 // REQ-GO-061: Go CLI shall provide HTTPClient interface for adapter testing
 func TestHTTPClientInterface(t *testing.T) {
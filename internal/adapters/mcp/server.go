@@ -38,6 +38,15 @@ type Server struct {
 	listener net.Listener
 	logger   *log.Logger
 	quiet    bool
+
+	// dbMu guards the parsed database shared by read-only tool calls and
+	// the file identity it was parsed from.
+	dbMu   sync.Mutex
+	dbInfo os.FileInfo
+	dbRead *database.Database
+
+	ready     chan struct{}
+	readyOnce sync.Once
 }
 
 // Option configures the Server.
@@ -71,6 +80,7 @@ func NewServer(dbPath string, cfg *config.Config, opts ...Option) *Server {
 		dbPath: dbPath,
 		cfg:    cfg,
 		logger: log.New(os.Stderr, "", 0),
+		ready:  make(chan struct{}),
 	}
 	for _, opt := range opts {
 		opt(s)
@@ -92,12 +102,24 @@ func (s *Server) Addr() string {
 	return ""
 }
 
-// Start starts the MCP server. It binds to the configured address and serves
-// JSON-RPC 2.0 requests. The server can be stopped with Shutdown.
-func (s *Server) Start() error {
+// Ready returns a channel that is closed once Start has bound its listener,
+// so callers can wait for the server to accept connections instead of
+// polling Addr.
+func (s *Server) Ready() <-chan struct{} {
+	return s.ready
+}
+
+// Handler returns the HTTP handler that serves JSON-RPC 2.0 requests on /mcp.
+// Start serves it on a network listener; it can also be driven in-process.
+func (s *Server) Handler() http.Handler {
 	mux := http.NewServeMux()
 	mux.HandleFunc("/mcp", s.handleRPC)
+	return mux
+}
 
+// Start starts the MCP server. It binds to the configured address and serves
+// JSON-RPC 2.0 requests. The server can be stopped with Shutdown.
+func (s *Server) Start() error {
 	addr := fmt.Sprintf("%s:%d", s.host, s.port)
 	ln, err := net.Listen("tcp", addr)
 	if err != nil {
@@ -106,8 +128,9 @@ func (s *Server) Start() error {
 
 	s.mu.Lock()
 	s.listener = ln
-	s.server = &http.Server{Handler: mux}
+	s.server = &http.Server{Handler: s.Handler()}
 	s.mu.Unlock()
+	s.readyOnce.Do(func() { close(s.ready) })
 
 	return s.server.Serve(ln)
 }
@@ -445,7 +468,13 @@ func (s *Server) handleToolsCall(params json.RawMessage) (interface{}, *rpcError
 		return nil, &rpcError{Code: errInvalidReq, Message: "invalid params"}
 	}
 
-	db, err := database.Load(s.dbPath)
+	var db *database.Database
+	var err error
+	if readOnlyTools[call.Name] {
+		db, err = s.loadSharedDB()
+	} else {
+		db, err = database.Load(s.dbPath)
+	}
 	if err != nil {
 		s.logToolCall(call.Name, 0, true)
 		return errorResult(fmt.Sprintf("failed to load database: %v", err)), nil
@@ -512,6 +541,43 @@ func (s *Server) handleToolsCall(params json.RawMessage) (interface{}, *rpcError
 	}, nil
 }
 
+// readOnlyTools are the tools known never to modify the requirements they are
+// given. Only they share the cached copy from loadSharedDB; every other tool,
+// including any added later, receives a freshly loaded database.
+var readOnlyTools = map[string]bool{
+	"status":  true,
+	"backlog": true,
+	"health":  true,
+	"deps":    true,
+	"markers": true,
+	"next":    true,
+}
+
+// loadSharedDB returns the parsed database for read-only tools. The parse is
+// reused until the file on disk is replaced or its size or modification time
+// changes, so repeated tool calls against an unchanged database skip
+// re-reading the CSV.
+func (s *Server) loadSharedDB() (*database.Database, error) {
+	info, statErr := os.Stat(s.dbPath)
+
+	s.dbMu.Lock()
+	defer s.dbMu.Unlock()
+
+	if statErr == nil && s.dbInfo != nil && os.SameFile(info, s.dbInfo) &&
+		info.Size() == s.dbInfo.Size() && info.ModTime().Equal(s.dbInfo.ModTime()) {
+		return s.dbRead, nil
+	}
+
+	db, err := database.Load(s.dbPath)
+	if err != nil {
+		return nil, err
+	}
+	if statErr == nil {
+		s.dbInfo, s.dbRead = info, db
+	}
+	return db, nil
+}
+
 // logToolCall logs response size metrics to stderr for observability.
 // Token estimate uses the 4-bytes-per-token heuristic for JSON-dense content.
 func (s *Server) logToolCall(tool string, bytes int, isError bool) {
@@ -7,9 +7,11 @@ import (
 	"fmt"
 	"log"
 	"net/http"
+	"net/http/httptest"
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"testing"
 	"time"
 
@@ -22,6 +24,7 @@ import (
 // REQ-GO-039: Go CLI shall implement MCP server for AI agent integration.
 func TestMCPServer(t *testing.T) {
 	rtmx.Req(t, "REQ-GO-039")
+	t.Parallel()
 
 	// Create temp project with a small RTM database
 	tmpDir := t.TempDir()
@@ -41,35 +44,11 @@ func TestMCPServer(t *testing.T) {
 		t.Fatalf("failed to load config: %v", err)
 	}
 
-	// Start server on random port
-	srv := NewServer(dbPath, cfg, WithHost("127.0.0.1"), WithPort(0))
-
-	// Use port 0 so the OS picks an available port
-	go func() {
-		if err := srv.Start(); err != nil && err != http.ErrServerClosed {
-			// Server start failed unexpectedly; log for debugging.
-			_ = err
-		}
-	}()
-
-	// Wait for server to be ready
-	deadline := time.Now().Add(2 * time.Second)
-	for srv.Addr() == "" && time.Now().Before(deadline) {
-		time.Sleep(10 * time.Millisecond)
-	}
-	if srv.Addr() == "" {
-		t.Fatal("server did not start in time")
-	}
-	defer func() {
-		ctx, cancel := context.WithTimeout(context.Background(), 1*time.Second)
-		defer cancel()
-		_ = srv.Shutdown(ctx)
-	}()
-
-	baseURL := fmt.Sprintf("http://%s/mcp", srv.Addr())
+	// Serve requests in-process; TestMCPServerPort0 covers the real listener.
+	handler := NewServer(dbPath, cfg).Handler()
 
 	t.Run("initialize", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "initialize", nil)
+		resp := rpcCall(t, handler, "initialize", nil)
 		result, ok := resp["result"].(map[string]interface{})
 		if !ok {
 			t.Fatalf("expected result object, got %T", resp["result"])
@@ -84,7 +63,7 @@ func TestMCPServer(t *testing.T) {
 	})
 
 	t.Run("tools_list", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/list", nil)
+		resp := rpcCall(t, handler, "tools/list", nil)
 		result, ok := resp["result"].(map[string]interface{})
 		if !ok {
 			t.Fatalf("expected result object, got %T", resp["result"])
@@ -112,7 +91,7 @@ func TestMCPServer(t *testing.T) {
 	})
 
 	t.Run("tool_status", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name": "status",
 		})
 		text := extractToolText(t, resp)
@@ -133,7 +112,7 @@ func TestMCPServer(t *testing.T) {
 	})
 
 	t.Run("tool_backlog", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name": "backlog",
 		})
 		text := extractToolText(t, resp)
@@ -148,7 +127,7 @@ func TestMCPServer(t *testing.T) {
 	})
 
 	t.Run("tool_health", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name": "health",
 		})
 		text := extractToolText(t, resp)
@@ -168,7 +147,7 @@ func TestMCPServer(t *testing.T) {
 	})
 
 	t.Run("tool_deps_overview", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name": "deps",
 		})
 		text := extractToolText(t, resp)
@@ -183,7 +162,7 @@ func TestMCPServer(t *testing.T) {
 	})
 
 	t.Run("tool_deps_specific", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name":      "deps",
 			"arguments": map[string]interface{}{"req_id": "REQ-TEST-001"},
 		})
@@ -199,7 +178,7 @@ func TestMCPServer(t *testing.T) {
 	})
 
 	t.Run("tool_deps_not_found", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name":      "deps",
 			"arguments": map[string]interface{}{"req_id": "REQ-NONEXISTENT"},
 		})
@@ -216,7 +195,7 @@ func TestMCPServer(t *testing.T) {
 	})
 
 	t.Run("tool_verify", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name": "verify",
 		})
 		text := extractToolText(t, resp)
@@ -231,7 +210,7 @@ func TestMCPServer(t *testing.T) {
 	})
 
 	t.Run("tool_markers", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name": "markers",
 		})
 		text := extractToolText(t, resp)
@@ -249,7 +228,7 @@ func TestMCPServer(t *testing.T) {
 	})
 
 	t.Run("unknown_tool", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name": "nonexistent",
 		})
 		errObj, ok := resp["error"].(map[string]interface{})
@@ -263,7 +242,7 @@ func TestMCPServer(t *testing.T) {
 	})
 
 	t.Run("unknown_method", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "unknown/method", nil)
+		resp := rpcCall(t, handler, "unknown/method", nil)
 		errObj, ok := resp["error"].(map[string]interface{})
 		if !ok {
 			t.Fatal("expected RPC error for unknown method")
@@ -275,13 +254,10 @@ func TestMCPServer(t *testing.T) {
 	})
 
 	t.Run("method_not_allowed", func(t *testing.T) {
-		resp, err := http.Get(baseURL)
-		if err != nil {
-			t.Fatalf("GET request failed: %v", err)
-		}
-		defer func() { _ = resp.Body.Close() }()
-		if resp.StatusCode != http.StatusMethodNotAllowed {
-			t.Errorf("expected 405, got %d", resp.StatusCode)
+		rec := httptest.NewRecorder()
+		handler.ServeHTTP(rec, httptest.NewRequest(http.MethodGet, "/mcp", nil))
+		if rec.Code != http.StatusMethodNotAllowed {
+			t.Errorf("expected 405, got %d", rec.Code)
 		}
 	})
 }
@@ -289,6 +265,7 @@ func TestMCPServer(t *testing.T) {
 // TestMCPServerPort0 verifies that port 0 works (OS-assigned port).
 func TestMCPServerPort0(t *testing.T) {
 	rtmx.Req(t, "REQ-GO-039")
+	t.Parallel()
 
 	tmpDir := t.TempDir()
 	rtmxDir := filepath.Join(tmpDir, ".rtmx")
@@ -304,24 +281,21 @@ func TestMCPServerPort0(t *testing.T) {
 
 	srv := NewServer(dbPath, cfg, WithHost("127.0.0.1"), WithPort(0))
 
-	go func() { _ = srv.Start() }()
-
-	deadline := time.Now().Add(2 * time.Second)
-	for srv.Addr() == "" && time.Now().Before(deadline) {
-		time.Sleep(10 * time.Millisecond)
-	}
-	if srv.Addr() == "" {
-		t.Fatal("server did not start")
-	}
-	defer func() {
-		ctx, cancel := context.WithTimeout(context.Background(), 1*time.Second)
-		defer cancel()
-		_ = srv.Shutdown(ctx)
-	}()
+	startTestServer(t, srv)
 
 	// Verify it answers
 	baseURL := fmt.Sprintf("http://%s/mcp", srv.Addr())
-	resp := rpcCall(t, baseURL, "initialize", nil)
+	body := `{"jsonrpc":"2.0","id":1,"method":"initialize"}`
+	httpResp, err := http.Post(baseURL, "application/json", strings.NewReader(body))
+	if err != nil {
+		t.Fatalf("POST %s failed: %v", baseURL, err)
+	}
+	defer func() { _ = httpResp.Body.Close() }()
+
+	var resp map[string]interface{}
+	if err := json.NewDecoder(httpResp.Body).Decode(&resp); err != nil {
+		t.Fatalf("failed to decode response: %v", err)
+	}
 	if resp["result"] == nil {
 		t.Error("expected initialize result")
 	}
@@ -329,9 +303,57 @@ func TestMCPServerPort0(t *testing.T) {
 
 // ----- helpers -----
 
+// startTestServer starts srv in the background and blocks until its listener
+// is bound, failing the test if Start returns first or takes too long. The
+// server is shut down when the test finishes.
+func startTestServer(t *testing.T, srv *Server) {
+	t.Helper()
+	errCh := make(chan error, 1)
+	go func() { errCh <- srv.Start() }()
+
+	select {
+	case <-srv.Ready():
+	case err := <-errCh:
+		t.Fatalf("server failed to start: %v", err)
+	case <-time.After(2 * time.Second):
+		t.Fatal("server did not start in time")
+	}
+	t.Cleanup(func() {
+		ctx, cancel := context.WithTimeout(context.Background(), 1*time.Second)
+		defer cancel()
+		_ = srv.Shutdown(ctx)
+	})
+}
+
+var (
+	testDBCSVOnce sync.Once
+	testDBCSV     []byte
+	testDBCSVErr  error
+)
+
+// writeTestDB writes the three-requirement fixture database to path.
+// The CSV is encoded once per test binary and the same bytes are reused.
 func writeTestDB(t *testing.T, path string) {
 	t.Helper()
 
+	data, err := testDBBytes()
+	if err != nil {
+		t.Fatalf("failed to encode test database: %v", err)
+	}
+	if err := os.WriteFile(path, data, 0o644); err != nil {
+		t.Fatalf("failed to save test database: %v", err)
+	}
+}
+
+// testDBBytes returns the encoded fixture database, encoding it on first use.
+func testDBBytes() ([]byte, error) {
+	testDBCSVOnce.Do(func() {
+		testDBCSV, testDBCSVErr = encodeTestDB()
+	})
+	return testDBCSV, testDBCSVErr
+}
+
+func encodeTestDB() ([]byte, error) {
 	db := database.NewDatabase()
 
 	r1 := &database.Requirement{
@@ -363,29 +385,88 @@ func writeTestDB(t *testing.T, path string) {
 
 	for _, r := range []*database.Requirement{r1, r2, r3} {
 		if err := db.Add(r); err != nil {
-			t.Fatalf("failed to add requirement: %v", err)
+			return nil, fmt.Errorf("failed to add requirement: %w", err)
 		}
 	}
 
-	if err := db.Save(path); err != nil {
-		t.Fatalf("failed to save test database: %v", err)
+	var buf bytes.Buffer
+	if err := db.WriteCSV(&buf); err != nil {
+		return nil, err
 	}
+	return buf.Bytes(), nil
 }
 
-func writeTestConfig(t *testing.T, path string) {
-	t.Helper()
-	content := `rtmx:
+const testConfigYAML = `rtmx:
   database: .rtmx/database.csv
   phases:
     1: "Foundation"
     2: "Extensions"
 `
-	if err := os.WriteFile(path, []byte(content), 0o644); err != nil {
+
+func writeTestConfig(t *testing.T, path string) {
+	t.Helper()
+	if err := os.WriteFile(path, []byte(testConfigYAML), 0o644); err != nil {
 		t.Fatalf("failed to write config: %v", err)
 	}
 }
 
-func rpcCall(t *testing.T, url, method string, params interface{}) map[string]interface{} {
+// Tests that only run read-only tools share one fixture project. It is
+// written on first use and removed by TestMain after all tests finish.
+var (
+	readOnlyProjectOnce sync.Once
+	readOnlyProjectDir  string
+	readOnlyProjectErr  error
+)
+
+func TestMain(m *testing.M) {
+	code := m.Run()
+	if readOnlyProjectDir != "" {
+		_ = os.RemoveAll(readOnlyProjectDir)
+	}
+	os.Exit(code)
+}
+
+// readOnlyProject returns the database path and config of the shared fixture
+// project. Callers must not run tools that modify the database or claims.
+func readOnlyProject(t *testing.T) (string, *config.Config) {
+	t.Helper()
+	readOnlyProjectOnce.Do(func() {
+		readOnlyProjectErr = createReadOnlyProject()
+	})
+	if readOnlyProjectErr != nil {
+		t.Fatalf("failed to create shared test project: %v", readOnlyProjectErr)
+	}
+
+	cfg, err := config.LoadFromDir(readOnlyProjectDir)
+	if err != nil {
+		t.Fatalf("failed to load config: %v", err)
+	}
+	return filepath.Join(readOnlyProjectDir, ".rtmx", "database.csv"), cfg
+}
+
+func createReadOnlyProject() error {
+	dir, err := os.MkdirTemp("", "rtmx-mcp-test")
+	if err != nil {
+		return err
+	}
+	readOnlyProjectDir = dir
+
+	rtmxDir := filepath.Join(dir, ".rtmx")
+	if err := os.MkdirAll(rtmxDir, 0o755); err != nil {
+		return err
+	}
+	data, err := testDBBytes()
+	if err != nil {
+		return err
+	}
+	if err := os.WriteFile(filepath.Join(rtmxDir, "database.csv"), data, 0o644); err != nil {
+		return err
+	}
+	return os.WriteFile(filepath.Join(dir, "rtmx.yaml"), []byte(testConfigYAML), 0o644)
+}
+
+// rpcCall sends a JSON-RPC request to h in-process and decodes the response.
+func rpcCall(t *testing.T, h http.Handler, method string, params interface{}) map[string]interface{} {
 	t.Helper()
 
 	body := map[string]interface{}{
@@ -402,14 +483,11 @@ func rpcCall(t *testing.T, url, method string, params interface{}) map[string]in
 		t.Fatalf("failed to marshal request: %v", err)
 	}
 
-	resp, err := http.Post(url, "application/json", bytes.NewReader(data))
-	if err != nil {
-		t.Fatalf("POST %s failed: %v", url, err)
-	}
-	defer func() { _ = resp.Body.Close() }()
+	rec := httptest.NewRecorder()
+	h.ServeHTTP(rec, httptest.NewRequest(http.MethodPost, "/mcp", bytes.NewReader(data)))
 
 	var result map[string]interface{}
-	if err := json.NewDecoder(resp.Body).Decode(&result); err != nil {
+	if err := json.NewDecoder(rec.Body).Decode(&result); err != nil {
 		t.Fatalf("failed to decode response: %v", err)
 	}
 	return result
@@ -445,19 +523,9 @@ func extractToolText(t *testing.T, resp map[string]interface{}) string {
 // REQ-MCP-006: MCP server shall support stdio transport for Claude Code and Cursor.
 func TestMCPStdio(t *testing.T) {
 	rtmx.Req(t, "REQ-MCP-006")
+	t.Parallel()
 
-	tmpDir := t.TempDir()
-	rtmxDir := filepath.Join(tmpDir, ".rtmx")
-	_ = os.MkdirAll(rtmxDir, 0o755)
-
-	dbPath := filepath.Join(rtmxDir, "database.csv")
-	writeTestDB(t, dbPath)
-	writeTestConfig(t, filepath.Join(tmpDir, "rtmx.yaml"))
-
-	cfg, err := config.LoadFromDir(tmpDir)
-	if err != nil {
-		t.Fatalf("failed to load config: %v", err)
-	}
+	dbPath, cfg := readOnlyProject(t)
 
 	srv := NewServer(dbPath, cfg)
 
@@ -587,19 +655,9 @@ func TestMCPStdio(t *testing.T) {
 // REQ-MCP-007: Response size logging for token consumption observability.
 func TestMCPResponseSizeLogging(t *testing.T) {
 	rtmx.Req(t, "REQ-MCP-007")
+	t.Parallel()
 
-	tmpDir := t.TempDir()
-	rtmxDir := filepath.Join(tmpDir, ".rtmx")
-	_ = os.MkdirAll(rtmxDir, 0o755)
-
-	dbPath := filepath.Join(rtmxDir, "database.csv")
-	writeTestDB(t, dbPath)
-	writeTestConfig(t, filepath.Join(tmpDir, "rtmx.yaml"))
-
-	cfg, err := config.LoadFromDir(tmpDir)
-	if err != nil {
-		t.Fatalf("failed to load config: %v", err)
-	}
+	dbPath, cfg := readOnlyProject(t)
 
 	t.Run("logs_bytes_and_tokens", func(t *testing.T) {
 		var logBuf bytes.Buffer
@@ -704,29 +762,9 @@ func TestMCPResponseSizeLogging(t *testing.T) {
 	t.Run("http_transport_logs", func(t *testing.T) {
 		var logBuf bytes.Buffer
 		logger := log.New(&logBuf, "", 0)
-		srv := NewServer(dbPath, cfg, WithHost("127.0.0.1"), WithPort(0), WithLogger(logger))
-
-		go func() {
-			if err := srv.Start(); err != nil && err != http.ErrServerClosed {
-				_ = err
-			}
-		}()
-
-		deadline := time.Now().Add(2 * time.Second)
-		for srv.Addr() == "" && time.Now().Before(deadline) {
-			time.Sleep(10 * time.Millisecond)
-		}
-		if srv.Addr() == "" {
-			t.Fatal("server did not start")
-		}
-		defer func() {
-			ctx, cancel := context.WithTimeout(context.Background(), 1*time.Second)
-			defer cancel()
-			_ = srv.Shutdown(ctx)
-		}()
+		handler := NewServer(dbPath, cfg, WithLogger(logger)).Handler()
 
-		baseURL := fmt.Sprintf("http://%s/mcp", srv.Addr())
-		rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name": "health",
 		})
 
@@ -775,19 +813,9 @@ func TestMCPResponseSizeLogging(t *testing.T) {
 // REQ-MCP-008: MCP tools shall accept filters to reduce response size.
 func TestMCPToolFiltering(t *testing.T) {
 	rtmx.Req(t, "REQ-MCP-008")
+	t.Parallel()
 
-	tmpDir := t.TempDir()
-	rtmxDir := filepath.Join(tmpDir, ".rtmx")
-	_ = os.MkdirAll(rtmxDir, 0o755)
-
-	dbPath := filepath.Join(rtmxDir, "database.csv")
-	writeTestDB(t, dbPath) // 3 reqs: CORE(2), EXT(1)
-	writeTestConfig(t, filepath.Join(tmpDir, "rtmx.yaml"))
-
-	cfg, err := config.LoadFromDir(tmpDir)
-	if err != nil {
-		t.Fatalf("failed to load config: %v", err)
-	}
+	dbPath, cfg := readOnlyProject(t) // 3 reqs: CORE(2), EXT(1)
 
 	srv := NewServer(dbPath, cfg, WithQuiet(true))
 
@@ -926,19 +954,9 @@ func TestMCPToolFiltering(t *testing.T) {
 // REQ-MCP-009: Token budget awareness in tool descriptions.
 func TestMCPToolDescriptions(t *testing.T) {
 	rtmx.Req(t, "REQ-MCP-009")
+	t.Parallel()
 
-	tmpDir := t.TempDir()
-	rtmxDir := filepath.Join(tmpDir, ".rtmx")
-	_ = os.MkdirAll(rtmxDir, 0o755)
-
-	dbPath := filepath.Join(rtmxDir, "database.csv")
-	writeTestDB(t, dbPath) // 3 reqs: CORE(2), EXT(1)
-	writeTestConfig(t, filepath.Join(tmpDir, "rtmx.yaml"))
-
-	cfg, err := config.LoadFromDir(tmpDir)
-	if err != nil {
-		t.Fatalf("failed to load config: %v", err)
-	}
+	dbPath, cfg := readOnlyProject(t) // 3 reqs: CORE(2), EXT(1)
 
 	srv := NewServer(dbPath, cfg, WithQuiet(true))
 
@@ -1011,6 +1029,7 @@ func TestMCPToolDescriptions(t *testing.T) {
 // REQ-MCP-003: Production-grade read-only tools for RTM operations.
 func TestMCPReadTools(t *testing.T) {
 	rtmx.Req(t, "REQ-MCP-003")
+	t.Parallel()
 
 	tmpDir := t.TempDir()
 	rtmxDir := filepath.Join(tmpDir, ".rtmx")
@@ -1025,27 +1044,7 @@ func TestMCPReadTools(t *testing.T) {
 		t.Fatalf("failed to load config: %v", err)
 	}
 
-	srv := NewServer(dbPath, cfg, WithHost("127.0.0.1"), WithPort(0))
-	go func() {
-		if err := srv.Start(); err != nil && err != http.ErrServerClosed {
-			_ = err
-		}
-	}()
-
-	deadline := time.Now().Add(2 * time.Second)
-	for srv.Addr() == "" && time.Now().Before(deadline) {
-		time.Sleep(10 * time.Millisecond)
-	}
-	if srv.Addr() == "" {
-		t.Fatal("server did not start")
-	}
-	defer func() {
-		ctx, cancel := context.WithTimeout(context.Background(), 1*time.Second)
-		defer cancel()
-		_ = srv.Shutdown(ctx)
-	}()
-
-	baseURL := fmt.Sprintf("http://%s/mcp", srv.Addr())
+	handler := NewServer(dbPath, cfg).Handler()
 
 	// All 7 tools must return valid JSON via tools/call
 	allTools := []string{"status", "backlog", "health", "deps", "verify", "markers", "next"}
@@ -1053,7 +1052,7 @@ func TestMCPReadTools(t *testing.T) {
 	t.Run("all_tools_return_valid_json", func(t *testing.T) {
 		for _, tool := range allTools {
 			t.Run(tool, func(t *testing.T) {
-				resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+				resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 					"name": tool,
 				})
 				text := extractToolText(t, resp)
@@ -1066,7 +1065,7 @@ func TestMCPReadTools(t *testing.T) {
 	})
 
 	t.Run("next_tool_returns_webs", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name": "next",
 		})
 		text := extractToolText(t, resp)
@@ -1090,14 +1089,10 @@ func TestMCPReadTools(t *testing.T) {
 			tool := allTools[i%len(allTools)]
 			go func(toolName string) {
 				body := fmt.Sprintf(`{"jsonrpc":"2.0","id":1,"method":"tools/call","params":{"name":"%s"}}`, toolName)
-				resp, err := http.Post(baseURL, "application/json", bytes.NewBufferString(body))
-				if err != nil {
-					errs <- fmt.Errorf("%s: request failed: %w", toolName, err)
-					return
-				}
-				defer func() { _ = resp.Body.Close() }()
-				if resp.StatusCode != http.StatusOK {
-					errs <- fmt.Errorf("%s: status %d", toolName, resp.StatusCode)
+				rec := httptest.NewRecorder()
+				handler.ServeHTTP(rec, httptest.NewRequest(http.MethodPost, "/mcp", bytes.NewBufferString(body)))
+				if rec.Code != http.StatusOK {
+					errs <- fmt.Errorf("%s: status %d", toolName, rec.Code)
 					return
 				}
 				errs <- nil
@@ -1110,6 +1105,54 @@ func TestMCPReadTools(t *testing.T) {
 			}
 		}
 	})
+
+	t.Run("reloads_after_database_change", func(t *testing.T) {
+		path := filepath.Join(t.TempDir(), "database.csv")
+		writeTestDB(t, path)
+		h := NewServer(path, cfg).Handler()
+
+		statusTotal := func() int {
+			t.Helper()
+			resp := rpcCall(t, h, "tools/call", map[string]interface{}{"name": "status"})
+			var sr statusResult
+			if err := json.Unmarshal([]byte(extractToolText(t, resp)), &sr); err != nil {
+				t.Fatalf("failed to parse status result: %v", err)
+			}
+			return sr.Total
+		}
+
+		if got := statusTotal(); got != 3 {
+			t.Fatalf("total = %d, want 3", got)
+		}
+
+		db, err := database.Load(path)
+		if err != nil {
+			t.Fatalf("failed to load database: %v", err)
+		}
+		if err := db.Add(&database.Requirement{
+			ReqID:           "REQ-TEST-004",
+			Category:        "EXT",
+			RequirementText: "Fourth requirement",
+			Status:          database.StatusMissing,
+		}); err != nil {
+			t.Fatalf("failed to add requirement: %v", err)
+		}
+		if err := db.Save(path); err != nil {
+			t.Fatalf("failed to save database: %v", err)
+		}
+
+		if got := statusTotal(); got != 4 {
+			t.Errorf("total after rewrite = %d, want 4", got)
+		}
+	})
+
+	t.Run("only_read_only_tools_share_cache", func(t *testing.T) {
+		for _, tool := range []string{"verify", "claim", "release", "release_assign", "set_status", "future_tool"} {
+			if readOnlyTools[tool] {
+				t.Errorf("tool %s must receive a fresh database, not the shared cache", tool)
+			}
+		}
+	})
 }
 
 // TestMCPVerifyExecutesTests validates that the MCP verify tool runs tests
@@ -16,6 +16,7 @@ import (
 // REQ-MCP-011: MCP set_status tool (status writeback, not COMPLETE).
 func TestMCPSetStatus(t *testing.T) {
 	rtmx.Req(t, "REQ-MCP-011")
+	t.Parallel()
 
 	tmpDir := t.TempDir()
 	dbPath := filepath.Join(tmpDir, ".rtmx", "database.csv")
@@ -1,14 +1,10 @@
 package mcp
 
 import (
-	"context"
 	"encoding/json"
-	"fmt"
-	"net/http"
 	"os"
 	"path/filepath"
 	"testing"
-	"time"
 
 	"github.com/rtmx-ai/rtmx/internal/config"
 	"github.com/rtmx-ai/rtmx/internal/orchestration"
@@ -20,6 +16,7 @@ import (
 // REQ-MCP-005: MCP mutation tools behind authorization model.
 func TestMCPMutationTools(t *testing.T) {
 	rtmx.Req(t, "REQ-MCP-005")
+	t.Parallel()
 
 	tmpDir := t.TempDir()
 	rtmxDir := filepath.Join(tmpDir, ".rtmx")
@@ -34,31 +31,12 @@ func TestMCPMutationTools(t *testing.T) {
 		t.Fatalf("failed to load config: %v", err)
 	}
 
-	srv := NewServer(dbPath, cfg, WithHost("127.0.0.1"), WithPort(0))
-	go func() {
-		if err := srv.Start(); err != nil && err != http.ErrServerClosed {
-			_ = err
-		}
-	}()
-
-	deadline := time.Now().Add(2 * time.Second)
-	for srv.Addr() == "" && time.Now().Before(deadline) {
-		time.Sleep(10 * time.Millisecond)
-	}
-	if srv.Addr() == "" {
-		t.Fatal("server did not start")
-	}
-	defer func() {
-		ctx, cancel := context.WithTimeout(context.Background(), 1*time.Second)
-		defer cancel()
-		_ = srv.Shutdown(ctx)
-	}()
-
-	baseURL := fmt.Sprintf("http://%s/mcp", srv.Addr())
+	srv := NewServer(dbPath, cfg)
+	handler := srv.Handler()
 
 	t.Run("claim_and_release", func(t *testing.T) {
 		// Claim
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name":      "claim",
 			"arguments": map[string]interface{}{"req_id": "REQ-TEST-002", "agent_id": "claude-1"},
 		})
@@ -76,7 +54,7 @@ func TestMCPMutationTools(t *testing.T) {
 		}
 
 		// Release
-		resp = rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp = rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name":      "release",
 			"arguments": map[string]interface{}{"req_id": "REQ-TEST-002", "agent_id": "claude-1"},
 		})
@@ -88,13 +66,13 @@ func TestMCPMutationTools(t *testing.T) {
 
 	t.Run("claim_double_fails", func(t *testing.T) {
 		// Claim first
-		rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name":      "claim",
 			"arguments": map[string]interface{}{"req_id": "REQ-TEST-003", "agent_id": "claude-1"},
 		})
 
 		// Double claim should return error result
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name":      "claim",
 			"arguments": map[string]interface{}{"req_id": "REQ-TEST-003", "agent_id": "claude-2"},
 		})
@@ -112,12 +90,12 @@ func TestMCPMutationTools(t *testing.T) {
 	})
 
 	t.Run("release_wrong_owner_fails", func(t *testing.T) {
-		rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name":      "claim",
 			"arguments": map[string]interface{}{"req_id": "REQ-TEST-001", "agent_id": "claude-1"},
 		})
 
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name":      "release",
 			"arguments": map[string]interface{}{"req_id": "REQ-TEST-001", "agent_id": "claude-2"},
 		})
@@ -135,7 +113,7 @@ func TestMCPMutationTools(t *testing.T) {
 	})
 
 	t.Run("claim_missing_agent_id_fails", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name":      "claim",
 			"arguments": map[string]interface{}{"req_id": "REQ-TEST-001"},
 		})
@@ -150,7 +128,7 @@ func TestMCPMutationTools(t *testing.T) {
 	})
 
 	t.Run("release_assign_sets_version", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name": "release_assign",
 			"arguments": map[string]interface{}{
 				"version":  "v0.5.0",
@@ -175,7 +153,7 @@ func TestMCPMutationTools(t *testing.T) {
 	})
 
 	t.Run("release_assign_unknown_req", func(t *testing.T) {
-		resp := rpcCall(t, baseURL, "tools/call", map[string]interface{}{
+		resp := rpcCall(t, handler, "tools/call", map[string]interface{}{
 			"name": "release_assign",
 			"arguments": map[string]interface{}{
 				"version":  "v0.5.0",
@@ -19,6 +19,7 @@ type WebhookAdapter struct {
 	config *config.WebhookAdapterConfig
 	client HTTPClient
 	getEnv func(string) string
+	sleep  func(time.Duration)
 	secret string
 	url    string
 }
@@ -44,6 +45,7 @@ func NewWebhookAdapter(cfg *config.WebhookAdapterConfig, opts ...AdapterOption)
 		config: cfg,
 		client: options.httpClient,
 		getEnv: options.getEnv,
+		sleep:  options.sleep,
 		secret: secret,
 		url:    cfg.URL,
 	}, nil
@@ -97,7 +99,7 @@ func (w *WebhookAdapter) Send(event string, payload interface{}) error {
 		if attempt > 0 {
 			// Exponential backoff: 100ms, 200ms, 400ms, ...
 			backoff := time.Duration(1<<uint(attempt-1)) * 100 * time.Millisecond
-			time.Sleep(backoff)
+			w.sleep(backoff)
 		}
 
 		lastErr = w.doSend(body)
@@ -10,6 +10,7 @@ import (
 	"net/http/httptest"
 	"sync/atomic"
 	"testing"
+	"time"
 
 	"github.com/rtmx-ai/rtmx/internal/config"
 	"github.com/rtmx-ai/rtmx/pkg/rtmx"
@@ -201,7 +202,8 @@ func TestWebhookAdapter(t *testing.T) {
 			Events:     nil,
 			MaxRetries: 3,
 		}
-		adapter, err := NewWebhookAdapter(cfg)
+		var waits []time.Duration
+		adapter, err := NewWebhookAdapter(cfg, WithSleep(func(d time.Duration) { waits = append(waits, d) }))
 		if err != nil {
 			t.Fatalf("NewWebhookAdapter: %v", err)
 		}
@@ -213,6 +215,10 @@ func TestWebhookAdapter(t *testing.T) {
 		if atomic.LoadInt32(&attempts) != 3 {
 			t.Errorf("attempts = %d, want 3", atomic.LoadInt32(&attempts))
 		}
+		wantWaits := []time.Duration{100 * time.Millisecond, 200 * time.Millisecond}
+		if len(waits) != len(wantWaits) || waits[0] != wantWaits[0] || waits[1] != wantWaits[1] {
+			t.Errorf("backoff waits = %v, want %v", waits, wantWaits)
+		}
 	})
 
 	t.Run("retry_exhausted_returns_error", func(t *testing.T) {
@@ -226,7 +232,7 @@ func TestWebhookAdapter(t *testing.T) {
 			URL:        server.URL,
 			MaxRetries: 1,
 		}
-		adapter, _ := NewWebhookAdapter(cfg)
+		adapter, _ := NewWebhookAdapter(cfg, WithSleep(func(time.Duration) {}))
 
 		err := adapter.Send("test.event", "data")
 		if err == nil {
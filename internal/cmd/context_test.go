@@ -11,6 +11,14 @@ import (
 	"github.com/rtmx-ai/rtmx/pkg/rtmx"
 )
 
+// unitNominalMarkers are the marker options shared by the unit tests that
+// exercise nominal behaviour in simulation.
+var unitNominalMarkers = []rtmx.Option{
+	rtmx.Scope("unit"),
+	rtmx.Technique("nominal"),
+	rtmx.Env("simulation"),
+}
+
 // createTestProject creates a temp directory with a minimal RTMX project.
 func createTestProject(t *testing.T, csvRows [][]string) string {
 	t.Helper()
@@ -80,11 +88,7 @@ func makeRow(reqID, category, text, status, priority string, phase int, effort f
 }
 
 func TestContextCommandHelp(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-002", unitNominalMarkers...)
 
 	cmd := newTestRootCmd()
 	output, err := executeCommand(cmd, "context", "--help")
@@ -106,11 +110,7 @@ func TestContextCommandHelp(t *testing.T) {
 }
 
 func TestContextCommandDefaultFormat(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-002", unitNominalMarkers...)
 
 	rows := [][]string{
 		makeRow("REQ-A-001", "CORE", "First requirement", "COMPLETE", "HIGH", 1, 1.0, ""),
@@ -143,11 +143,7 @@ func TestContextCommandDefaultFormat(t *testing.T) {
 }
 
 func TestContextCommandClaudeFormat(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-002", unitNominalMarkers...)
 
 	rows := [][]string{
 		makeRow("REQ-A-001", "CORE", "First requirement", "COMPLETE", "HIGH", 1, 1.0, ""),
@@ -180,11 +176,7 @@ func TestContextCommandClaudeFormat(t *testing.T) {
 }
 
 func TestContextCommandPlainFormat(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-002", unitNominalMarkers...)
 
 	rows := [][]string{
 		makeRow("REQ-A-001", "CORE", "First requirement", "COMPLETE", "HIGH", 1, 1.0, ""),
@@ -209,11 +201,7 @@ func TestContextCommandPlainFormat(t *testing.T) {
 }
 
 func TestContextCommandTokenEfficiency(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-002", unitNominalMarkers...)
 
 	// Create a project with many requirements
 	var rows [][]string
@@ -252,11 +240,7 @@ func TestContextCommandTokenEfficiency(t *testing.T) {
 }
 
 func TestContextBlockersAndQuickWins(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-002", unitNominalMarkers...)
 
 	rows := [][]string{
 		// Incomplete requirement that blocks others
@@ -292,11 +276,7 @@ func TestContextBlockersAndQuickWins(t *testing.T) {
 }
 
 func TestContextEmptyDatabase(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-002", unitNominalMarkers...)
 
 	tmpDir := createTestProject(t, [][]string{})
 
@@ -317,11 +297,7 @@ func TestContextEmptyDatabase(t *testing.T) {
 }
 
 func TestContextInvalidFormat(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-002", unitNominalMarkers...)
 
 	rows := [][]string{
 		makeRow("REQ-C-001", "CORE", "Test req", "COMPLETE", "HIGH", 1, 1.0, ""),
@@ -430,6 +430,17 @@ func scanTestDirectory(dir string) ([]TestRequirement, error) {
 	return results, err
 }
 
+// commentMarkerPattern matches "// rtmx:req REQ-..." and "// @req REQ-..."
+// comment markers, which the Go and Rust scanners both accept.
+var commentMarkerPattern = regexp.MustCompile(`//\s*(?:rtmx:req|@req)\s+(REQ-[A-Za-z0-9-]+)`)
+
+// Patterns for Go markers and test function definitions. Scanners are called
+// once per test file, so the patterns are compiled once at package init.
+var (
+	goReqMarkerPattern = regexp.MustCompile(`rtmx\.Req\(t,\s*"(REQ-[^"]+)"`)
+	goTestFuncPattern  = regexp.MustCompile(`^func\s+(Test\w+)\s*\(`)
+)
+
 // extractGoMarkersFromFile extracts rtmx.Req() markers from Go test files.
 func extractGoMarkersFromFile(filePath string) ([]TestRequirement, error) {
 	data, err := os.ReadFile(filePath)
@@ -441,22 +452,18 @@ func extractGoMarkersFromFile(filePath string) ([]TestRequirement, error) {
 	lines := strings.Split(string(data), "\n")
 	currentFunc := ""
 
-	reqPattern := regexp.MustCompile(`rtmx\.Req\(t,\s*"(REQ-[^"]+)"`)
-	commentPattern := regexp.MustCompile(`//\s*(?:rtmx:req|@req)\s+(REQ-[A-Za-z0-9-]+)`)
-	funcPattern := regexp.MustCompile(`^func\s+(Test\w+)\s*\(`)
-
 	for i, line := range lines {
-		if m := funcPattern.FindStringSubmatch(line); len(m) > 1 {
+		if m := goTestFuncPattern.FindStringSubmatch(line); len(m) > 1 {
 			currentFunc = m[1]
 		}
-		if m := reqPattern.FindStringSubmatch(line); len(m) > 1 {
+		if m := goReqMarkerPattern.FindStringSubmatch(line); len(m) > 1 {
 			results = append(results, TestRequirement{
 				ReqID:        m[1],
 				TestFile:     filePath,
 				TestFunction: currentFunc,
 				LineNumber:   i + 1,
 			})
-		} else if m := commentPattern.FindStringSubmatch(line); len(m) > 1 {
+		} else if m := commentMarkerPattern.FindStringSubmatch(line); len(m) > 1 {
 			results = append(results, TestRequirement{
 				ReqID:        m[1],
 				TestFile:     filePath,
@@ -469,6 +476,16 @@ func extractGoMarkersFromFile(filePath string) ([]TestRequirement, error) {
 	return results, nil
 }
 
+// Regex patterns for pytest markers.
+var (
+	pyReqMarkerPattern   = regexp.MustCompile(`@pytest\.mark\.req\(['"](REQ-[A-Za-z0-9-]+)['"]\)`)
+	pyTestFuncPattern    = regexp.MustCompile(`^(?:async\s+)?def\s+(test_\w+)\s*\(`)
+	pyTestClassPattern   = regexp.MustCompile(`^class\s+(Test\w+)\s*[:(]`)
+	pyOtherMarkerPattern = regexp.MustCompile(`@pytest\.mark\.(scope_\w+|technique_\w+|env_\w+)`)
+	// For conftest.py, also match non-test functions (fixtures)
+	pyFixtureFuncPattern = regexp.MustCompile(`^(?:async\s+)?def\s+(\w+)\s*\(`)
+)
+
 // extractMarkersFromFile extracts requirement markers from a Python test file
 func extractMarkersFromFile(filePath string) ([]TestRequirement, error) {
 	file, err := os.Open(filePath)
@@ -481,15 +498,6 @@ func extractMarkersFromFile(filePath string) ([]TestRequirement, error) {
 
 	isConftest := filepath.Base(filePath) == "conftest.py"
 
-	// Regex patterns for pytest markers
-	reqMarkerPattern := regexp.MustCompile(`@pytest\.mark\.req\(['"](REQ-[A-Za-z0-9-]+)['"]\)`)
-	funcPattern := regexp.MustCompile(`^(?:async\s+)?def\s+(test_\w+)\s*\(`)
-	classPattern := regexp.MustCompile(`^class\s+(Test\w+)\s*[:(]`)
-	otherMarkerPattern := regexp.MustCompile(`@pytest\.mark\.(scope_\w+|technique_\w+|env_\w+)`)
-
-	// For conftest.py, also match non-test functions (fixtures)
-	fixtureFuncPattern := regexp.MustCompile(`^(?:async\s+)?def\s+(\w+)\s*\(`)
-
 	scanner := bufio.NewScanner(file)
 	lineNum := 0
 	var pendingReqIDs []string
@@ -502,13 +510,13 @@ func extractMarkersFromFile(filePath string) ([]TestRequirement, error) {
 		trimmed := strings.TrimSpace(line)
 
 		// Check for class definition
-		if match := classPattern.FindStringSubmatch(trimmed); match != nil {
+		if match := pyTestClassPattern.FindStringSubmatch(trimmed); match != nil {
 			currentClass = match[1]
 			continue
 		}
 
 		// Check for requirement marker
-		if matches := reqMarkerPattern.FindAllStringSubmatch(trimmed, -1); matches != nil {
+		if matches := pyReqMarkerPattern.FindAllStringSubmatch(trimmed, -1); matches != nil {
 			for _, m := range matches {
 				pendingReqIDs = append(pendingReqIDs, m[1])
 			}
@@ -516,7 +524,7 @@ func extractMarkersFromFile(filePath string) ([]TestRequirement, error) {
 		}
 
 		// Check for other RTM markers
-		if matches := otherMarkerPattern.FindAllStringSubmatch(trimmed, -1); matches != nil {
+		if matches := pyOtherMarkerPattern.FindAllStringSubmatch(trimmed, -1); matches != nil {
 			for _, m := range matches {
 				pendingMarkers = append(pendingMarkers, m[1])
 			}
@@ -526,14 +534,14 @@ func extractMarkersFromFile(filePath string) ([]TestRequirement, error) {
 		// Check for function definition - in conftest.py also match fixture functions
 		var funcMatch []string
 		if isConftest && len(pendingReqIDs) > 0 {
-			funcMatch = fixtureFuncPattern.FindStringSubmatch(trimmed)
+			funcMatch = pyFixtureFuncPattern.FindStringSubmatch(trimmed)
 		} else {
 			// For non-conftest files, try the test function pattern first
-			funcMatch = funcPattern.FindStringSubmatch(trimmed)
+			funcMatch = pyTestFuncPattern.FindStringSubmatch(trimmed)
 
 			// If a non-test function is found and there are pending markers, discard them
 			if funcMatch == nil && len(pendingReqIDs) > 0 {
-				if anyFunc := fixtureFuncPattern.FindStringSubmatch(trimmed); anyFunc != nil {
+				if anyFunc := pyFixtureFuncPattern.FindStringSubmatch(trimmed); anyFunc != nil {
 					pendingReqIDs = nil
 					pendingMarkers = nil
 					continue
@@ -567,6 +575,19 @@ func extractMarkersFromFile(filePath string) ([]TestRequirement, error) {
 	return results, scanner.Err()
 }
 
+// Patterns for config.addinivalue_line("markers", ...) registrations.
+var (
+	// Match patterns like:
+	//   config.addinivalue_line("markers", "req(id, scope=None): Link test to requirement")
+	//   config.addinivalue_line("markers", "scope_unit: Unit test scope")
+	// Also handles multiline calls where arguments span multiple lines.
+	conftestAddiniPattern = regexp.MustCompile(
+		`addinivalue_line\s*\(\s*["']markers["']\s*,\s*["'](\w+)(?:\(([^)]*)\))?\s*(?::\s*(.+?))?["']\s*\)`,
+	)
+	// Detect start of multiline addinivalue_line call (line contains the call but no closing paren for markers arg)
+	conftestAddiniStartPattern = regexp.MustCompile(`addinivalue_line\s*\(`)
+)
+
 // extractConftestRegistrations parses conftest.py for marker registration patterns
 // such as config.addinivalue_line("markers", "req(id, ...): ...").
 func extractConftestRegistrations(filePath string) ([]ConftestMarkerRegistration, error) {
@@ -578,16 +599,6 @@ func extractConftestRegistrations(filePath string) ([]ConftestMarkerRegistration
 
 	var results []ConftestMarkerRegistration
 
-	// Match patterns like:
-	//   config.addinivalue_line("markers", "req(id, scope=None): Link test to requirement")
-	//   config.addinivalue_line("markers", "scope_unit: Unit test scope")
-	// Also handles multiline calls where arguments span multiple lines.
-	addiniPattern := regexp.MustCompile(
-		`addinivalue_line\s*\(\s*["']markers["']\s*,\s*["'](\w+)(?:\(([^)]*)\))?\s*(?::\s*(.+?))?["']\s*\)`,
-	)
-	// Detect start of multiline addinivalue_line call (line contains the call but no closing paren for markers arg)
-	addiniStartPattern := regexp.MustCompile(`addinivalue_line\s*\(`)
-
 	scanner := bufio.NewScanner(file)
 	lineNum := 0
 	var accumulator string
@@ -602,7 +613,7 @@ func extractConftestRegistrations(filePath string) ([]ConftestMarkerRegistration
 		if accumulator != "" {
 			accumulator += " " + trimmed
 			// Try to match the accumulated lines
-			if matches := addiniPattern.FindAllStringSubmatch(accumulator, -1); matches != nil {
+			if matches := conftestAddiniPattern.FindAllStringSubmatch(accumulator, -1); matches != nil {
 				for _, m := range matches {
 					reg := ConftestMarkerRegistration{
 						FilePath:   filePath,
@@ -626,7 +637,7 @@ func extractConftestRegistrations(filePath string) ([]ConftestMarkerRegistration
 		}
 
 		// Check if this is a single-line match
-		if matches := addiniPattern.FindAllStringSubmatch(line, -1); matches != nil {
+		if matches := conftestAddiniPattern.FindAllStringSubmatch(line, -1); matches != nil {
 			for _, m := range matches {
 				reg := ConftestMarkerRegistration{
 					FilePath:   filePath,
@@ -645,7 +656,7 @@ func extractConftestRegistrations(filePath string) ([]ConftestMarkerRegistration
 		}
 
 		// Check for start of multiline call
-		if addiniStartPattern.MatchString(trimmed) {
+		if conftestAddiniStartPattern.MatchString(trimmed) {
 			accumulator = trimmed
 			accumulatorLine = lineNum
 		}
@@ -654,6 +665,16 @@ func extractConftestRegistrations(filePath string) ([]ConftestMarkerRegistration
 	return results, scanner.Err()
 }
 
+// Patterns for Rust marker styles, function definitions and mod blocks.
+var (
+	rustAttrMarkerPattern = regexp.MustCompile(`#\[req\("(REQ-[A-Za-z0-9-]+)"`)
+	rustCallMarkerPattern = regexp.MustCompile(`rtmx::req\("(REQ-[A-Za-z0-9-]+)"`)
+	// Pattern for Rust function definitions (fn, pub fn, async fn, pub async fn)
+	rustFuncPattern = regexp.MustCompile(`^\s*(?:pub\s+)?(?:async\s+)?fn\s+(\w+)\s*\(`)
+	// Pattern for mod blocks
+	rustModPattern = regexp.MustCompile(`^\s*(?:pub\s+)?mod\s+(\w+)\s*\{`)
+)
+
 // extractRustMarkersFromFile extracts requirement markers from Rust test files.
 // It recognizes four marker styles:
 //   - #[req("REQ-ID")] attribute macros
@@ -668,17 +689,6 @@ func extractRustMarkersFromFile(filePath string) ([]TestRequirement, error) {
 	var results []TestRequirement
 	lines := strings.Split(string(data), "\n")
 
-	// Patterns for marker styles
-	attrPattern := regexp.MustCompile(`#\[req\("(REQ-[A-Za-z0-9-]+)"`)
-	commentPattern := regexp.MustCompile(`//\s*(?:rtmx:req|@req)\s+(REQ-[A-Za-z0-9-]+)`)
-	callPattern := regexp.MustCompile(`rtmx::req\("(REQ-[A-Za-z0-9-]+)"`)
-
-	// Pattern for Rust function definitions (fn, pub fn, async fn, pub async fn)
-	funcPattern := regexp.MustCompile(`^\s*(?:pub\s+)?(?:async\s+)?fn\s+(\w+)\s*\(`)
-
-	// Pattern for mod blocks
-	modPattern := regexp.MustCompile(`^\s*(?:pub\s+)?mod\s+(\w+)\s*\{`)
-
 	var pendingReqIDs []struct {
 		reqID  string
 		lineNo int
@@ -689,12 +699,12 @@ func extractRustMarkersFromFile(filePath string) ([]TestRequirement, error) {
 		lineNum := i + 1
 
 		// Track mod blocks
-		if m := modPattern.FindStringSubmatch(line); len(m) > 1 {
+		if m := rustModPattern.FindStringSubmatch(line); len(m) > 1 {
 			currentMod = m[1]
 		}
 
 		// Check for attribute macro: #[req("REQ-ID")]
-		if matches := attrPattern.FindAllStringSubmatch(line, -1); matches != nil {
+		if matches := rustAttrMarkerPattern.FindAllStringSubmatch(line, -1); matches != nil {
 			for _, m := range matches {
 				pendingReqIDs = append(pendingReqIDs, struct {
 					reqID  string
@@ -705,7 +715,7 @@ func extractRustMarkersFromFile(filePath string) ([]TestRequirement, error) {
 		}
 
 		// Check for comment marker: // rtmx:req REQ-ID
-		if m := commentPattern.FindStringSubmatch(line); len(m) > 1 {
+		if m := commentMarkerPattern.FindStringSubmatch(line); len(m) > 1 {
 			pendingReqIDs = append(pendingReqIDs, struct {
 				reqID  string
 				lineNo int
@@ -714,7 +724,7 @@ func extractRustMarkersFromFile(filePath string) ([]TestRequirement, error) {
 		}
 
 		// Check for function definition
-		if funcMatch := funcPattern.FindStringSubmatch(line); funcMatch != nil {
+		if funcMatch := rustFuncPattern.FindStringSubmatch(line); funcMatch != nil {
 			funcName := funcMatch[1]
 			if currentMod != "" {
 				funcName = currentMod + "::" + funcName
@@ -725,10 +735,10 @@ func extractRustMarkersFromFile(filePath string) ([]TestRequirement, error) {
 			for j := i + 1; j < len(lines) && j < i+20; j++ {
 				bodyLine := lines[j]
 				// Stop at next function or closing brace at column 0
-				if funcPattern.MatchString(bodyLine) {
+				if rustFuncPattern.MatchString(bodyLine) {
 					break
 				}
-				if cm := callPattern.FindStringSubmatch(bodyLine); len(cm) > 1 {
+				if cm := rustCallMarkerPattern.FindStringSubmatch(bodyLine); len(cm) > 1 {
 					results = append(results, TestRequirement{
 						ReqID:        cm[1],
 						TestFile:     filePath,
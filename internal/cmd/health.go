@@ -177,13 +177,9 @@ func runHealthChecks(db *database.Database, cfg *config.Config) *HealthResult {
 	}
 
 	// Check 3: Reciprocity
-	for _, req := range db.All() {
-		for dep := range req.Dependencies {
-			if depReq := db.Get(dep); depReq != nil {
-				if !depReq.Blocks.Contains(req.ReqID) {
-					result.Stats.MissingRecip++
-				}
-			}
+	for _, v := range db.ReciprocityViolations() {
+		if v.Kind == database.MissingBlock {
+			result.Stats.MissingRecip++
 		}
 	}
 	if result.Stats.MissingRecip > 0 {
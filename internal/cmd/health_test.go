@@ -8,6 +8,7 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"testing"
 
 	"github.com/rtmx-ai/rtmx/internal/config"
@@ -16,34 +17,51 @@ import (
 	"github.com/spf13/cobra"
 )
 
-func TestHealthRealCommand(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-012")
+var (
+	realHealthOnce sync.Once
+	realHealthOut  string
+	realHealthErr  error
+)
 
+// realHealthOutput runs the health command against the project's own RTM
+// once per test binary and returns its text output. Tests that only inspect
+// the output share the single run instead of reloading the database.
+func realHealthOutput(t *testing.T) string {
+	t.Helper()
 	cwd, _ := os.Getwd()
 	projectRoot := findProjectRootDir(cwd)
 	if projectRoot == "" {
 		t.Skip("Could not find project root with .rtmx")
 	}
 
-	oldWd, _ := os.Getwd()
-	_ = os.Chdir(projectRoot)
-	defer func() { _ = os.Chdir(oldWd) }()
+	realHealthOnce.Do(func() {
+		oldWd, _ := os.Getwd()
+		_ = os.Chdir(projectRoot)
+		defer func() { _ = os.Chdir(oldWd) }()
 
-	rootCmd := createHealthTestCmd()
-	buf := new(bytes.Buffer)
-	rootCmd.SetOut(buf)
-	rootCmd.SetArgs([]string{"health"})
+		rootCmd := createHealthTestCmd()
+		buf := new(bytes.Buffer)
+		rootCmd.SetOut(buf)
+		rootCmd.SetArgs([]string{"health"})
 
-	err := rootCmd.Execute()
-	// Health may return ExitError for warnings - that's OK
-	if err != nil {
+		err := rootCmd.Execute()
+		// Health may return ExitError for warnings - that's OK
 		var exitErr *ExitError
-		if !errors.As(err, &exitErr) {
-			t.Fatalf("health command failed unexpectedly: %v", err)
+		if err != nil && !errors.As(err, &exitErr) {
+			realHealthErr = err
 		}
+		realHealthOut = buf.String()
+	})
+	if realHealthErr != nil {
+		t.Fatalf("health command failed unexpectedly: %v", realHealthErr)
 	}
+	return realHealthOut
+}
 
-	output := buf.String()
+func TestHealthRealCommand(t *testing.T) {
+	rtmx.Req(t, "REQ-GO-012")
+
+	output := realHealthOutput(t)
 	expectedPhrases := []string{
 		"Health Check",
 	}
@@ -97,31 +115,7 @@ func TestHealthJSONOutput(t *testing.T) {
 // TestHealthCheckByCheckFormat verifies that health shows individual check results
 // REQ-GO-051: Go CLI health shall show individual check results like Python
 func TestHealthCheckByCheckFormat(t *testing.T) {
-	cwd, _ := os.Getwd()
-	projectRoot := findProjectRootDir(cwd)
-	if projectRoot == "" {
-		t.Skip("Could not find project root with .rtmx")
-	}
-
-	oldWd, _ := os.Getwd()
-	_ = os.Chdir(projectRoot)
-	defer func() { _ = os.Chdir(oldWd) }()
-
-	rootCmd := createHealthTestCmd()
-	buf := new(bytes.Buffer)
-	rootCmd.SetOut(buf)
-	rootCmd.SetArgs([]string{"health"})
-
-	err := rootCmd.Execute()
-	// Health may return ExitError for warnings - that's OK
-	if err != nil {
-		var exitErr *ExitError
-		if !errors.As(err, &exitErr) {
-			t.Fatalf("health command failed unexpectedly: %v", err)
-		}
-	}
-
-	output := buf.String()
+	output := realHealthOutput(t)
 
 	// Verify Python-style check format: [PASS]/[WARN]/[FAIL] check_name: message
 	expectedElements := []string{
@@ -178,6 +172,52 @@ func setupHealthTestProject(t *testing.T, dbContent string) string {
 
 const healthDBHeader = "req_id,category,subcategory,requirement_text,target_value,test_module,test_function,validation_method,status,priority,phase,notes,effort_weeks,dependencies,blocks,assignee,sprint,started_date,completed_date,requirement_file,external_id\n"
 
+// healthCompleteOnMissingDB has a COMPLETE requirement depending on a MISSING one.
+const healthCompleteOnMissingDB = healthDBHeader +
+	"REQ-001,CAT,Sub,Base requirement,Pass,,,Unit Test,MISSING,HIGH,1,,,,,,,,,\n" +
+	"REQ-002,CAT,Sub,Dependent requirement,Pass,,,Unit Test,COMPLETE,HIGH,1,,,REQ-001,,,,,,,,\n"
+
+// healthJSONCache memoizes `health --json` output by database content, so
+// tests inspecting the same fixture share a single run of every check.
+var (
+	healthJSONMu    sync.Mutex
+	healthJSONCache = make(map[string][]byte)
+)
+
+// healthJSONFor returns the `health --json` output for a project whose
+// database holds dbContent.
+func healthJSONFor(t *testing.T, dbContent string) []byte {
+	t.Helper()
+	healthJSONMu.Lock()
+	defer healthJSONMu.Unlock()
+	if out, ok := healthJSONCache[dbContent]; ok {
+		return out
+	}
+
+	tmpDir := setupHealthTestProject(t, dbContent)
+
+	origDir, _ := os.Getwd()
+	_ = os.Chdir(tmpDir)
+	defer func() { _ = os.Chdir(origDir) }()
+
+	cmd := createHealthTestCmd()
+	buf := new(bytes.Buffer)
+	cmd.SetOut(buf)
+	cmd.SetArgs([]string{"health", "--json"})
+
+	err := cmd.Execute()
+	if err != nil {
+		var exitErr *ExitError
+		if !errors.As(err, &exitErr) {
+			t.Fatalf("health --json failed unexpectedly: %v", err)
+		}
+	}
+
+	out := bytes.TrimSpace(buf.Bytes())
+	healthJSONCache[dbContent] = out
+	return out
+}
+
 // TestHealthStatusConsistency verifies the status_consistency check detects
 // COMPLETE requirements depending on MISSING/PARTIAL/NOT_STARTED dependencies.
 func TestHealthStatusConsistency(t *testing.T) {
@@ -191,10 +231,8 @@ func TestHealthStatusConsistency(t *testing.T) {
 		wantCheckName  string
 	}{
 		{
-			name: "COMPLETE depends on MISSING warns",
-			dbContent: healthDBHeader +
-				"REQ-001,CAT,Sub,Base requirement,Pass,,,Unit Test,MISSING,HIGH,1,,,,,,,,,\n" +
-				"REQ-002,CAT,Sub,Dependent requirement,Pass,,,Unit Test,COMPLETE,HIGH,1,,,REQ-001,,,,,,,,\n",
+			name:           "COMPLETE depends on MISSING warns",
+			dbContent:      healthCompleteOnMissingDB,
 			wantWarn:       true,
 			wantIssueCount: 1,
 			wantCheckName:  "status_consistency",
@@ -266,28 +304,9 @@ func TestHealthStatusConsistency(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			tmpDir := setupHealthTestProject(t, tt.dbContent)
-
-			origDir, _ := os.Getwd()
-			_ = os.Chdir(tmpDir)
-			defer func() { _ = os.Chdir(origDir) }()
-
-			cmd := createHealthTestCmd()
-			buf := new(bytes.Buffer)
-			cmd.SetOut(buf)
-			cmd.SetArgs([]string{"health", "--json"})
-
-			err := cmd.Execute()
-			if err != nil {
-				var exitErr *ExitError
-				if !errors.As(err, &exitErr) {
-					t.Fatalf("health --json failed unexpectedly: %v", err)
-				}
-			}
-
-			out := buf.String()
+			out := healthJSONFor(t, tt.dbContent)
 			var result HealthResult
-			if err := json.Unmarshal([]byte(strings.TrimSpace(out)), &result); err != nil {
+			if err := json.Unmarshal(out, &result); err != nil {
 				t.Fatalf("failed to parse JSON: %v\nOutput: %s", err, out)
 			}
 
@@ -366,74 +385,49 @@ func TestHealthStatusConsistencyTextOutput(t *testing.T) {
 func TestHealthStatusConsistencyJSONDetails(t *testing.T) {
 	rtmx.Req(t, "REQ-GO-074")
 
-	dbContent := healthDBHeader +
-		"REQ-001,CAT,Sub,Base requirement,Pass,,,Unit Test,MISSING,HIGH,1,,,,,,,,,\n" +
-		"REQ-002,CAT,Sub,Dependent,Pass,,,Unit Test,COMPLETE,HIGH,1,,,REQ-001,,,,,,,,\n"
-
-	tmpDir := setupHealthTestProject(t, dbContent)
-
-	origDir, _ := os.Getwd()
-	_ = os.Chdir(tmpDir)
-	defer func() { _ = os.Chdir(origDir) }()
-
-	cmd := createHealthTestCmd()
-	buf := new(bytes.Buffer)
-	cmd.SetOut(buf)
-	cmd.SetArgs([]string{"health", "--json"})
-
-	err := cmd.Execute()
-	if err != nil {
-		var exitErr *ExitError
-		if !errors.As(err, &exitErr) {
-			t.Fatalf("health --json failed unexpectedly: %v", err)
-		}
-	}
-
-	// Parse as raw JSON to inspect details
-	var raw map[string]interface{}
-	if err := json.Unmarshal([]byte(strings.TrimSpace(buf.String())), &raw); err != nil {
+	var result HealthResult
+	if err := json.Unmarshal(healthJSONFor(t, healthCompleteOnMissingDB), &result); err != nil {
 		t.Fatalf("failed to parse JSON: %v", err)
 	}
 
-	checks, ok := raw["checks"].([]interface{})
-	if !ok {
-		t.Fatal("expected checks array in JSON output")
-	}
-
-	var consistencyCheck map[string]interface{}
-	for _, c := range checks {
-		check := c.(map[string]interface{})
-		if check["name"] == "status_consistency" {
-			consistencyCheck = check
+	var check *HealthCheck
+	for i := range result.Checks {
+		if result.Checks[i].Name == "status_consistency" {
+			check = &result.Checks[i]
 			break
 		}
 	}
-
-	if consistencyCheck == nil {
-		t.Fatal("status_consistency check not found in JSON output")
+	if check == nil || check.Details == nil {
+		t.Fatal("status_consistency check with details not found in JSON output")
 	}
 
-	details, ok := consistencyCheck["details"].([]interface{})
-	if !ok {
-		t.Fatal("expected details array in status_consistency check")
+	// Details is untyped in HealthCheck, so re-decode it into the concrete
+	// detail type; a details value of the wrong shape fails that decode.
+	rawDetails, err := json.Marshal(check.Details)
+	if err != nil {
+		t.Fatalf("failed to re-encode details: %v", err)
+	}
+	var details []StatusConsistencyDetail
+	if err := json.Unmarshal(rawDetails, &details); err != nil {
+		t.Fatalf("expected details array in status_consistency check: %v", err)
 	}
 
 	if len(details) != 1 {
 		t.Fatalf("expected 1 detail, got %d", len(details))
 	}
 
-	detail := details[0].(map[string]interface{})
-	if detail["req_id"] != "REQ-002" {
-		t.Errorf("expected req_id=REQ-002, got %v", detail["req_id"])
+	detail := details[0]
+	if detail.ReqID != "REQ-002" {
+		t.Errorf("expected req_id=REQ-002, got %v", detail.ReqID)
 	}
-	if detail["status"] != "COMPLETE" {
-		t.Errorf("expected status=COMPLETE, got %v", detail["status"])
+	if detail.Status != "COMPLETE" {
+		t.Errorf("expected status=COMPLETE, got %v", detail.Status)
 	}
-	if detail["dependency"] != "REQ-001" {
-		t.Errorf("expected dependency=REQ-001, got %v", detail["dependency"])
+	if detail.DepID != "REQ-001" {
+		t.Errorf("expected dependency=REQ-001, got %v", detail.DepID)
 	}
-	if detail["dep_status"] != "MISSING" {
-		t.Errorf("expected dep_status=MISSING, got %v", detail["dep_status"])
+	if detail.DepStatus != "MISSING" {
+		t.Errorf("expected dep_status=MISSING, got %v", detail.DepStatus)
 	}
 }
 
@@ -530,15 +524,13 @@ REQ-001,CLI,Foundation,Test,Pass,mod,TestA,Unit Test,COMPLETE,HIGH,1,,,,,,,,,
 
 		_ = cmd.Execute()
 
-		var result map[string]interface{}
+		var result HealthResult
 		if err := json.Unmarshal(buf.Bytes(), &result); err != nil {
 			t.Fatalf("invalid JSON: %v", err)
 		}
-		checks, _ := result["checks"].([]interface{})
 		foundSchema := false
-		for _, c := range checks {
-			cm, _ := c.(map[string]interface{})
-			if cm["name"] == "schema_conformance" {
+		for _, check := range result.Checks {
+			if check.Name == "schema_conformance" {
 				foundSchema = true
 			}
 		}
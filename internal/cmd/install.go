@@ -1,6 +1,7 @@
 package cmd
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"os"
@@ -680,7 +681,7 @@ func isRTMXHook(path string) bool {
 	if err != nil {
 		return false
 	}
-	return strings.Contains(string(content), rtmxHookMarker)
+	return bytes.Contains(content, []byte(rtmxHookMarker))
 }
 
 func runAgentInstall(cmd *cobra.Command) error {
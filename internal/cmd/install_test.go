@@ -253,11 +253,7 @@ func TestInstallHookTemplates(t *testing.T) {
 }
 
 func TestInstallClaudeCreatesHooksJSON(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-002", unitNominalMarkers...)
 
 	tmpDir := t.TempDir()
 
@@ -313,11 +309,7 @@ func TestInstallClaudeCreatesHooksJSON(t *testing.T) {
 }
 
 func TestInstallClaudeRemove(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-002", unitNominalMarkers...)
 
 	tmpDir := t.TempDir()
 
@@ -349,11 +341,7 @@ func TestInstallClaudeRemove(t *testing.T) {
 }
 
 func TestInstallClaudeDryRun(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-002", unitNominalMarkers...)
 
 	tmpDir := t.TempDir()
 
@@ -381,11 +369,7 @@ func TestInstallClaudeDryRun(t *testing.T) {
 }
 
 func TestInstallAllAgents(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-001",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-001", unitNominalMarkers...)
 
 	// Verify all 10 agents are in the supportedAgents registry
 	if len(supportedAgents) != 10 {
@@ -432,11 +416,7 @@ func TestInstallAllAgents(t *testing.T) {
 }
 
 func TestInstallAgentsList(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-001",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-001", unitNominalMarkers...)
 
 	tmpDir := t.TempDir()
 
@@ -469,11 +449,7 @@ func TestInstallAgentsList(t *testing.T) {
 }
 
 func TestInstallDetectNewAgents(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-001",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-001", unitNominalMarkers...)
 
 	tmpDir := t.TempDir()
 
@@ -527,11 +503,7 @@ func TestInstallDetectNewAgents(t *testing.T) {
 }
 
 func TestInstallZedJSON(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-001",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-001", unitNominalMarkers...)
 
 	tmpDir := t.TempDir()
 
@@ -588,11 +560,7 @@ func TestInstallZedJSON(t *testing.T) {
 }
 
 func TestInstallNewAgentCreatesFile(t *testing.T) {
-	rtmx.Req(t, "REQ-AGENT-001",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-AGENT-001", unitNominalMarkers...)
 
 	agents := []struct {
 		name       string
@@ -766,11 +734,7 @@ func TestInstallClaudeCode(t *testing.T) {
 }
 
 func TestInstallCoder(t *testing.T) {
-	rtmx.Req(t, "REQ-PLUGIN-003",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-PLUGIN-003", unitNominalMarkers...)
 
 	t.Run("creates_setup_script", func(t *testing.T) {
 		tmpDir := t.TempDir()
@@ -820,11 +784,7 @@ func TestInstallCoder(t *testing.T) {
 }
 
 func TestInstallCodex(t *testing.T) {
-	rtmx.Req(t, "REQ-PLUGIN-003",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-PLUGIN-003", unitNominalMarkers...)
 
 	t.Run("creates_tool_definition", func(t *testing.T) {
 		tmpDir := t.TempDir()
@@ -857,11 +817,7 @@ func TestInstallCodex(t *testing.T) {
 }
 
 func TestInstallGastown(t *testing.T) {
-	rtmx.Req(t, "REQ-PLUGIN-003",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-PLUGIN-003", unitNominalMarkers...)
 
 	t.Run("creates_plugin_config", func(t *testing.T) {
 		tmpDir := t.TempDir()
@@ -896,11 +852,7 @@ func TestInstallGastown(t *testing.T) {
 }
 
 func TestInstallGeminiCLI(t *testing.T) {
-	rtmx.Req(t, "REQ-PLUGIN-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-PLUGIN-002", unitNominalMarkers...)
 
 	t.Run("creates_extension_config", func(t *testing.T) {
 		tmpDir := t.TempDir()
@@ -12,6 +12,26 @@ import (
 	"github.com/spf13/cobra"
 )
 
+// Marker options shared by the move and clone command tests.
+var (
+	moveIntegrationMarkers = []rtmx.Option{
+		rtmx.Scope("integration"),
+		rtmx.Technique("nominal"),
+	}
+	moveIntegrationErrorMarkers = []rtmx.Option{
+		rtmx.Scope("integration"),
+		rtmx.Technique("error"),
+	}
+	moveUnitMarkers = []rtmx.Option{
+		rtmx.Scope("unit"),
+		rtmx.Technique("nominal"),
+	}
+	moveUnitErrorMarkers = []rtmx.Option{
+		rtmx.Scope("unit"),
+		rtmx.Technique("error"),
+	}
+)
+
 // newTestMoveCmd creates a fresh move command for testing.
 func newTestMoveCmd() *cobra.Command {
 	var to, id, branch string
@@ -77,10 +97,7 @@ func newTestMoveRootCmd() *cobra.Command {
 }
 
 func TestMoveCommandHelp(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", moveUnitMarkers...)
 
 	root := newTestMoveRootCmd()
 	output, err := executeCommand(root, "move", "--help")
@@ -102,10 +119,7 @@ func TestMoveCommandHelp(t *testing.T) {
 }
 
 func TestCloneCommandHelp(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", moveUnitMarkers...)
 
 	root := newTestMoveRootCmd()
 	output, err := executeCommand(root, "clone", "--help")
@@ -127,10 +141,7 @@ func TestCloneCommandHelp(t *testing.T) {
 }
 
 func TestMoveCommandEndToEnd(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", moveIntegrationMarkers...)
 
 	srcRows := [][]string{
 		makeRow("REQ-MV-001", "CORE", "Requirement to move", "PARTIAL", "HIGH", 2, 1.0, ""),
@@ -181,10 +192,7 @@ func TestMoveCommandEndToEnd(t *testing.T) {
 }
 
 func TestCloneCommandEndToEnd(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", moveIntegrationMarkers...)
 
 	srcRows := [][]string{
 		makeRow("REQ-CL-001", "CORE", "Requirement to clone", "COMPLETE", "P0", 1, 0.5, ""),
@@ -235,10 +243,7 @@ func TestCloneCommandEndToEnd(t *testing.T) {
 }
 
 func TestMoveCommandDryRun(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", moveIntegrationMarkers...)
 
 	srcRows := [][]string{
 		makeRow("REQ-DR-001", "CORE", "Dry run test", "MISSING", "MEDIUM", 1, 1.0, ""),
@@ -272,10 +277,7 @@ func TestMoveCommandDryRun(t *testing.T) {
 }
 
 func TestMoveCommandWithIDOverride(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", moveIntegrationMarkers...)
 
 	srcRows := [][]string{
 		makeRow("REQ-ID-001", "CORE", "ID override test", "MISSING", "MEDIUM", 1, 1.0, ""),
@@ -307,10 +309,7 @@ func TestMoveCommandWithIDOverride(t *testing.T) {
 }
 
 func TestMoveCommandErrorNotRtmxEnabled(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("error"),
-	)
+	rtmx.Req(t, "REQ-GO-075", moveIntegrationErrorMarkers...)
 
 	srcRows := [][]string{
 		makeRow("REQ-ERR-001", "CORE", "Error test", "MISSING", "MEDIUM", 1, 1.0, ""),
@@ -330,10 +329,7 @@ func TestMoveCommandErrorNotRtmxEnabled(t *testing.T) {
 }
 
 func TestMoveCommandErrorReqNotFound(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("error"),
-	)
+	rtmx.Req(t, "REQ-GO-075", moveIntegrationErrorMarkers...)
 
 	srcDir := createTestProject(t, nil)
 	dstDir := createTestProject(t, nil)
@@ -350,10 +346,7 @@ func TestMoveCommandErrorReqNotFound(t *testing.T) {
 }
 
 func TestMoveCommandMissingToFlag(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("unit"),
-		rtmx.Technique("error"),
-	)
+	rtmx.Req(t, "REQ-GO-075", moveUnitErrorMarkers...)
 
 	root := newTestMoveRootCmd()
 	_, err := executeCommand(root, "move", "REQ-X-001")
@@ -390,10 +383,7 @@ func createGitTestProject(t *testing.T, csvRows [][]string) string {
 }
 
 func TestMoveBranchCreatesGitBranch(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-076",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-076", moveIntegrationMarkers...)
 
 	srcRows := [][]string{
 		makeRow("REQ-BR-001", "CORE", "Branch test", "PARTIAL", "HIGH", 2, 1.0, ""),
@@ -428,10 +418,7 @@ func TestMoveBranchCreatesGitBranch(t *testing.T) {
 }
 
 func TestCloneBranchCreatesGitBranch(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-076",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-076", moveIntegrationMarkers...)
 
 	srcRows := [][]string{
 		makeRow("REQ-CBR-001", "CORE", "Clone branch test", "COMPLETE", "P0", 1, 0.5, ""),
@@ -466,10 +453,7 @@ func TestCloneBranchCreatesGitBranch(t *testing.T) {
 }
 
 func TestMovePRFlagAccepted(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-076",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-076", moveUnitMarkers...)
 
 	root := newTestMoveRootCmd()
 	output, err := executeCommand(root, "move", "--help")
@@ -486,10 +470,7 @@ func TestMovePRFlagAccepted(t *testing.T) {
 }
 
 func TestClonePRFlagAccepted(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-076",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-076", moveUnitMarkers...)
 
 	root := newTestMoveRootCmd()
 	output, err := executeCommand(root, "clone", "--help")
@@ -506,10 +487,7 @@ func TestClonePRFlagAccepted(t *testing.T) {
 }
 
 func TestMoveDryRunWithBranch(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-076",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-076", moveIntegrationMarkers...)
 
 	srcRows := [][]string{
 		makeRow("REQ-DBR-001", "CORE", "Dry run branch test", "MISSING", "MEDIUM", 1, 1.0, ""),
@@ -539,10 +517,7 @@ func TestMoveDryRunWithBranch(t *testing.T) {
 }
 
 func TestCloneDryRunWithBranchAndPR(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-076",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-076", moveIntegrationMarkers...)
 
 	srcRows := [][]string{
 		makeRow("REQ-DBRP-001", "CORE", "Dry run branch+PR test", "MISSING", "MEDIUM", 1, 1.0, ""),
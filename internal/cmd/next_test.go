@@ -58,10 +58,13 @@ func TestNextShow(t *testing.T) {
 		"REQ-B,CLI,Commands,Feature B,Pass,mod,TestB,Unit Test,MISSING,HIGH,1,,2.0,REQ-A,,,,,,\n" +
 		"REQ-C,DATA,Config,Feature C,Pass,mod,TestC,Unit Test,MISSING,MEDIUM,1,,0.5,,,,,,,\n"
 
+	// The subtests that run against dbContent only read the project, so
+	// they share one copy of it.
+	projectDir := setupNextTestProject(t, dbContent)
+
 	t.Run("shows_webs_with_stats", func(t *testing.T) {
-		tmpDir := setupNextTestProject(t, dbContent)
 		origDir, _ := os.Getwd()
-		_ = os.Chdir(tmpDir)
+		_ = os.Chdir(projectDir)
 		defer func() { _ = os.Chdir(origDir) }()
 
 		cmd := createNextTestCmd()
@@ -90,9 +93,8 @@ func TestNextShow(t *testing.T) {
 	})
 
 	t.Run("blocked_shown", func(t *testing.T) {
-		tmpDir := setupNextTestProject(t, dbContent)
 		origDir, _ := os.Getwd()
-		_ = os.Chdir(tmpDir)
+		_ = os.Chdir(projectDir)
 		defer func() { _ = os.Chdir(origDir) }()
 
 		cmd := createNextTestCmd()
@@ -139,10 +141,13 @@ func TestNextOne(t *testing.T) {
 		"REQ-B,DATA,Config,Feature B,Pass,mod,TestB,Unit Test,MISSING,P0,1,,1.0,,,,,,,\n" +
 		"REQ-C,PLAN,Release,Feature C,Pass,mod,TestC,Unit Test,MISSING,HIGH,1,,0.5,REQ-B,,,,,,\n"
 
+	// The subtests that run against dbContent only read the project, so
+	// they share one copy of it.
+	projectDir := setupNextTestProject(t, dbContent)
+
 	t.Run("picks_highest_priority_unblocked", func(t *testing.T) {
-		tmpDir := setupNextTestProject(t, dbContent)
 		origDir, _ := os.Getwd()
-		_ = os.Chdir(tmpDir)
+		_ = os.Chdir(projectDir)
 		defer func() { _ = os.Chdir(origDir) }()
 
 		cmd := createNextTestCmd()
@@ -167,9 +172,8 @@ func TestNextOne(t *testing.T) {
 	})
 
 	t.Run("json_output", func(t *testing.T) {
-		tmpDir := setupNextTestProject(t, dbContent)
 		origDir, _ := os.Getwd()
-		_ = os.Chdir(tmpDir)
+		_ = os.Chdir(projectDir)
 		defer func() { _ = os.Chdir(origDir) }()
 
 		cmd := createNextTestCmd()
@@ -57,48 +57,9 @@ func runReconcile(cmd *cobra.Command, args []string) error {
 	cmd.Println(output.Header("Dependency Reconciliation", width))
 	cmd.Println()
 
-	// Find missing reciprocity
-	type fix struct {
-		reqID     string
-		dep       string
-		fixType   string // "add_block" or "add_dep"
-	}
-
-	var fixes []fix
-
-	// Check: if A depends on B, then B should block A
-	for _, req := range db.All() {
-		for dep := range req.Dependencies {
-			depReq := db.Get(dep)
-			if depReq == nil {
-				continue // Skip non-existent deps
-			}
-			if !depReq.Blocks.Contains(req.ReqID) {
-				fixes = append(fixes, fix{
-					reqID:   dep,
-					dep:     req.ReqID,
-					fixType: "add_block",
-				})
-			}
-		}
-	}
-
-	// Check: if A blocks B, then B should depend on A
-	for _, req := range db.All() {
-		for blocked := range req.Blocks {
-			blockedReq := db.Get(blocked)
-			if blockedReq == nil {
-				continue
-			}
-			if !blockedReq.Dependencies.Contains(req.ReqID) {
-				fixes = append(fixes, fix{
-					reqID:   blocked,
-					dep:     req.ReqID,
-					fixType: "add_dep",
-				})
-			}
-		}
-	}
+	// Find missing reciprocity: if A depends on B, B should block A,
+	// and if A blocks B, B should depend on A.
+	fixes := db.ReciprocityViolations()
 
 	if len(fixes) == 0 {
 		cmd.Printf("%s All dependencies are reciprocal!\n", output.Color("✓", output.Green))
@@ -114,13 +75,13 @@ func runReconcile(cmd *cobra.Command, args []string) error {
 	addDepFixes := 0
 
 	for _, f := range fixes {
-		if f.fixType == "add_block" {
+		if f.Kind == database.MissingBlock {
 			cmd.Printf("  %s %s should block %s\n",
-				output.Color("→", output.Yellow), f.reqID, f.dep)
+				output.Color("→", output.Yellow), f.ReqID, f.Missing)
 			addBlockFixes++
 		} else {
 			cmd.Printf("  %s %s should depend on %s\n",
-				output.Color("→", output.Yellow), f.reqID, f.dep)
+				output.Color("→", output.Yellow), f.ReqID, f.Missing)
 			addDepFixes++
 		}
 	}
@@ -138,19 +99,19 @@ func runReconcile(cmd *cobra.Command, args []string) error {
 	cmd.Println("Applying fixes...")
 
 	for _, f := range fixes {
-		req := db.Get(f.reqID)
+		req := db.Get(f.ReqID)
 		if req == nil {
 			continue
 		}
 
-		if f.fixType == "add_block" {
-			req.Blocks.Add(f.dep)
+		if f.Kind == database.MissingBlock {
+			req.Blocks.Add(f.Missing)
 			cmd.Printf("  %s Added block: %s -> %s\n",
-				output.Color("✓", output.Green), f.reqID, f.dep)
+				output.Color("✓", output.Green), f.ReqID, f.Missing)
 		} else {
-			req.Dependencies.Add(f.dep)
+			req.Dependencies.Add(f.Missing)
 			cmd.Printf("  %s Added dependency: %s -> %s\n",
-				output.Color("✓", output.Green), f.reqID, f.dep)
+				output.Color("✓", output.Green), f.ReqID, f.Missing)
 		}
 	}
 
@@ -101,112 +101,6 @@ func TestReconcileDryRunWithIssues(t *testing.T) {
 	}
 }
 
-func TestReconcileExecuteMissingBlock(t *testing.T) {
-	// REQ-A depends on REQ-B, but REQ-B does not block REQ-A
-	// Execute should fix this by adding block to REQ-B
-	csv := reconcileCSVHeader +
-		"REQ-A,CORE,Feature A,MISSING,MEDIUM,1,REQ-B,\n" +
-		"REQ-B,CORE,Feature B,MISSING,MEDIUM,1,,\n"
-
-	dir := setupReconcileProject(t, csv)
-
-	oldWd, _ := os.Getwd()
-	_ = os.Chdir(dir)
-	defer func() { _ = os.Chdir(oldWd) }()
-
-	rootCmd := createReconcileTestCmd()
-	buf := new(bytes.Buffer)
-	rootCmd.SetOut(buf)
-	rootCmd.SetArgs([]string{"reconcile", "--execute"})
-
-	err := rootCmd.Execute()
-	if err != nil {
-		t.Fatalf("reconcile --execute failed: %v", err)
-	}
-
-	output := buf.String()
-	if !strings.Contains(output, "Applying fixes") {
-		t.Errorf("expected 'Applying fixes' message, got:\n%s", output)
-	}
-	if !strings.Contains(output, "Added block") {
-		t.Errorf("expected 'Added block' message, got:\n%s", output)
-	}
-	if !strings.Contains(output, "Applied") {
-		t.Errorf("expected 'Applied N fixes' message, got:\n%s", output)
-	}
-
-	// Verify the database was actually modified on disk
-	dbContent, err := os.ReadFile(filepath.Join(dir, ".rtmx", "database.csv"))
-	if err != nil {
-		t.Fatalf("failed to read saved database: %v", err)
-	}
-	dbStr := string(dbContent)
-	// REQ-B should now block REQ-A
-	lines := strings.Split(dbStr, "\n")
-	var reqBLine string
-	for _, line := range lines {
-		if strings.HasPrefix(line, "REQ-B,") {
-			reqBLine = line
-			break
-		}
-	}
-	if reqBLine == "" {
-		t.Fatal("could not find REQ-B line in saved database")
-	}
-	if !strings.Contains(reqBLine, "REQ-A") {
-		t.Errorf("expected REQ-B to block REQ-A after fix, got line: %s", reqBLine)
-	}
-}
-
-func TestReconcileExecuteMissingDependency(t *testing.T) {
-	// REQ-A blocks REQ-B, but REQ-B does not depend on REQ-A
-	csv := reconcileCSVHeader +
-		"REQ-A,CORE,Feature A,MISSING,MEDIUM,1,,REQ-B\n" +
-		"REQ-B,CORE,Feature B,MISSING,MEDIUM,1,,\n"
-
-	dir := setupReconcileProject(t, csv)
-
-	oldWd, _ := os.Getwd()
-	_ = os.Chdir(dir)
-	defer func() { _ = os.Chdir(oldWd) }()
-
-	rootCmd := createReconcileTestCmd()
-	buf := new(bytes.Buffer)
-	rootCmd.SetOut(buf)
-	rootCmd.SetArgs([]string{"reconcile", "--execute"})
-
-	err := rootCmd.Execute()
-	if err != nil {
-		t.Fatalf("reconcile --execute failed: %v", err)
-	}
-
-	output := buf.String()
-	if !strings.Contains(output, "Added dependency") {
-		t.Errorf("expected 'Added dependency' message, got:\n%s", output)
-	}
-
-	// Verify REQ-B now depends on REQ-A in the saved file
-	dbContent, err := os.ReadFile(filepath.Join(dir, ".rtmx", "database.csv"))
-	if err != nil {
-		t.Fatalf("failed to read saved database: %v", err)
-	}
-	dbStr := string(dbContent)
-	lines := strings.Split(dbStr, "\n")
-	var reqBLine string
-	for _, line := range lines {
-		if strings.HasPrefix(line, "REQ-B,") {
-			reqBLine = line
-			break
-		}
-	}
-	if reqBLine == "" {
-		t.Fatal("could not find REQ-B line in saved database")
-	}
-	if !strings.Contains(reqBLine, "REQ-A") {
-		t.Errorf("expected REQ-B to depend on REQ-A after fix, got line: %s", reqBLine)
-	}
-}
-
 func TestReconcileMultipleIssues(t *testing.T) {
 	// Multiple missing reciprocal relationships
 	csv := reconcileCSVHeader +
@@ -274,42 +168,84 @@ func TestReconcileNoDatabase(t *testing.T) {
 	}
 }
 
-func TestReconcileExecuteVerifyDatabaseSaved(t *testing.T) {
-	// Comprehensive test: create issues, execute fixes, reload and verify consistency
-	csv := reconcileCSVHeader +
-		"REQ-A,CORE,Feature A,MISSING,MEDIUM,1,REQ-B,\n" +
-		"REQ-B,CORE,Feature B,MISSING,MEDIUM,1,,\n"
-
-	dir := setupReconcileProject(t, csv)
+// runReconcileIn runs the reconcile command in dir and returns its output.
+func runReconcileIn(t *testing.T, dir string, args ...string) string {
+	t.Helper()
 
 	oldWd, _ := os.Getwd()
 	_ = os.Chdir(dir)
 	defer func() { _ = os.Chdir(oldWd) }()
 
-	// Execute reconcile
 	rootCmd := createReconcileTestCmd()
 	buf := new(bytes.Buffer)
 	rootCmd.SetOut(buf)
-	rootCmd.SetArgs([]string{"reconcile", "--execute"})
+	rootCmd.SetArgs(append([]string{"reconcile"}, args...))
 
-	err := rootCmd.Execute()
-	if err != nil {
-		t.Fatalf("reconcile --execute failed: %v", err)
+	if err := rootCmd.Execute(); err != nil {
+		t.Fatalf("reconcile %v failed: %v", args, err)
 	}
+	return buf.String()
+}
 
-	// Now run reconcile again (dry-run) and verify no issues remain
-	rootCmd2 := createReconcileTestCmd()
-	buf2 := new(bytes.Buffer)
-	rootCmd2.SetOut(buf2)
-	rootCmd2.SetArgs([]string{"reconcile"})
+// savedReconcileRow returns the row for reqID in dir's saved database.
+func savedReconcileRow(t *testing.T, dir, reqID string) string {
+	t.Helper()
 
-	err = rootCmd2.Execute()
+	dbContent, err := os.ReadFile(filepath.Join(dir, ".rtmx", "database.csv"))
 	if err != nil {
-		t.Fatalf("second reconcile failed: %v", err)
+		t.Fatalf("failed to read saved database: %v", err)
+	}
+	for _, line := range strings.Split(string(dbContent), "\n") {
+		if strings.HasPrefix(line, reqID+",") {
+			return line
+		}
 	}
+	t.Fatalf("could not find %s line in saved database", reqID)
+	return ""
+}
+
+func TestReconcileExecute(t *testing.T) {
+	// Both kinds of missing reciprocal live in one project under their own
+	// prefixes, so a single --execute run covers every fix:
+	//   REQ-MB-A depends on REQ-MB-B, but REQ-MB-B does not block REQ-MB-A
+	//   REQ-MD-A blocks REQ-MD-B, but REQ-MD-B does not depend on REQ-MD-A
+	csv := reconcileCSVHeader +
+		"REQ-MB-A,CORE,Feature A,MISSING,MEDIUM,1,REQ-MB-B,\n" +
+		"REQ-MB-B,CORE,Feature B,MISSING,MEDIUM,1,,\n" +
+		"REQ-MD-A,CORE,Feature A,MISSING,MEDIUM,1,,REQ-MD-B\n" +
+		"REQ-MD-B,CORE,Feature B,MISSING,MEDIUM,1,,\n"
 
-	output2 := buf2.String()
-	if !strings.Contains(output2, "All dependencies are reciprocal") {
-		t.Errorf("expected no issues after executing fixes, got:\n%s", output2)
+	dir := setupReconcileProject(t, csv)
+	output := runReconcileIn(t, dir, "--execute")
+
+	for _, want := range []string{"Applying fixes", "Applied"} {
+		if !strings.Contains(output, want) {
+			t.Errorf("expected %q message, got:\n%s", want, output)
+		}
 	}
+
+	t.Run("MissingBlock", func(t *testing.T) {
+		if !strings.Contains(output, "Added block") {
+			t.Errorf("expected 'Added block' message, got:\n%s", output)
+		}
+		if line := savedReconcileRow(t, dir, "REQ-MB-B"); !strings.Contains(line, "REQ-MB-A") {
+			t.Errorf("expected REQ-MB-B to block REQ-MB-A after fix, got line: %s", line)
+		}
+	})
+
+	t.Run("MissingDependency", func(t *testing.T) {
+		if !strings.Contains(output, "Added dependency") {
+			t.Errorf("expected 'Added dependency' message, got:\n%s", output)
+		}
+		if line := savedReconcileRow(t, dir, "REQ-MD-B"); !strings.Contains(line, "REQ-MD-A") {
+			t.Errorf("expected REQ-MD-B to depend on REQ-MD-A after fix, got line: %s", line)
+		}
+	})
+
+	t.Run("DatabaseSaved", func(t *testing.T) {
+		// A dry run over the saved database must find nothing left to fix.
+		if again := runReconcileIn(t, dir); !strings.Contains(again, "All dependencies are reciprocal") {
+			t.Errorf("expected no issues after executing fixes, got:\n%s", again)
+		}
+	})
 }
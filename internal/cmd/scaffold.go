@@ -0,0 +1,386 @@
+package cmd
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"regexp"
+	"runtime"
+	"strconv"
+	"strings"
+	"sync"
+	"text/template"
+
+	"github.com/rtmx-ai/rtmx/internal/database"
+)
+
+// specTemplateRelPath is the project-relative path of an optional custom
+// requirement spec template (Go text/template syntax).
+const specTemplateRelPath = ".rtmx/templates/requirement.md.tmpl"
+
+// specTitleMaxLen is the maximum length of the spec title derived from the
+// requirement text before it is truncated with an ellipsis.
+const specTitleMaxLen = 60
+
+// defaultSpecTemplate is used when the project does not provide a custom template.
+const defaultSpecTemplate = `# {{.ReqID}}: {{.Title}}
+
+## Metadata
+- **Category**: {{.Category}}
+- **Subcategory**: {{.Subcategory}}
+- **Priority**: {{.Priority}}
+- **Phase**: {{.Phase}}
+- **Status**: {{.Status}}
+- **Dependencies**: {{.Dependencies}}
+- **Blocks**: {{.Blocks}}
+
+## Description
+{{.RequirementText}}
+
+## Acceptance Criteria
+- [ ] {{.TargetValue}}
+
+## Validation
+- **Test**: {{.Test}}
+- **Method**: {{.ValidationMethod}}
+
+## Notes
+{{.Notes}}
+`
+
+// defaultSpecTmpl is parsed once per process and shared by every render;
+// a parsed template is safe for concurrent execution.
+var defaultSpecTmpl = template.Must(parseSpecTemplate(defaultSpecTemplate))
+
+// specFieldPattern matches a plain {{.Field}} substitution.
+var specFieldPattern = regexp.MustCompile(`\{\{\.(\w+)\}\}`)
+
+// defaultSpecSegments is defaultSpecTemplate split into alternating literal
+// text and field names (even indexes are literals, odd indexes are fields).
+// The default template is nothing but field substitutions, so rendering it
+// by concatenation avoids text/template's reflection-based execution.
+var defaultSpecSegments = splitSpecTemplate(defaultSpecTemplate)
+
+// specData is the data passed to requirement spec templates.
+type specData struct {
+	ReqID            string
+	Title            string
+	Category         string
+	Subcategory      string
+	RequirementText  string
+	TargetValue      string
+	Test             string
+	ValidationMethod string
+	Status           string
+	Priority         string
+	Phase            int
+	Dependencies     string
+	Blocks           string
+	Notes            string
+}
+
+// scaffoldResult summarizes a scaffold run.
+type scaffoldResult struct {
+	Created   int      `json:"created"`
+	Skipped   int      `json:"skipped"`
+	Unchanged int      `json:"unchanged"`
+	Errors    int      `json:"errors"`
+	Files     []string `json:"files"`
+}
+
+// specStatus is the outcome of scaffolding a single requirement spec.
+type specStatus int
+
+const (
+	// specCreated means the spec file was written.
+	specCreated specStatus = iota
+	// specSkipped means an existing spec was kept because force was not set.
+	specSkipped
+	// specUnchanged means force was set but the existing spec already
+	// matched the rendered content, so it was not rewritten.
+	specUnchanged
+)
+
+// newSpecData converts a requirement into template data, filling placeholders
+// for fields that have not been specified yet.
+func newSpecData(req *database.Requirement) specData {
+	test := "TBD"
+	if req.TestModule != "" && req.TestFunction != "" {
+		test = req.TestModule + "::" + req.TestFunction
+	} else if req.TestModule != "" {
+		test = req.TestModule
+	}
+
+	return specData{
+		ReqID:            req.ReqID,
+		Title:            truncate(req.RequirementText, specTitleMaxLen),
+		Category:         req.Category,
+		Subcategory:      orDefault(req.Subcategory, "(none)"),
+		RequirementText:  req.RequirementText,
+		TargetValue:      orDefault(req.TargetValue, "TBD"),
+		Test:             test,
+		ValidationMethod: orDefault(req.ValidationMethod, "TBD"),
+		Status:           string(req.Status),
+		Priority:         string(req.Priority),
+		Phase:            req.Phase,
+		Dependencies:     orDefault(strings.Join(req.Dependencies.Slice(), ", "), "(none)"),
+		Blocks:           orDefault(strings.Join(req.Blocks.Slice(), ", "), "(none)"),
+		Notes:            orDefault(req.Notes, "None"),
+	}
+}
+
+// field returns the value of the named template field.
+func (d specData) field(name string) string {
+	switch name {
+	case "ReqID":
+		return d.ReqID
+	case "Title":
+		return d.Title
+	case "Category":
+		return d.Category
+	case "Subcategory":
+		return d.Subcategory
+	case "RequirementText":
+		return d.RequirementText
+	case "TargetValue":
+		return d.TargetValue
+	case "Test":
+		return d.Test
+	case "ValidationMethod":
+		return d.ValidationMethod
+	case "Status":
+		return d.Status
+	case "Priority":
+		return d.Priority
+	case "Phase":
+		return strconv.Itoa(d.Phase)
+	case "Dependencies":
+		return d.Dependencies
+	case "Blocks":
+		return d.Blocks
+	case "Notes":
+		return d.Notes
+	}
+	return ""
+}
+
+// splitSpecTemplate splits a substitution-only template into literal and
+// field segments.
+func splitSpecTemplate(text string) []string {
+	var segments []string
+	last := 0
+	for _, m := range specFieldPattern.FindAllStringSubmatchIndex(text, -1) {
+		segments = append(segments, text[last:m[0]], text[m[2]:m[3]])
+		last = m[1]
+	}
+	return append(segments, text[last:])
+}
+
+// orDefault returns s, or def when s is blank.
+func orDefault(s, def string) string {
+	if strings.TrimSpace(s) == "" {
+		return def
+	}
+	return s
+}
+
+// parseSpecTemplate parses a requirement spec template.
+func parseSpecTemplate(text string) (*template.Template, error) {
+	return template.New("requirement").Option("missingkey=zero").Parse(text)
+}
+
+// loadSpecTemplate returns the project's custom spec template if one exists
+// and parses, otherwise the default template. Callers load it once per
+// scaffold run and share it across every requirement.
+func loadSpecTemplate(projectRoot string) *template.Template {
+	content, err := os.ReadFile(filepath.Join(projectRoot, specTemplateRelPath))
+	if err != nil || strings.TrimSpace(string(content)) == "" {
+		return defaultSpecTmpl
+	}
+	tmpl, err := parseSpecTemplate(string(content))
+	if err != nil {
+		return defaultSpecTmpl
+	}
+	return tmpl
+}
+
+// renderSpecTemplate renders the spec for a single requirement.
+func renderSpecTemplate(tmpl *template.Template, req *database.Requirement) (string, error) {
+	if tmpl == defaultSpecTmpl {
+		return renderDefaultSpec(newSpecData(req)), nil
+	}
+	var sb strings.Builder
+	if err := tmpl.Execute(&sb, newSpecData(req)); err != nil {
+		return "", fmt.Errorf("failed to render spec for %s: %w", req.ReqID, err)
+	}
+	return sb.String(), nil
+}
+
+// renderDefaultSpec renders defaultSpecTemplate by direct substitution.
+func renderDefaultSpec(data specData) string {
+	var sb strings.Builder
+	sb.Grow(len(defaultSpecTemplate) + len(data.RequirementText)*2)
+	for i, seg := range defaultSpecSegments {
+		if i%2 == 0 {
+			sb.WriteString(seg)
+		} else {
+			sb.WriteString(data.field(seg))
+		}
+	}
+	return sb.String()
+}
+
+// specCategory returns the directory a requirement's spec is filed under,
+// falling back to the category segment of the requirement ID.
+func specCategory(req *database.Requirement) string {
+	if req.Category != "" {
+		return req.Category
+	}
+	if _, rest, ok := strings.Cut(req.ReqID, "-"); ok {
+		if category, _, ok := strings.Cut(rest, "-"); ok {
+			return category
+		}
+	}
+	return "UNCATEGORIZED"
+}
+
+// specPath returns the spec file path for a requirement. A requirement_file
+// naming a markdown file is honored, resolved against projectRoot when
+// relative; otherwise the spec is filed as <reqDir>/<category>/<id>.md.
+func specPath(projectRoot, reqDir string, req *database.Requirement) string {
+	if file := strings.TrimSpace(req.RequirementFile); filepath.Ext(file) == ".md" {
+		if filepath.IsAbs(file) {
+			return filepath.Clean(file)
+		}
+		return filepath.Join(projectRoot, filepath.FromSlash(file))
+	}
+	return filepath.Join(reqDir, specCategory(req), req.ReqID+".md")
+}
+
+// scaffoldRequirementSpec writes the spec file for req at path and reports
+// what was done. Existing files are left alone unless force is set, and even
+// then are not rewritten when their content would not change, so file
+// modification times (and anything tracking them) are preserved. The parent
+// directory is created unless it is listed in createdDirs.
+func scaffoldRequirementSpec(req *database.Requirement, path string, tmpl *template.Template, force bool, createdDirs map[string]struct{}) (specStatus, error) {
+	if !force {
+		if _, err := os.Stat(path); err == nil {
+			return specSkipped, nil
+		}
+	}
+
+	content, err := renderSpecTemplate(tmpl, req)
+	if err != nil {
+		return specSkipped, err
+	}
+	if force {
+		if existing, err := os.ReadFile(path); err == nil && string(existing) == content {
+			return specUnchanged, nil
+		}
+	}
+	if dir := filepath.Dir(path); !hasPath(createdDirs, dir) {
+		if err := os.MkdirAll(dir, 0755); err != nil {
+			return specSkipped, fmt.Errorf("failed to create spec directory: %w", err)
+		}
+	}
+	if err := os.WriteFile(path, []byte(content), 0644); err != nil {
+		return specSkipped, fmt.Errorf("failed to write spec %s: %w", path, err)
+	}
+	return specCreated, nil
+}
+
+// hasPath reports whether path is in paths.
+func hasPath(paths map[string]struct{}, path string) bool {
+	_, ok := paths[path]
+	return ok
+}
+
+// scaffoldAllSpecs generates spec files for every requirement in db.
+//
+// Specs at paths in keep, such as ones already written earlier in the same
+// run, are never rewritten, even with force.
+//
+// Each requirement renders to its own file, so the work is spread over a pool
+// of workers; spec directories are created up front so workers never
+// race on MkdirAll. Results are stored per index and summed afterwards,
+// keeping the file list in database order.
+func scaffoldAllSpecs(db *database.Database, reqDir, projectRoot string, force bool, keep map[string]struct{}) *scaffoldResult {
+	result := &scaffoldResult{Files: []string{}}
+	reqs := db.All()
+	if len(reqs) == 0 {
+		return result
+	}
+
+	tmpl := loadSpecTemplate(projectRoot)
+
+	paths := make([]string, len(reqs))
+	dirErrs := make(map[string]error)
+	createdDirs := make(map[string]struct{})
+	for i, req := range reqs {
+		paths[i] = specPath(projectRoot, reqDir, req)
+		dir := filepath.Dir(paths[i])
+		if _, done := dirErrs[dir]; !done {
+			dirErrs[dir] = os.MkdirAll(dir, 0755)
+			if dirErrs[dir] == nil {
+				createdDirs[dir] = struct{}{}
+			}
+		}
+	}
+
+	type outcome struct {
+		path   string
+		status specStatus
+		err    error
+	}
+	outcomes := make([]outcome, len(reqs))
+
+	workers := runtime.NumCPU() * 4
+	if workers > 32 {
+		workers = 32
+	}
+	if workers > len(reqs) {
+		workers = len(reqs)
+	}
+
+	jobs := make(chan int)
+	var wg sync.WaitGroup
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range jobs {
+				path := paths[i]
+				if hasPath(keep, path) {
+					outcomes[i] = outcome{path: path, status: specSkipped}
+					continue
+				}
+				if err := dirErrs[filepath.Dir(path)]; err != nil {
+					outcomes[i] = outcome{err: fmt.Errorf("failed to create spec directory: %w", err)}
+					continue
+				}
+				status, err := scaffoldRequirementSpec(reqs[i], path, tmpl, force, createdDirs)
+				outcomes[i] = outcome{path: path, status: status, err: err}
+			}
+		}()
+	}
+	for i := range reqs {
+		jobs <- i
+	}
+	close(jobs)
+	wg.Wait()
+
+	for _, o := range outcomes {
+		switch {
+		case o.err != nil:
+			result.Errors++
+		case o.status == specCreated:
+			result.Created++
+			result.Files = append(result.Files, o.path)
+		case o.status == specUnchanged:
+			result.Unchanged++
+		default:
+			result.Skipped++
+		}
+	}
+	return result
+}
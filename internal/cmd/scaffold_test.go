@@ -0,0 +1,436 @@
+package cmd
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/rtmx-ai/rtmx/internal/database"
+	"github.com/rtmx-ai/rtmx/pkg/rtmx"
+)
+
+// scaffoldTestReqs are the prototype requirements shared by the scaffold tests.
+var scaffoldTestReqs = []database.Requirement{
+	{ReqID: "REQ-TEST-001", Category: "VALIDATION", RequirementText: "First requirement", TargetValue: "Passes", TestModule: "tests/test_one.py", TestFunction: "test_one", ValidationMethod: "Unit Test", Status: database.StatusMissing, Priority: database.PriorityHigh, Phase: 1},
+	{ReqID: "REQ-TEST-002", Category: "VALIDATION", RequirementText: "Second requirement", Status: database.StatusPartial, Priority: database.PriorityMedium, Phase: 1},
+	{ReqID: "REQ-TEST-003", Category: "CORE", RequirementText: "Third requirement", Status: database.StatusComplete, Priority: database.PriorityLow, Phase: 2},
+}
+
+// scaffoldTestReq returns a fresh copy of the prototype requirement with the
+// given ID, so tests may modify it freely.
+func scaffoldTestReq(t *testing.T, reqID string) *database.Requirement {
+	t.Helper()
+	for _, proto := range scaffoldTestReqs {
+		if proto.ReqID == reqID {
+			return cloneScaffoldTestReq(proto)
+		}
+	}
+	t.Fatalf("no scaffold test requirement %s", reqID)
+	return nil
+}
+
+func cloneScaffoldTestReq(proto database.Requirement) *database.Requirement {
+	proto.Dependencies = make(database.StringSet)
+	proto.Blocks = make(database.StringSet)
+	return &proto
+}
+
+func scaffoldTestDB(t *testing.T) *database.Database {
+	t.Helper()
+	reqs := make([]*database.Requirement, len(scaffoldTestReqs))
+	for i, proto := range scaffoldTestReqs {
+		reqs[i] = cloneScaffoldTestReq(proto)
+	}
+	db, err := database.NewDatabaseFrom(reqs...)
+	if err != nil {
+		t.Fatalf("NewDatabaseFrom failed: %v", err)
+	}
+	return db
+}
+
+func TestRenderSpecTemplate(t *testing.T) {
+	rtmx.Req(t, "REQ-GO-026")
+
+	tests := []struct {
+		name     string
+		reqID    string
+		template string // custom template text; empty uses the default
+		want     []string
+		wantNot  []string
+	}{
+		{"basic", "REQ-TEST-001", "", []string{"# REQ-TEST-001: First requirement", "**Category**: VALIDATION", "**Priority**: HIGH", "- [ ] Passes"}, nil},
+		{"includes test info", "REQ-TEST-001", "", []string{"**Test**: tests/test_one.py::test_one", "**Method**: Unit Test"}, []string{"**Test**: TBD"}},
+		{"missing test info", "REQ-TEST-002", "", []string{"**Test**: TBD", "**Method**: TBD"}, nil},
+		{"TBD target value", "REQ-TEST-002", "", []string{"- [ ] TBD"}, nil},
+		{"empty notes", "REQ-TEST-002", "", []string{"## Notes\nNone"}, nil},
+		{"custom template", "REQ-TEST-003", "CUSTOM {{.ReqID}} [{{.Status}}]\n", []string{"CUSTOM REQ-TEST-003 [COMPLETE]\n"}, []string{"## Metadata"}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			tmpl := defaultSpecTmpl
+			if tt.template != "" {
+				var err error
+				if tmpl, err = parseSpecTemplate(tt.template); err != nil {
+					t.Fatalf("parse custom template: %v", err)
+				}
+			}
+
+			out, err := renderSpecTemplate(tmpl, scaffoldTestReq(t, tt.reqID))
+			if err != nil {
+				t.Fatalf("render failed: %v", err)
+			}
+			for _, want := range tt.want {
+				if !strings.Contains(out, want) {
+					t.Errorf("expected %q in rendered spec, got:\n%s", want, out)
+				}
+			}
+			for _, unwanted := range tt.wantNot {
+				if strings.Contains(out, unwanted) {
+					t.Errorf("did not expect %q in rendered spec, got:\n%s", unwanted, out)
+				}
+			}
+		})
+	}
+}
+
+func TestRenderDefaultSpecMatchesTemplate(t *testing.T) {
+	for _, proto := range scaffoldTestReqs {
+		t.Run(proto.ReqID, func(t *testing.T) {
+			req := cloneScaffoldTestReq(proto)
+			req.Dependencies.Add("REQ-DEP-001")
+			req.Blocks.Add("REQ-BLK-001")
+
+			var sb strings.Builder
+			if err := defaultSpecTmpl.Execute(&sb, newSpecData(req)); err != nil {
+				t.Fatalf("execute failed: %v", err)
+			}
+			if got := renderDefaultSpec(newSpecData(req)); got != sb.String() {
+				t.Errorf("direct render differs from template:\n%s\nwant:\n%s", got, sb.String())
+			}
+		})
+	}
+}
+
+func TestRenderSpecTemplateTruncatesLongTitle(t *testing.T) {
+	req := scaffoldTestReq(t, "REQ-TEST-001")
+	longText := strings.Repeat("A", 100)
+	req.RequirementText = longText
+
+	out, err := renderSpecTemplate(defaultSpecTmpl, req)
+	if err != nil {
+		t.Fatalf("render failed: %v", err)
+	}
+
+	titleLine, _, _ := strings.Cut(out, "\n")
+	if len(titleLine) > len("# REQ-TEST-001: ")+specTitleMaxLen {
+		t.Errorf("title line not truncated: %q", titleLine)
+	}
+	if !strings.HasSuffix(titleLine, "...") {
+		t.Errorf("expected truncated title to end with ellipsis: %q", titleLine)
+	}
+	if _, desc, ok := strings.Cut(out, "## Description\n"); !ok || !strings.HasPrefix(desc, longText+"\n") {
+		t.Error("expected full requirement text in description")
+	}
+}
+
+func TestLoadSpecTemplateFallsBackOnInvalidTemplate(t *testing.T) {
+	for name, content := range map[string]string{
+		"empty":   "   \n",
+		"invalid": "{{.ReqID",
+	} {
+		t.Run(name, func(t *testing.T) {
+			dir := t.TempDir()
+			writeRequirementFile(t, dir, specTemplateRelPath, content)
+			if loadSpecTemplate(dir) != defaultSpecTmpl {
+				t.Error("expected fallback to the default template")
+			}
+		})
+	}
+}
+
+func TestLoadSpecTemplateReadsCurrentFile(t *testing.T) {
+	dir := t.TempDir()
+	writeRequirementFile(t, dir, specTemplateRelPath, "first {{.ReqID}}\n")
+	loadSpecTemplate(dir)
+
+	writeRequirementFile(t, dir, specTemplateRelPath, "second {{.ReqID}}\n")
+	out, err := renderSpecTemplate(loadSpecTemplate(dir), scaffoldTestReq(t, "REQ-TEST-001"))
+	if err != nil {
+		t.Fatalf("render failed: %v", err)
+	}
+	if out != "second REQ-TEST-001\n" {
+		t.Errorf("expected modified template to be used, got %q", out)
+	}
+}
+
+func TestSpecCategory(t *testing.T) {
+	tests := []struct {
+		reqID    string
+		category string
+		want     string
+	}{
+		{"REQ-TEST-001", "VALIDATION", "VALIDATION"},
+		{"REQ-CORE-001", "", "CORE"},
+		{"REQ-WEB-UI-001", "", "WEB"},
+		{"REQ-001", "", "UNCATEGORIZED"},
+		{"REQ", "", "UNCATEGORIZED"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.reqID, func(t *testing.T) {
+			req := &database.Requirement{ReqID: tt.reqID, Category: tt.category}
+			if got := specCategory(req); got != tt.want {
+				t.Errorf("specCategory(%s) = %q, want %q", tt.reqID, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestSpecPath(t *testing.T) {
+	projectRoot := t.TempDir()
+	reqDir := filepath.Join(projectRoot, ".rtmx", "requirements")
+	absFile := filepath.Join(t.TempDir(), "REQ-CORE-001.md")
+
+	tests := []struct {
+		name            string
+		requirementFile string
+		want            string
+	}{
+		{"no requirement file", "", filepath.Join(reqDir, "CORE", "REQ-CORE-001.md")},
+		{"relative requirement file", ".rtmx/requirements/AGENT/REQ-CORE-001.md", filepath.Join(projectRoot, ".rtmx", "requirements", "AGENT", "REQ-CORE-001.md")},
+		{"absolute requirement file", absFile, absFile},
+		{"not a spec path", "REQ-MONO-015", filepath.Join(reqDir, "CORE", "REQ-CORE-001.md")},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			req := &database.Requirement{ReqID: "REQ-CORE-001", Category: "CORE", RequirementFile: tt.requirementFile}
+			if got := specPath(projectRoot, reqDir, req); got != tt.want {
+				t.Errorf("specPath() = %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
+
+func TestScaffoldRequirementSpecCreatesCategoryDir(t *testing.T) {
+	reqDir := t.TempDir()
+	req := scaffoldTestReq(t, "REQ-TEST-003")
+	path := specPath(reqDir, reqDir, req)
+
+	status, err := scaffoldRequirementSpec(req, path, defaultSpecTmpl, false, nil)
+	if err != nil {
+		t.Fatalf("scaffold failed: %v", err)
+	}
+	if status != specCreated {
+		t.Error("expected spec to be created")
+	}
+	if _, err := os.Stat(path); err != nil {
+		t.Errorf("spec file not written: %v", err)
+	}
+}
+
+func TestScaffoldRequirementSpecSkipsExisting(t *testing.T) {
+	reqDir := t.TempDir()
+	req := scaffoldTestReq(t, "REQ-TEST-001")
+	writeRequirementFile(t, reqDir, "VALIDATION/REQ-TEST-001.md", "hand written")
+	path := filepath.Join(reqDir, "VALIDATION", "REQ-TEST-001.md")
+
+	status, err := scaffoldRequirementSpec(req, path, defaultSpecTmpl, false, nil)
+	if err != nil {
+		t.Fatalf("scaffold failed: %v", err)
+	}
+	if status != specSkipped {
+		t.Error("expected existing spec to be skipped")
+	}
+	content, _ := os.ReadFile(path)
+	if string(content) != "hand written" {
+		t.Errorf("existing spec was modified: %q", content)
+	}
+}
+
+func TestScaffoldRequirementSpecOverwritesWithForce(t *testing.T) {
+	reqDir := t.TempDir()
+	req := scaffoldTestReq(t, "REQ-TEST-001")
+	writeRequirementFile(t, reqDir, "VALIDATION/REQ-TEST-001.md", "hand written")
+	path := filepath.Join(reqDir, "VALIDATION", "REQ-TEST-001.md")
+
+	status, err := scaffoldRequirementSpec(req, path, defaultSpecTmpl, true, nil)
+	if err != nil {
+		t.Fatalf("scaffold failed: %v", err)
+	}
+	if status != specCreated {
+		t.Error("expected spec to be regenerated with force")
+	}
+	content, _ := os.ReadFile(path)
+	if !strings.HasPrefix(string(content), "# REQ-TEST-001:") {
+		t.Errorf("spec was not regenerated: %q", content)
+	}
+}
+
+func TestScaffoldAllSpecs(t *testing.T) {
+	rtmx.Req(t, "REQ-GO-026")
+
+	projectRoot := t.TempDir()
+	reqDir := filepath.Join(projectRoot, ".rtmx", "requirements")
+
+	result := scaffoldAllSpecs(scaffoldTestDB(t), reqDir, projectRoot, false, nil)
+	if result.Created != 3 || result.Skipped != 0 || result.Errors != 0 {
+		t.Errorf("unexpected result: %+v", result)
+	}
+	want := []string{
+		filepath.Join(reqDir, "VALIDATION", "REQ-TEST-001.md"),
+		filepath.Join(reqDir, "VALIDATION", "REQ-TEST-002.md"),
+		filepath.Join(reqDir, "CORE", "REQ-TEST-003.md"),
+	}
+	if strings.Join(result.Files, ",") != strings.Join(want, ",") {
+		t.Errorf("expected files %v in database order, got %v", want, result.Files)
+	}
+
+	again := scaffoldAllSpecs(scaffoldTestDB(t), reqDir, projectRoot, false, nil)
+	if again.Created != 0 || again.Skipped != 3 {
+		t.Errorf("expected second run to skip all specs: %+v", again)
+	}
+}
+
+func TestScaffoldAllSpecsHonorsRequirementFile(t *testing.T) {
+	projectRoot := t.TempDir()
+	reqDir := filepath.Join(projectRoot, ".rtmx", "requirements")
+	writeRequirementFile(t, projectRoot, ".rtmx/requirements/AGENT/REQ-TEST-003.md", "hand written")
+
+	db := scaffoldTestDB(t)
+	db.Get("REQ-TEST-003").RequirementFile = ".rtmx/requirements/AGENT/REQ-TEST-003.md"
+	db.Get("REQ-TEST-002").RequirementFile = "docs/specs/REQ-TEST-002.md"
+
+	result := scaffoldAllSpecs(db, reqDir, projectRoot, false, nil)
+	if result.Created != 2 || result.Skipped != 1 || result.Errors != 0 {
+		t.Errorf("unexpected result: %+v", result)
+	}
+	if _, err := os.Stat(filepath.Join(reqDir, "CORE", "REQ-TEST-003.md")); !os.IsNotExist(err) {
+		t.Error("expected no duplicate spec under the category directory")
+	}
+	if _, err := os.Stat(filepath.Join(projectRoot, "docs", "specs", "REQ-TEST-002.md")); err != nil {
+		t.Errorf("expected spec at its requirement_file path: %v", err)
+	}
+}
+
+func TestScaffoldAllSpecsUsesCustomTemplate(t *testing.T) {
+	projectRoot := t.TempDir()
+	reqDir := filepath.Join(projectRoot, ".rtmx", "requirements")
+	writeRequirementFile(t, projectRoot, specTemplateRelPath, "custom {{.ReqID}}\n")
+
+	scaffoldAllSpecs(scaffoldTestDB(t), reqDir, projectRoot, false, nil)
+
+	content, err := os.ReadFile(filepath.Join(reqDir, "CORE", "REQ-TEST-003.md"))
+	if err != nil {
+		t.Fatal(err)
+	}
+	if string(content) != "custom REQ-TEST-003\n" {
+		t.Errorf("custom template not used: %q", content)
+	}
+}
+
+func TestScaffoldAllSpecsForceSkipsUnchangedFiles(t *testing.T) {
+	projectRoot := t.TempDir()
+	reqDir := filepath.Join(projectRoot, ".rtmx", "requirements")
+
+	first := scaffoldAllSpecs(scaffoldTestDB(t), reqDir, projectRoot, false, nil)
+	past := time.Now().Add(-time.Hour).Truncate(time.Second)
+	for _, path := range first.Files {
+		_ = os.Chtimes(path, past, past)
+	}
+
+	result := scaffoldAllSpecs(scaffoldTestDB(t), reqDir, projectRoot, true, nil)
+	if result.Created != 0 || result.Unchanged != 3 || result.Skipped != 0 {
+		t.Errorf("expected every spec to be unchanged, got %+v", result)
+	}
+	for _, path := range first.Files {
+		if info, err := os.Stat(path); err != nil || !info.ModTime().Equal(past) {
+			t.Errorf("expected unchanged spec %s not to be rewritten", path)
+		}
+	}
+}
+
+func TestScaffoldAllSpecsForceRewritesChangedFiles(t *testing.T) {
+	projectRoot := t.TempDir()
+	reqDir := filepath.Join(projectRoot, ".rtmx", "requirements")
+
+	scaffoldAllSpecs(scaffoldTestDB(t), reqDir, projectRoot, false, nil)
+	stalePath := filepath.Join(reqDir, "CORE", "REQ-TEST-003.md")
+	writeRequirementFile(t, reqDir, "CORE/REQ-TEST-003.md", "stale")
+
+	db := scaffoldTestDB(t)
+	db.Get("REQ-TEST-001").RequirementText = "Reworded requirement"
+	editedPath := filepath.Join(reqDir, "VALIDATION", "REQ-TEST-001.md")
+
+	result := scaffoldAllSpecs(db, reqDir, projectRoot, true, nil)
+	if result.Created != 2 || result.Unchanged != 1 || result.Skipped != 0 {
+		t.Errorf("expected changed specs rewritten and the rest unchanged, got %+v", result)
+	}
+	if strings.Join(result.Files, ",") != editedPath+","+stalePath {
+		t.Errorf("expected rewritten files %v, got %v", []string{editedPath, stalePath}, result.Files)
+	}
+
+	for _, path := range []string{editedPath, stalePath} {
+		content, err := os.ReadFile(path)
+		if err != nil {
+			t.Fatal(err)
+		}
+		want, err := renderSpecTemplate(defaultSpecTmpl, db.Get(strings.TrimSuffix(filepath.Base(path), ".md")))
+		if err != nil {
+			t.Fatal(err)
+		}
+		if string(content) != want {
+			t.Errorf("expected %s to hold the regenerated spec, got %q", path, content)
+		}
+	}
+}
+
+func TestScaffoldAllSpecsForceKeepsListedPaths(t *testing.T) {
+	projectRoot := t.TempDir()
+	reqDir := filepath.Join(projectRoot, ".rtmx", "requirements")
+	writeRequirementFile(t, reqDir, "CORE/REQ-TEST-003.md", "hand written")
+	kept := filepath.Join(reqDir, "CORE", "REQ-TEST-003.md")
+
+	result := scaffoldAllSpecs(scaffoldTestDB(t), reqDir, projectRoot, true, map[string]struct{}{kept: {}})
+	if result.Created != 2 || result.Skipped != 1 {
+		t.Errorf("expected the kept spec to be skipped, got %+v", result)
+	}
+	content, _ := os.ReadFile(kept)
+	if string(content) != "hand written" {
+		t.Errorf("kept spec was rewritten: %q", content)
+	}
+}
+
+func TestScaffoldRequirementSpecForceKeepsUnchangedFile(t *testing.T) {
+	reqDir := t.TempDir()
+	req := scaffoldTestReq(t, "REQ-TEST-001")
+	path := specPath(reqDir, reqDir, req)
+	_, err := scaffoldRequirementSpec(req, path, defaultSpecTmpl, false, nil)
+	if err != nil {
+		t.Fatalf("scaffold failed: %v", err)
+	}
+	past := time.Now().Add(-time.Hour).Truncate(time.Second)
+	_ = os.Chtimes(path, past, past)
+
+	status, err := scaffoldRequirementSpec(req, path, defaultSpecTmpl, true, nil)
+	if err != nil {
+		t.Fatalf("scaffold failed: %v", err)
+	}
+	if status != specUnchanged {
+		t.Errorf("expected unchanged status, got %v", status)
+	}
+	if info, err := os.Stat(path); err != nil || !info.ModTime().Equal(past) {
+		t.Error("expected unchanged spec not to be rewritten")
+	}
+}
+
+func TestScaffoldAllSpecsEmptyDatabase(t *testing.T) {
+	projectRoot := t.TempDir()
+	result := scaffoldAllSpecs(database.NewDatabase(), filepath.Join(projectRoot, "reqs"), projectRoot, false, nil)
+	if result.Created != 0 || len(result.Files) != 0 {
+		t.Errorf("expected empty result, got %+v", result)
+	}
+}
@@ -287,6 +287,10 @@ func checkCIVerifyJob(opts *SecurityOptions, result *SecurityResult) {
 // checkActionsPinned checks if GitHub Actions are pinned to SHAs.
 var actionsUsesPattern = regexp.MustCompile(`uses:\s*([^\s#]+)`)
 
+// actionsSHAPattern matches an action reference pinned to a full commit SHA:
+// owner/repo@<40-char hex>.
+var actionsSHAPattern = regexp.MustCompile(`^[^@]+@[0-9a-f]{40}$`)
+
 func checkActionsPinned(opts *SecurityOptions, result *SecurityResult) {
 	workflowDir := filepath.Join(opts.Dir, ".github", "workflows")
 	entries, err := os.ReadDir(workflowDir)
@@ -305,9 +309,6 @@ func checkActionsPinned(opts *SecurityOptions, result *SecurityResult) {
 	pinnedActions := 0
 	unpinned := []string{}
 
-	// SHA pattern: owner/repo@<40-char hex>
-	shaPattern := regexp.MustCompile(`^[^@]+@[0-9a-f]{40}$`)
-
 	for _, entry := range entries {
 		if entry.IsDir() || (!strings.HasSuffix(entry.Name(), ".yml") && !strings.HasSuffix(entry.Name(), ".yaml")) {
 			continue
@@ -334,7 +335,7 @@ func checkActionsPinned(opts *SecurityOptions, result *SecurityResult) {
 				continue
 			}
 			totalActions++
-			if shaPattern.MatchString(action) {
+			if actionsSHAPattern.MatchString(action) {
 				pinnedActions++
 			} else {
 				unpinned = append(unpinned, action)
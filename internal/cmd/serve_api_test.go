@@ -7,6 +7,7 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"testing"
 	"time"
 
@@ -65,10 +66,9 @@ func decodeResponse(t *testing.T, w *httptest.ResponseRecorder) apiRequirementsR
 // REQ-API-001: Requirements list endpoint with filter/sort/paginate.
 func TestAPIRequirements(t *testing.T) {
 	rtmx.Req(t, "REQ-API-001")
+	t.Parallel()
 
-	db := testDB()
-	cfg := &config.Config{}
-	mux := NewDashboardMux(db, cfg)
+	mux := sharedAPIMux(t)
 
 	t.Run("returns_all_requirements", func(t *testing.T) {
 		w := apiGet(t, mux, "/api/requirements")
@@ -113,59 +113,33 @@ func TestAPIRequirements(t *testing.T) {
 		}
 	})
 
-	t.Run("filter_by_priority", func(t *testing.T) {
-		w := apiGet(t, mux, "/api/requirements?priority=P0")
-		resp := decodeResponse(t, w)
-		if resp.Pagination.Total != 3 {
-			t.Errorf("total = %d, want 3", resp.Pagination.Total)
-		}
-	})
-
-	t.Run("filter_by_assignee", func(t *testing.T) {
-		w := apiGet(t, mux, "/api/requirements?assignee=bob")
-		resp := decodeResponse(t, w)
-		if resp.Pagination.Total != 1 {
-			t.Errorf("total = %d, want 1", resp.Pagination.Total)
-		}
-		if resp.Requirements[0].ReqID != "REQ-MCP-001" {
-			t.Errorf("expected REQ-MCP-001, got %s", resp.Requirements[0].ReqID)
-		}
-	})
-
-	t.Run("filter_by_version", func(t *testing.T) {
-		w := apiGet(t, mux, "/api/requirements?version=v1.0.0")
-		resp := decodeResponse(t, w)
-		if resp.Pagination.Total != 2 {
-			t.Errorf("total = %d, want 2", resp.Pagination.Total)
-		}
-	})
-
-	t.Run("search_by_req_id", func(t *testing.T) {
-		w := apiGet(t, mux, "/api/requirements?search=MCP-001")
-		resp := decodeResponse(t, w)
-		if resp.Pagination.Total != 1 {
-			t.Errorf("total = %d, want 1", resp.Pagination.Total)
-		}
-		if resp.Requirements[0].ReqID != "REQ-MCP-001" {
-			t.Errorf("expected REQ-MCP-001, got %s", resp.Requirements[0].ReqID)
-		}
-	})
-
-	t.Run("search_by_text", func(t *testing.T) {
-		w := apiGet(t, mux, "/api/requirements?search=pagination")
-		resp := decodeResponse(t, w)
-		if resp.Pagination.Total != 1 {
-			t.Errorf("total = %d, want 1", resp.Pagination.Total)
-		}
-	})
-
-	t.Run("search_by_notes", func(t *testing.T) {
-		w := apiGet(t, mux, "/api/requirements?search=keystone")
-		resp := decodeResponse(t, w)
-		if resp.Pagination.Total != 1 {
-			t.Errorf("total = %d, want 1", resp.Pagination.Total)
-		}
-	})
+	// Filters and searches that are checked by match count, and by the
+	// matching ID when exactly one requirement should be returned.
+	countCases := []struct {
+		name  string
+		query string
+		total int
+		reqID string
+	}{
+		{"filter_by_priority", "priority=P0", 3, ""},
+		{"filter_by_assignee", "assignee=bob", 1, "REQ-MCP-001"},
+		{"filter_by_version", "version=v1.0.0", 2, ""},
+		{"search_by_req_id", "search=MCP-001", 1, "REQ-MCP-001"},
+		{"search_by_text", "search=pagination", 1, ""},
+		{"search_by_notes", "search=keystone", 1, ""},
+	}
+	for _, tt := range countCases {
+		t.Run(tt.name, func(t *testing.T) {
+			w := apiGet(t, mux, "/api/requirements?"+tt.query)
+			resp := decodeResponse(t, w)
+			if resp.Pagination.Total != tt.total {
+				t.Errorf("total = %d, want %d", resp.Pagination.Total, tt.total)
+			}
+			if tt.reqID != "" && len(resp.Requirements) > 0 && resp.Requirements[0].ReqID != tt.reqID {
+				t.Errorf("expected %s, got %s", tt.reqID, resp.Requirements[0].ReqID)
+			}
+		})
+	}
 
 	t.Run("sort_by_priority", func(t *testing.T) {
 		w := apiGet(t, mux, "/api/requirements?sort=priority")
@@ -340,6 +314,22 @@ func TestAPIRequirements(t *testing.T) {
 	})
 }
 
+var (
+	apiMuxOnce sync.Once
+	apiMux     http.Handler
+)
+
+// sharedAPIMux returns a dashboard handler over testDB without a database
+// path. It is built on first use and shared by the read-only API tests; tests
+// that modify requirements must use testMuxWithPath instead.
+func sharedAPIMux(t *testing.T) http.Handler {
+	t.Helper()
+	apiMuxOnce.Do(func() {
+		apiMux = NewDashboardMux(testDB(), &config.Config{})
+	})
+	return apiMux
+}
+
 // testMuxWithPath creates a mux with a real dbPath for persistence tests.
 func testMuxWithPath(t *testing.T, db *database.Database) (http.Handler, string) {
 	t.Helper()
@@ -356,9 +346,9 @@ func testMuxWithPath(t *testing.T, db *database.Database) (http.Handler, string)
 // REQ-API-002: Requirement detail endpoint with dependencies.
 func TestAPIRequirementDetail(t *testing.T) {
 	rtmx.Req(t, "REQ-API-002")
+	t.Parallel()
 
-	db := testDB()
-	mux, _ := testMuxWithPath(t, db)
+	mux := sharedAPIMux(t)
 
 	t.Run("returns_full_detail", func(t *testing.T) {
 		w := apiGet(t, mux, "/api/requirements/REQ-CLI-001")
@@ -587,9 +577,9 @@ func TestAPIRequirementUpdate(t *testing.T) {
 // REQ-API-004: Dependency graph endpoint.
 func TestAPIGraph(t *testing.T) {
 	rtmx.Req(t, "REQ-API-004")
+	t.Parallel()
 
-	db := testDB()
-	mux, _ := testMuxWithPath(t, db)
+	mux := sharedAPIMux(t)
 
 	t.Run("full_graph", func(t *testing.T) {
 		w := apiGet(t, mux, "/api/graph")
@@ -676,9 +666,9 @@ func TestAPIGraph(t *testing.T) {
 // REQ-API-005: Backlog endpoint with views.
 func TestAPIBacklog(t *testing.T) {
 	rtmx.Req(t, "REQ-API-005")
+	t.Parallel()
 
-	db := testDB()
-	mux, _ := testMuxWithPath(t, db)
+	mux := sharedAPIMux(t)
 
 	t.Run("default_view_all", func(t *testing.T) {
 		w := apiGet(t, mux, "/api/backlog")
@@ -786,9 +776,9 @@ func TestAPIBacklog(t *testing.T) {
 // REQ-API-006: Release scope and gate endpoint.
 func TestAPIReleases(t *testing.T) {
 	rtmx.Req(t, "REQ-API-006")
+	t.Parallel()
 
-	db := testDB()
-	mux, _ := testMuxWithPath(t, db)
+	mux := sharedAPIMux(t)
 
 	t.Run("list_versions", func(t *testing.T) {
 		w := apiGet(t, mux, "/api/releases")
@@ -955,12 +945,15 @@ func TestAPIAgentClaims(t *testing.T) {
 		claimsDir := filepath.Join(rtmxDir, "claims")
 
 		store, _ := orchestration.NewClaimStore(claimsDir)
-		_, _ = store.Claim("REQ-MCP-001", "claude-001")
+		claim, _ := store.Claim("REQ-MCP-001", "claude-001")
+
+		// Backdate the claim past the stale timeout instead of sleeping
+		claim.ClaimedAt = claim.ClaimedAt.Add(-2 * time.Hour)
+		data, _ := json.MarshalIndent(claim, "", "  ")
+		_ = os.WriteFile(filepath.Join(claimsDir, "REQ-MCP-001.json"), data, 0o644)
 
-		// Use a very short stale timeout for testing
 		cfg := &config.Config{}
-		mux := handleAPIAgentClaims(db, claimsDir, 1*time.Millisecond)
-		time.Sleep(5 * time.Millisecond)
+		mux := handleAPIAgentClaims(db, claimsDir, time.Hour)
 
 		req := httptest.NewRequest("GET", "/api/agents/claims", nil)
 		w := httptest.NewRecorder()
@@ -984,10 +977,9 @@ func TestAPIAgentClaims(t *testing.T) {
 // REQ-DASH-002: Requirements list partial with filter, sort, pagination.
 func TestDashboardRequirementsList(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-002")
+	t.Parallel()
 
-	db := testDBForDashboard(t)
-	cfg := &config.Config{}
-	mux := NewDashboardMuxWithPath(db, cfg, "")
+	mux := sharedDashboardMux(t)
 
 	t.Run("returns_html_with_all_requirements", func(t *testing.T) {
 		req := httptest.NewRequest("GET", "/partials/requirements", nil)
@@ -1104,10 +1096,9 @@ func TestDashboardRequirementsList(t *testing.T) {
 // REQ-DASH-003: Detail partial with inline editing fields.
 func TestDashboardRequirementDetail(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-003")
+	t.Parallel()
 
-	db := testDBForDashboard(t)
-	cfg := &config.Config{}
-	mux := NewDashboardMuxWithPath(db, cfg, "")
+	mux := sharedDashboardMux(t)
 
 	t.Run("returns_detail_html", func(t *testing.T) {
 		req := httptest.NewRequest("GET", "/partials/detail/REQ-CLI-001", nil)
@@ -1210,20 +1201,20 @@ func TestDashboardRequirementDetail(t *testing.T) {
 // REQ-DASH-004: Graph partial with D3 data.
 func TestDashboardGraph(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-004")
+	t.Parallel()
 
-	db := testDBForDashboard(t)
-	cfg := &config.Config{}
-	mux := NewDashboardMuxWithPath(db, cfg, "")
+	mux := sharedDashboardMux(t)
 
-	t.Run("returns_graph_html", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/graph", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
+	// The subtests all inspect the same partial, so fetch it once.
+	graphRec := httptest.NewRecorder()
+	mux.ServeHTTP(graphRec, httptest.NewRequest("GET", "/partials/graph", nil))
+	graphBody := graphRec.Body.String()
 
-		if rec.Code != http.StatusOK {
-			t.Fatalf("status = %d, want 200", rec.Code)
+	t.Run("returns_graph_html", func(t *testing.T) {
+		if graphRec.Code != http.StatusOK {
+			t.Fatalf("status = %d, want 200", graphRec.Code)
 		}
-		body := rec.Body.String()
+		body := graphBody
 
 		if !strings.Contains(body, "graph-container") {
 			t.Error("graph partial should contain graph container div")
@@ -1234,10 +1225,7 @@ func TestDashboardGraph(t *testing.T) {
 	})
 
 	t.Run("includes_node_edge_web_counts", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/graph", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-		body := rec.Body.String()
+		body := graphBody
 
 		if !strings.Contains(body, "nodes") {
 			t.Error("graph partial should include node count")
@@ -1251,10 +1239,7 @@ func TestDashboardGraph(t *testing.T) {
 	})
 
 	t.Run("includes_graph_json", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/graph", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-		body := rec.Body.String()
+		body := graphBody
 
 		// GraphJSON is embedded as inline script data
 		if !strings.Contains(body, "graphData") {
@@ -1267,10 +1252,7 @@ func TestDashboardGraph(t *testing.T) {
 	})
 
 	t.Run("category_filter_select_present", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/graph", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-		body := rec.Body.String()
+		body := graphBody
 
 		if !strings.Contains(body, "name=\"category\"") {
 			t.Error("graph partial should contain category filter select")
@@ -1285,20 +1267,20 @@ func TestDashboardGraph(t *testing.T) {
 // REQ-DASH-005: Kanban partial with drag-drop columns.
 func TestDashboardKanban(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-005")
+	t.Parallel()
 
-	db := testDBForDashboard(t)
-	cfg := &config.Config{}
-	mux := NewDashboardMuxWithPath(db, cfg, "")
+	mux := sharedDashboardMux(t)
 
-	t.Run("returns_kanban_html_with_columns", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/kanban", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
+	// The subtests all inspect the same partial, so fetch it once.
+	kanbanRec := httptest.NewRecorder()
+	mux.ServeHTTP(kanbanRec, httptest.NewRequest("GET", "/partials/kanban", nil))
+	kanbanBody := kanbanRec.Body.String()
 
-		if rec.Code != http.StatusOK {
-			t.Fatalf("status = %d, want 200", rec.Code)
+	t.Run("returns_kanban_html_with_columns", func(t *testing.T) {
+		if kanbanRec.Code != http.StatusOK {
+			t.Fatalf("status = %d, want 200", kanbanRec.Code)
 		}
-		body := rec.Body.String()
+		body := kanbanBody
 
 		// 4 column headers
 		for _, label := range []string{"Not Started", "Missing", "Partial", "Complete"} {
@@ -1309,10 +1291,7 @@ func TestDashboardKanban(t *testing.T) {
 	})
 
 	t.Run("cards_have_draggable_attribute", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/kanban", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-		body := rec.Body.String()
+		body := kanbanBody
 
 		if !strings.Contains(body, `draggable="true"`) {
 			t.Error("kanban cards should have draggable attribute")
@@ -1321,10 +1300,7 @@ func TestDashboardKanban(t *testing.T) {
 
 	t.Run("blocked_indicator_present", func(t *testing.T) {
 		// REQ-MCP-002 depends on REQ-MCP-001 (PARTIAL), so MCP-002 is blocked
-		req := httptest.NewRequest("GET", "/partials/kanban", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-		body := rec.Body.String()
+		body := kanbanBody
 
 		if !strings.Contains(body, "[Blocked]") {
 			t.Error("kanban should show [Blocked] indicator for blocked requirements")
@@ -1332,10 +1308,7 @@ func TestDashboardKanban(t *testing.T) {
 	})
 
 	t.Run("kanban_board_javascript_function", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/kanban", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-		body := rec.Body.String()
+		body := kanbanBody
 
 		if !strings.Contains(body, "kanbanBoard()") {
 			t.Error("kanban should include kanbanBoard() JavaScript function")
@@ -1343,10 +1316,7 @@ func TestDashboardKanban(t *testing.T) {
 	})
 
 	t.Run("cards_contain_requirement_ids", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/kanban", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-		body := rec.Body.String()
+		body := kanbanBody
 
 		for _, id := range []string{"REQ-CLI-001", "REQ-CLI-002", "REQ-MCP-001", "REQ-MCP-002", "REQ-API-001"} {
 			if !strings.Contains(body, id) {
@@ -1360,11 +1330,13 @@ func TestDashboardKanban(t *testing.T) {
 // REQ-DASH-006: Release partial with version cards.
 func TestDashboardReleasePlanning(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-006")
+	t.Parallel()
+
+	// The sprint subtests only issue GETs, so they can share one handler.
+	sprintsMux := NewDashboardMuxWithPath(testDBForDashboardWithSprints(t), &config.Config{}, "")
 
 	t.Run("empty_state_when_no_versions", func(t *testing.T) {
-		db := testDBForDashboard(t)
-		cfg := &config.Config{}
-		mux := NewDashboardMuxWithPath(db, cfg, "")
+		mux := sharedDashboardMux(t)
 
 		req := httptest.NewRequest("GET", "/partials/releases", nil)
 		rec := httptest.NewRecorder()
@@ -1384,9 +1356,7 @@ func TestDashboardReleasePlanning(t *testing.T) {
 	})
 
 	t.Run("shows_version_cards_when_sprints_set", func(t *testing.T) {
-		db := testDBForDashboardWithSprints(t)
-		cfg := &config.Config{}
-		mux := NewDashboardMuxWithPath(db, cfg, "")
+		mux := sprintsMux
 
 		req := httptest.NewRequest("GET", "/partials/releases", nil)
 		rec := httptest.NewRecorder()
@@ -1406,9 +1376,7 @@ func TestDashboardReleasePlanning(t *testing.T) {
 	})
 
 	t.Run("version_card_shows_gate_status", func(t *testing.T) {
-		db := testDBForDashboardWithSprints(t)
-		cfg := &config.Config{}
-		mux := NewDashboardMuxWithPath(db, cfg, "")
+		mux := sprintsMux
 
 		req := httptest.NewRequest("GET", "/partials/releases", nil)
 		rec := httptest.NewRecorder()
@@ -1426,9 +1394,7 @@ func TestDashboardReleasePlanning(t *testing.T) {
 	})
 
 	t.Run("version_card_shows_completion_percentage", func(t *testing.T) {
-		db := testDBForDashboardWithSprints(t)
-		cfg := &config.Config{}
-		mux := NewDashboardMuxWithPath(db, cfg, "")
+		mux := sprintsMux
 
 		req := httptest.NewRequest("GET", "/partials/releases", nil)
 		rec := httptest.NewRecorder()
@@ -1469,20 +1435,20 @@ func testDBForDashboardWithSprints(t *testing.T) *database.Database {
 // REQ-DASH-007: Health partial with checks and stats.
 func TestDashboardHealthTrends(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-007")
+	t.Parallel()
 
-	db := testDBForDashboard(t)
-	cfg := &config.Config{}
-	mux := NewDashboardMuxWithPath(db, cfg, "")
+	mux := sharedDashboardMux(t)
 
-	t.Run("returns_health_html", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/health", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
+	// The subtests all inspect the same partial, so fetch it once.
+	healthRec := httptest.NewRecorder()
+	mux.ServeHTTP(healthRec, httptest.NewRequest("GET", "/partials/health", nil))
+	healthBody := healthRec.Body.String()
 
-		if rec.Code != http.StatusOK {
-			t.Fatalf("status = %d, want 200", rec.Code)
+	t.Run("returns_health_html", func(t *testing.T) {
+		if healthRec.Code != http.StatusOK {
+			t.Fatalf("status = %d, want 200", healthRec.Code)
 		}
-		body := rec.Body.String()
+		body := healthBody
 
 		if !strings.Contains(body, "Health Dashboard") {
 			t.Error("health partial should contain heading")
@@ -1490,10 +1456,7 @@ func TestDashboardHealthTrends(t *testing.T) {
 	})
 
 	t.Run("shows_completion_percentage", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/health", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-		body := rec.Body.String()
+		body := healthBody
 
 		// 2 of 5 complete = 40%
 		if !strings.Contains(body, "40%") {
@@ -1505,10 +1468,7 @@ func TestDashboardHealthTrends(t *testing.T) {
 	})
 
 	t.Run("health_checks_table_present", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/health", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-		body := rec.Body.String()
+		body := healthBody
 
 		if !strings.Contains(body, "Health Checks") {
 			t.Error("health partial should contain Health Checks section")
@@ -1519,10 +1479,7 @@ func TestDashboardHealthTrends(t *testing.T) {
 	})
 
 	t.Run("no_circular_dependencies_check", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/health", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-		body := rec.Body.String()
+		body := healthBody
 
 		if !strings.Contains(body, "No circular dependencies") {
 			t.Error("health partial should contain 'No circular dependencies' check")
@@ -1534,10 +1491,7 @@ func TestDashboardHealthTrends(t *testing.T) {
 	})
 
 	t.Run("shows_blocked_count", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/health", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-		body := rec.Body.String()
+		body := healthBody
 
 		if !strings.Contains(body, "Blocked Items") {
 			t.Error("health partial should show blocked items count")
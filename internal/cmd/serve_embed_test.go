@@ -5,6 +5,7 @@ import (
 	"net/http"
 	"net/http/httptest"
 	"strings"
+	"sync"
 	"testing"
 
 	"github.com/rtmx-ai/rtmx/internal/config"
@@ -17,6 +18,7 @@ import (
 // REQ-DASH-001: Embedded SPA with htmx, Alpine.js, and Tailwind via embed.FS.
 func TestDashboardSPAEmbed(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-001")
+	t.Parallel()
 
 	t.Run("embed_fs_contains_static_assets", func(t *testing.T) {
 		assets := dashboard.Assets()
@@ -105,9 +107,7 @@ func TestDashboardSPAEmbed(t *testing.T) {
 	})
 
 	t.Run("shell_route_serves_html", func(t *testing.T) {
-		db := testDBForDashboard(t)
-		cfg := &config.Config{}
-		mux := NewDashboardMuxWithPath(db, cfg, "")
+		mux := sharedDashboardMux(t)
 
 		req := httptest.NewRequest("GET", "/app", nil)
 		rec := httptest.NewRecorder()
@@ -125,45 +125,32 @@ func TestDashboardSPAEmbed(t *testing.T) {
 		}
 	})
 
-	t.Run("static_route_serves_css", func(t *testing.T) {
-		db := testDBForDashboard(t)
-		cfg := &config.Config{}
-		mux := NewDashboardMuxWithPath(db, cfg, "")
+	t.Run("static_routes_serve_assets", func(t *testing.T) {
+		mux := sharedDashboardMux(t)
 
-		req := httptest.NewRequest("GET", "/static/styles.css", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-
-		if rec.Code != http.StatusOK {
-			t.Errorf("GET /static/styles.css status = %d, want 200", rec.Code)
-		}
-		body := rec.Body.String()
-		if !strings.Contains(body, ".nav-link") {
-			t.Error("styles.css should contain nav styles")
+		tests := []struct {
+			path string
+			want string
+		}{
+			{"/static/styles.css", ".nav-link"},
+			{"/static/app.js", "rtmxApp"},
 		}
-	})
-
-	t.Run("static_route_serves_js", func(t *testing.T) {
-		db := testDBForDashboard(t)
-		cfg := &config.Config{}
-		mux := NewDashboardMuxWithPath(db, cfg, "")
-
-		req := httptest.NewRequest("GET", "/static/app.js", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
+		for _, tt := range tests {
+			req := httptest.NewRequest("GET", tt.path, nil)
+			rec := httptest.NewRecorder()
+			mux.ServeHTTP(rec, req)
 
-		if rec.Code != http.StatusOK {
-			t.Errorf("GET /static/app.js status = %d, want 200", rec.Code)
-		}
-		if !strings.Contains(rec.Body.String(), "rtmxApp") {
-			t.Error("app.js should contain rtmxApp function")
+			if rec.Code != http.StatusOK {
+				t.Errorf("GET %s status = %d, want 200", tt.path, rec.Code)
+			}
+			if !strings.Contains(rec.Body.String(), tt.want) {
+				t.Errorf("GET %s should contain %q", tt.path, tt.want)
+			}
 		}
 	})
 
 	t.Run("partial_status_returns_html", func(t *testing.T) {
-		db := testDBForDashboard(t)
-		cfg := &config.Config{}
-		mux := NewDashboardMuxWithPath(db, cfg, "")
+		mux := sharedDashboardMux(t)
 
 		req := httptest.NewRequest("GET", "/partials/status", nil)
 		rec := httptest.NewRecorder()
@@ -182,9 +169,7 @@ func TestDashboardSPAEmbed(t *testing.T) {
 	})
 
 	t.Run("client_side_routing_pages", func(t *testing.T) {
-		db := testDBForDashboard(t)
-		cfg := &config.Config{}
-		mux := NewDashboardMuxWithPath(db, cfg, "")
+		mux := sharedDashboardMux(t)
 
 		pages := []string{"/requirements", "/graph", "/kanban", "/releases", "/health", "/agents"}
 		for _, page := range pages {
@@ -202,9 +187,7 @@ func TestDashboardSPAEmbed(t *testing.T) {
 	})
 
 	t.Run("api_and_dashboard_coexist", func(t *testing.T) {
-		db := testDBForDashboard(t)
-		cfg := &config.Config{}
-		mux := NewDashboardMuxWithPath(db, cfg, "")
+		mux := sharedDashboardMux(t)
 
 		// API endpoint still works
 		req := httptest.NewRequest("GET", "/api/health", nil)
@@ -227,6 +210,22 @@ func TestDashboardSPAEmbed(t *testing.T) {
 	})
 }
 
+var (
+	dashboardMuxOnce sync.Once
+	dashboardMux     http.Handler
+)
+
+// sharedDashboardMux returns a dashboard handler over testDBForDashboard. It
+// is built on first use and shared by the tests that only issue GET requests;
+// tests that modify requirements must build their own handler.
+func sharedDashboardMux(t *testing.T) http.Handler {
+	t.Helper()
+	dashboardMuxOnce.Do(func() {
+		dashboardMux = NewDashboardMuxWithPath(testDBForDashboard(t), &config.Config{}, "")
+	})
+	return dashboardMux
+}
+
 func testDBForDashboard(t *testing.T) *database.Database {
 	t.Helper()
 	db := database.NewDatabase()
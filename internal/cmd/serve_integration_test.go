@@ -4,6 +4,7 @@ import (
 	"net/http"
 	"net/http/httptest"
 	"strings"
+	"sync"
 	"testing"
 
 	"github.com/rtmx-ai/rtmx/internal/config"
@@ -41,12 +42,20 @@ func integrationDB(t *testing.T) *database.Database {
 	return db
 }
 
-// integrationMux creates a fully wired dashboard mux using registerDashboardRoutes
-// plus the API routes, matching production wiring in NewDashboardMuxWithPath.
-func integrationMux(t *testing.T, db *database.Database) http.Handler {
+var (
+	integrationMuxOnce sync.Once
+	integrationHandler http.Handler
+)
+
+// integrationMux returns a fully wired dashboard mux over integrationDB, using
+// the production wiring in NewDashboardMuxWithPath. It is built on first use
+// and shared by every integration test, all of which only issue GET requests.
+func integrationMux(t *testing.T) http.Handler {
 	t.Helper()
-	cfg := &config.Config{}
-	return NewDashboardMuxWithPath(db, cfg, "")
+	integrationMuxOnce.Do(func() {
+		integrationHandler = NewDashboardMuxWithPath(integrationDB(t), &config.Config{}, "")
+	})
+	return integrationHandler
 }
 
 // --------------------------------------------------------------------------
@@ -59,9 +68,9 @@ func integrationMux(t *testing.T, db *database.Database) http.Handler {
 // REQ-DASH-002: Requirements list partial with htmx dynamic updates.
 func TestHtmxPartialAttributes(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-001")
+	t.Parallel()
 
-	db := integrationDB(t)
-	mux := integrationMux(t, db)
+	mux := integrationMux(t)
 
 	t.Run("status_partial_has_structural_elements", func(t *testing.T) {
 		rec := httptest.NewRecorder()
@@ -263,38 +272,30 @@ func TestHtmxPartialAttributes(t *testing.T) {
 // REQ-DASH-001: Embedded SPA with htmx, Alpine.js, and Tailwind via embed.FS.
 func TestSPAShellIntegration(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-001")
+	t.Parallel()
 
-	db := integrationDB(t)
-	mux := integrationMux(t, db)
+	mux := integrationMux(t)
+
+	// The shell subtests all inspect the same page, so render it once.
+	shell := getPageBody(t, mux, "/app")
 
 	t.Run("shell_includes_htmx_script", func(t *testing.T) {
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, httptest.NewRequest("GET", "/app", nil))
-		if rec.Code != http.StatusOK {
-			t.Fatalf("status = %d, want 200", rec.Code)
-		}
-		body := rec.Body.String()
+		body := shell
 		assertContains(t, body, "htmx.org", "SPA shell must include htmx script tag")
 	})
 
 	t.Run("shell_includes_alpinejs_script", func(t *testing.T) {
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, httptest.NewRequest("GET", "/app", nil))
-		body := rec.Body.String()
+		body := shell
 		assertContains(t, body, "alpinejs", "SPA shell must include Alpine.js script tag")
 	})
 
 	t.Run("shell_includes_tailwind_css", func(t *testing.T) {
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, httptest.NewRequest("GET", "/app", nil))
-		body := rec.Body.String()
+		body := shell
 		assertContains(t, body, "tailwind", "SPA shell must include Tailwind CSS")
 	})
 
 	t.Run("shell_includes_all_nav_links", func(t *testing.T) {
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, httptest.NewRequest("GET", "/app", nil))
-		body := rec.Body.String()
+		body := shell
 
 		navLinks := []string{"Status", "Requirements", "Graph", "Kanban", "Releases", "Health", "Agents"}
 		for _, link := range navLinks {
@@ -315,9 +316,7 @@ func TestSPAShellIntegration(t *testing.T) {
 	})
 
 	t.Run("shell_pre_renders_initial_content", func(t *testing.T) {
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, httptest.NewRequest("GET", "/app", nil))
-		body := rec.Body.String()
+		body := shell
 
 		// The /app route pre-renders the status partial into the #content div
 		assertContains(t, body, "Project Status", "SPA shell should pre-render status content")
@@ -334,9 +333,7 @@ func TestSPAShellIntegration(t *testing.T) {
 	})
 
 	t.Run("shell_includes_alpine_rtmxapp_init", func(t *testing.T) {
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, httptest.NewRequest("GET", "/app", nil))
-		body := rec.Body.String()
+		body := shell
 
 		assertContains(t, body, `x-data="rtmxApp()"`, "SPA shell body should initialize rtmxApp() Alpine component")
 		assertContains(t, body, "/static/app.js", "SPA shell should include app.js script")
@@ -368,10 +365,9 @@ func TestSPAShellIntegration(t *testing.T) {
 // REQ-DASH-009: Auth middleware for API key/OAuth.
 func TestAuthIntegrationWithDashboard(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-009")
+	t.Parallel()
 
-	db := integrationDB(t)
-	cfg := &config.Config{}
-	baseMux := NewDashboardMuxWithPath(db, cfg, "")
+	baseMux := integrationMux(t)
 
 	t.Run("unauthenticated_rejected_with_api_key_auth", func(t *testing.T) {
 		authCfg := authConfig{Mode: "api-key", APIKey: "integration-test-key"}
@@ -473,9 +469,9 @@ func TestAuthIntegrationWithDashboard(t *testing.T) {
 // REQ-DASH-001, REQ-DASH-002, REQ-DASH-003, REQ-DASH-005.
 func TestPageWorkflowNavigation(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-002")
+	t.Parallel()
 
-	db := integrationDB(t)
-	mux := integrationMux(t, db)
+	mux := integrationMux(t)
 
 	// Step 1: User loads the SPA shell
 	t.Run("step1_load_shell", func(t *testing.T) {
@@ -628,14 +624,15 @@ func TestPageWorkflowNavigation(t *testing.T) {
 // REQ-DASH-005: Kanban board with drag-and-drop status transitions.
 func TestDashboardIntegrationKanbanDragDrop(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-005")
+	t.Parallel()
+
+	mux := integrationMux(t)
 
-	db := integrationDB(t)
-	mux := integrationMux(t, db)
+	// The drag-drop subtests all inspect the same partial, so render it once.
+	kanban := getPageBody(t, mux, "/partials/kanban")
 
 	t.Run("kanban_columns_have_data_status_attributes", func(t *testing.T) {
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, httptest.NewRequest("GET", "/partials/kanban", nil))
-		body := rec.Body.String()
+		body := kanban
 
 		// Each column needs data-status for the drop handler
 		for _, status := range []string{"NOT_STARTED", "MISSING", "PARTIAL", "COMPLETE"} {
@@ -644,18 +641,14 @@ func TestDashboardIntegrationKanbanDragDrop(t *testing.T) {
 	})
 
 	t.Run("kanban_cards_have_data_req_id", func(t *testing.T) {
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, httptest.NewRequest("GET", "/partials/kanban", nil))
-		body := rec.Body.String()
+		body := kanban
 
 		assertContains(t, body, `data-req-id="REQ-CLI-001"`, "kanban card should have data-req-id for CLI-001")
 		assertContains(t, body, `data-req-id="REQ-MCP-001"`, "kanban card should have data-req-id for MCP-001")
 	})
 
 	t.Run("kanban_drop_handler_calls_patch_api", func(t *testing.T) {
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, httptest.NewRequest("GET", "/partials/kanban", nil))
-		body := rec.Body.String()
+		body := kanban
 
 		// The JavaScript drop handler should call PATCH on the API endpoint
 		assertContains(t, body, "PATCH", "drop handler should issue PATCH request")
@@ -664,9 +657,7 @@ func TestDashboardIntegrationKanbanDragDrop(t *testing.T) {
 	})
 
 	t.Run("kanban_shows_priority_classes", func(t *testing.T) {
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, httptest.NewRequest("GET", "/partials/kanban", nil))
-		body := rec.Body.String()
+		body := kanban
 
 		// Priority classes for visual styling
 		assertContains(t, body, "pri-p0", "kanban should have P0 priority cards")
@@ -674,9 +665,7 @@ func TestDashboardIntegrationKanbanDragDrop(t *testing.T) {
 	})
 
 	t.Run("kanban_blocked_cards_visually_distinct", func(t *testing.T) {
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, httptest.NewRequest("GET", "/partials/kanban", nil))
-		body := rec.Body.String()
+		body := kanban
 
 		// MCP-002 is blocked (depends on incomplete MCP-001)
 		// API-001 is blocked (depends on incomplete MCP-001)
@@ -694,3 +683,15 @@ func assertContains(t *testing.T, body, substr, msg string) {
 		t.Errorf("%s: response body does not contain %q", msg, substr)
 	}
 }
+
+// getPageBody issues a GET for path against mux and returns the response body,
+// failing the test unless the handler responds with 200.
+func getPageBody(t *testing.T, mux http.Handler, path string) string {
+	t.Helper()
+	rec := httptest.NewRecorder()
+	mux.ServeHTTP(rec, httptest.NewRequest("GET", path, nil))
+	if rec.Code != http.StatusOK {
+		t.Fatalf("GET %s status = %d, want 200", path, rec.Code)
+	}
+	return rec.Body.String()
+}
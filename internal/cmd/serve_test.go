@@ -14,6 +14,9 @@ import (
 func TestServeCommand(t *testing.T) {
 	rtmx.Req(t, "REQ-GO-037")
 
+	// Read-only subtests against an empty database share one handler.
+	emptyMux := NewDashboardMux(database.NewDatabase(), &config.Config{})
+
 	t.Run("flags_registered", func(t *testing.T) {
 		// Verify flags exist on the real serveCmd
 		if serveCmd.Flags().Lookup("port") == nil {
@@ -64,9 +67,7 @@ func TestServeCommand(t *testing.T) {
 	})
 
 	t.Run("dashboard_mux_health_api", func(t *testing.T) {
-		db := database.NewDatabase()
-		cfg := &config.Config{}
-		mux := NewDashboardMux(db, cfg)
+		mux := emptyMux
 
 		req := httptest.NewRequest("GET", "/api/health", nil)
 		w := httptest.NewRecorder()
@@ -81,9 +82,7 @@ func TestServeCommand(t *testing.T) {
 	})
 
 	t.Run("dashboard_mux_html", func(t *testing.T) {
-		db := database.NewDatabase()
-		cfg := &config.Config{}
-		mux := NewDashboardMux(db, cfg)
+		mux := emptyMux
 
 		req := httptest.NewRequest("GET", "/", nil)
 		w := httptest.NewRecorder()
@@ -6,7 +6,6 @@ import (
 	"strings"
 	"testing"
 
-	"github.com/rtmx-ai/rtmx/internal/config"
 	"github.com/rtmx-ai/rtmx/pkg/rtmx"
 )
 
@@ -14,51 +13,40 @@ import (
 // REQ-DASH-008: WebSocket live updates (polling fallback via htmx).
 func TestDashboardWebSocket(t *testing.T) {
 	rtmx.Req(t, "REQ-DASH-008")
+	t.Parallel()
 
-	db := testDBForDashboard(t)
-	cfg := &config.Config{}
-	mux := NewDashboardMuxWithPath(db, cfg, "")
+	mux := sharedDashboardMux(t)
+
+	// The agents subtests all inspect the same partial, so fetch it once.
+	agentsRec := httptest.NewRecorder()
+	mux.ServeHTTP(agentsRec, httptest.NewRequest("GET", "/partials/agents", nil))
+	agentsBody := agentsRec.Body.String()
 
 	t.Run("agents_partial_has_polling_trigger", func(t *testing.T) {
 		// The agents partial uses hx-trigger="every 10s" as polling fallback
 		// for live updates until WebSocket is fully implemented.
-		req := httptest.NewRequest("GET", "/partials/agents", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-
-		if rec.Code != http.StatusOK {
-			t.Fatalf("status = %d, want 200", rec.Code)
+		if agentsRec.Code != http.StatusOK {
+			t.Fatalf("status = %d, want 200", agentsRec.Code)
 		}
-		body := rec.Body.String()
 
-		if !strings.Contains(body, `hx-trigger="every 10s"`) {
+		if !strings.Contains(agentsBody, `hx-trigger="every 10s"`) {
 			t.Error("agents partial should have hx-trigger='every 10s' for polling fallback")
 		}
 	})
 
 	t.Run("agents_partial_targets_content", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/agents", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-		body := rec.Body.String()
-
-		if !strings.Contains(body, `hx-get="/partials/agents"`) {
+		if !strings.Contains(agentsBody, `hx-get="/partials/agents"`) {
 			t.Error("agents partial should self-refresh via hx-get")
 		}
 	})
 
 	t.Run("agents_partial_returns_html", func(t *testing.T) {
-		req := httptest.NewRequest("GET", "/partials/agents", nil)
-		rec := httptest.NewRecorder()
-		mux.ServeHTTP(rec, req)
-
-		ct := rec.Header().Get("Content-Type")
+		ct := agentsRec.Header().Get("Content-Type")
 		if !strings.Contains(ct, "text/html") {
 			t.Errorf("Content-Type = %s, want text/html", ct)
 		}
 
-		body := rec.Body.String()
-		if !strings.Contains(body, "Agent Monitor") {
+		if !strings.Contains(agentsBody, "Agent Monitor") {
 			t.Error("agents partial should contain Agent Monitor heading")
 		}
 	})
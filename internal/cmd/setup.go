@@ -1,6 +1,7 @@
 package cmd
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"os"
@@ -10,19 +11,21 @@ import (
 	"time"
 
 	"github.com/rtmx-ai/rtmx/internal/config"
+	"github.com/rtmx-ai/rtmx/internal/database"
 	"github.com/rtmx-ai/rtmx/internal/output"
 	"github.com/spf13/cobra"
 )
 
 var (
-	setupDryRun      bool
-	setupMinimal     bool
-	setupForce       bool
-	setupSkipAgents  bool
-	setupSkipMakefile bool
-	setupBranch      bool
-	setupPR          bool
-	setupScaffold    bool
+	setupDryRun        bool
+	setupMinimal       bool
+	setupForce         bool
+	setupSkipAgents    bool
+	setupSkipMakefile  bool
+	setupBranch        bool
+	setupPR            bool
+	setupScaffold      bool
+	setupScaffoldForce bool
 )
 
 var setupCmd = &cobra.Command{
@@ -37,7 +40,8 @@ Examples:
     rtmx setup --minimal    # Just config and RTM database
     rtmx setup --branch     # Create git branch for review workflow
     rtmx setup --pr         # Create branch and pull request
-    rtmx setup --scaffold   # Generate spec files for all requirements`,
+    rtmx setup --scaffold   # Generate spec files for all requirements
+    rtmx setup --scaffold-force  # Also regenerate existing spec files`,
 	RunE: runSetup,
 }
 
@@ -50,6 +54,7 @@ func init() {
 	setupCmd.Flags().BoolVar(&setupBranch, "branch", false, "create git branch for isolation")
 	setupCmd.Flags().BoolVar(&setupPR, "pr", false, "create pull request after setup (implies --branch)")
 	setupCmd.Flags().BoolVar(&setupScaffold, "scaffold", false, "auto-generate requirement spec files from database entries")
+	setupCmd.Flags().BoolVar(&setupScaffoldForce, "scaffold-force", false, "overwrite existing requirement spec files when scaffolding (implies --scaffold)")
 
 	rootCmd.AddCommand(setupCmd)
 }
@@ -95,6 +100,11 @@ func runSetup(cmd *cobra.Command, args []string) error {
 		setupBranch = true
 	}
 
+	// If --scaffold-force specified, enable scaffolding
+	if setupScaffoldForce && !setupScaffold {
+		setupScaffold = true
+	}
+
 	cmd.Println(output.Header("RTMX Setup", 60))
 	cmd.Println()
 	cmd.Printf("Project: %s\n", cwd)
@@ -247,6 +257,8 @@ rtmx:
 	cmd.Println(output.SubHeader("Phase 3: RTM Database", 60))
 	dbRelPath2 := relPath(cwd, dbPath)
 	reqRelPath2 := reqRelPath
+	// Specs written by this run, which scaffolding must not replace.
+	writtenSpecs := make(map[string]struct{})
 
 	if detection["has_rtm_database"].(bool) && !setupForce {
 		cmd.Printf("  %s RTM database already exists\n", output.Color("[SKIP]", output.Dim))
@@ -294,6 +306,7 @@ RTMX has been integrated into this project for requirements traceability.
 `
 			if err := os.WriteFile(specPath, []byte(specContent), 0644); err == nil {
 				result.FilesCreated = append(result.FilesCreated, specPath)
+				writtenSpecs[specPath] = struct{}{}
 			}
 		}
 		cmd.Printf("  %s %s\n", output.Color("[CREATE]", output.Green), dbRelPath2)
@@ -302,6 +315,37 @@ RTMX has been integrated into this project for requirements traceability.
 	}
 	cmd.Println()
 
+	// Phase 3.5: Scaffold requirement specs (if requested)
+	if setupScaffold {
+		cmd.Println(output.SubHeader("Phase 3.5: Requirement Specs", 60))
+
+		if setupDryRun {
+			cmd.Printf("  %s Spec scaffolding (dry run)\n", output.Color("[SKIP]", output.Dim))
+		} else if db, err := database.Load(dbPath); err != nil {
+			cmd.Printf("  %s Could not load RTM database: %v\n", output.Color("[WARN]", output.Yellow), err)
+			result.Warnings = append(result.Warnings, fmt.Sprintf("Spec scaffolding skipped: %v", err))
+		} else {
+			scaffold := scaffoldAllSpecs(db, reqDir, cwd, setupScaffoldForce, writtenSpecs)
+			result.FilesCreated = append(result.FilesCreated, scaffold.Files...)
+			if scaffold.Created > 0 {
+				cmd.Printf("  %s %d spec files\n", output.Color("[CREATE]", output.Green), scaffold.Created)
+			}
+			if scaffold.Skipped > 0 {
+				cmd.Printf("  %s %d existing spec files\n", output.Color("[SKIP]", output.Dim), scaffold.Skipped)
+			}
+			if scaffold.Unchanged > 0 {
+				cmd.Printf("  %s %d spec files already up to date\n", output.Color("[SKIP]", output.Dim), scaffold.Unchanged)
+			}
+			if scaffold.Errors > 0 {
+				cmd.Printf("  %s %d spec files could not be written\n", output.Color("[FAIL]", output.Red), scaffold.Errors)
+				result.Errors = append(result.Errors, fmt.Sprintf("Spec scaffolding failed for %d requirements", scaffold.Errors))
+			} else {
+				result.StepsCompleted = append(result.StepsCompleted, "scaffold_specs")
+			}
+		}
+		cmd.Println()
+	}
+
 	// Phase 4: Scan tests for markers (if tests exist)
 	if detection["has_tests"].(bool) && !setupMinimal {
 		cmd.Println(output.SubHeader("Phase 4: Test Marker Scan", 60))
@@ -406,7 +450,7 @@ This project uses RTMX for requirements traceability.
 		makefilePath := filepath.Join(cwd, "Makefile")
 
 		content, err := os.ReadFile(makefilePath)
-		if err == nil && strings.Contains(strings.ToLower(string(content)), "rtmx") && strings.Contains(string(content), "rtm:") {
+		if err == nil && bytes.Contains(bytes.ToLower(content), []byte("rtmx")) && bytes.Contains(content, []byte("rtm:")) {
 			cmd.Printf("  %s Makefile already has rtmx targets\n", output.Color("[SKIP]", output.Dim))
 			result.StepsSkipped = append(result.StepsSkipped, "makefile")
 		} else {
@@ -692,7 +736,7 @@ func detectProject(path string) map[string]interface{} {
 			info["exists"] = true
 			content, err := os.ReadFile(agentPath)
 			if err == nil {
-				info["has_rtmx"] = strings.Contains(string(content), "RTMX") || strings.Contains(string(content), "rtmx")
+				info["has_rtmx"] = bytes.Contains(content, []byte("RTMX")) || bytes.Contains(content, []byte("rtmx"))
 			}
 		}
 
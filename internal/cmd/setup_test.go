@@ -1,6 +1,7 @@
 package cmd
 
 import (
+	"bytes"
 	"os"
 	"path/filepath"
 	"strings"
@@ -294,3 +295,104 @@ func TestSetupCommand(t *testing.T) {
 		t.Errorf("Setup command should not error in dry-run mode: %v", err)
 	}
 }
+
+func TestSetupCommandScaffold(t *testing.T) {
+	tmpDir := t.TempDir()
+	rtmxDir := filepath.Join(tmpDir, ".rtmx")
+	_ = os.MkdirAll(rtmxDir, 0755)
+	csv := "req_id,category,requirement_text,status,priority,phase\n" +
+		"REQ-CORE-001,CORE,Core requirement,MISSING,HIGH,1\n" +
+		"REQ-CLI-001,CLI,CLI requirement,PARTIAL,MEDIUM,2\n"
+	if err := os.WriteFile(filepath.Join(rtmxDir, "database.csv"), []byte(csv), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	origDir, _ := os.Getwd()
+	_ = os.Chdir(tmpDir)
+	defer func() { _ = os.Chdir(origDir) }()
+
+	setupDryRun = false
+	setupMinimal = true
+	setupBranch = false
+	setupPR = false
+	setupForce = false
+	setupSkipAgents = true
+	setupSkipMakefile = true
+	setupScaffold = true
+	defer func() { setupScaffold = false }()
+
+	if err := setupCmd.RunE(setupCmd, []string{}); err != nil {
+		t.Fatalf("Setup with --scaffold should not error: %v", err)
+	}
+
+	for _, spec := range []string{"CORE/REQ-CORE-001.md", "CLI/REQ-CLI-001.md"} {
+		if _, err := os.Stat(filepath.Join(rtmxDir, "requirements", spec)); err != nil {
+			t.Errorf("expected scaffolded spec %s: %v", spec, err)
+		}
+	}
+
+	// A second run finds every spec in place and must not report creating any.
+	var buf bytes.Buffer
+	setupCmd.SetOut(&buf)
+	defer setupCmd.SetOut(nil)
+	if err := setupCmd.RunE(setupCmd, []string{}); err != nil {
+		t.Fatalf("Second setup with --scaffold should not error: %v", err)
+	}
+	if out := buf.String(); strings.Contains(out, "[CREATE]") || !strings.Contains(out, "2 existing spec files") {
+		t.Errorf("expected only skipped specs on the second run, got:\n%s", out)
+	}
+}
+
+func TestSetupCommandForceScaffoldKeepsSpecs(t *testing.T) {
+	tests := []struct {
+		name          string
+		scaffoldForce bool
+	}{
+		{"force", false},
+		{"force and scaffold-force", true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			tmpDir := t.TempDir()
+			rtmxDir := filepath.Join(tmpDir, ".rtmx")
+			_ = os.MkdirAll(rtmxDir, 0755)
+			csv := "req_id,category,requirement_text,status,priority,phase\n" +
+				"REQ-CORE-001,CORE,Core requirement,MISSING,HIGH,1\n"
+			if err := os.WriteFile(filepath.Join(rtmxDir, "database.csv"), []byte(csv), 0644); err != nil {
+				t.Fatal(err)
+			}
+
+			origDir, _ := os.Getwd()
+			_ = os.Chdir(tmpDir)
+			defer func() { _ = os.Chdir(origDir) }()
+
+			setupDryRun = false
+			setupMinimal = true
+			setupBranch = false
+			setupPR = false
+			setupForce = true
+			setupSkipAgents = true
+			setupSkipMakefile = true
+			setupScaffold = true
+			setupScaffoldForce = tt.scaffoldForce
+			defer func() {
+				setupForce = false
+				setupScaffold = false
+				setupScaffoldForce = false
+			}()
+
+			if err := setupCmd.RunE(setupCmd, []string{}); err != nil {
+				t.Fatalf("Setup with --force --scaffold should not error: %v", err)
+			}
+
+			content, err := os.ReadFile(filepath.Join(rtmxDir, "requirements", "SETUP", "REQ-INIT-001.md"))
+			if err != nil {
+				t.Fatal(err)
+			}
+			if !strings.Contains(string(content), "# REQ-INIT-001: RTMX Integration Complete") {
+				t.Errorf("REQ-INIT-001 spec was overwritten by scaffolding:\n%s", content)
+			}
+		})
+	}
+}
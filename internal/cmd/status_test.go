@@ -9,6 +9,7 @@ import (
 	"testing"
 
 	"github.com/rtmx-ai/rtmx/internal/output"
+	"github.com/rtmx-ai/rtmx/internal/testutil"
 	"github.com/rtmx-ai/rtmx/pkg/rtmx"
 	"github.com/spf13/cobra"
 )
@@ -738,28 +739,10 @@ func TestStatusBarAlignment(t *testing.T) {
 		p0 := output.FormatPercent(0.0)
 
 		// Strip ANSI codes for length comparison
-		strip := func(s string) string {
-			result := ""
-			inEsc := false
-			for _, c := range s {
-				if c == '\033' {
-					inEsc = true
-					continue
-				}
-				if inEsc {
-					if c == 'm' {
-						inEsc = false
-					}
-					continue
-				}
-				result += string(c)
-			}
-			return result
-		}
-
-		if len(strip(p100)) != len(strip(p0)) {
-			t.Errorf("FormatPercent should produce fixed-width: 100.0%% len=%d, 0.0%% len=%d",
-				len(strip(p100)), len(strip(p0)))
+		n100 := len(testutil.StripANSIString(p100))
+		n0 := len(testutil.StripANSIString(p0))
+		if n100 != n0 {
+			t.Errorf("FormatPercent should produce fixed-width: 100.0%% len=%d, 0.0%% len=%d", n100, n0)
 		}
 	})
 
@@ -789,23 +772,28 @@ REQ-002,CLI,Feature two,MISSING,HIGH,1
 		_ = cmd.Execute()
 		out := buf.String()
 
-		// Count the bar characters. With MaxBarWidth=60, no line should have
-		// more than 60 consecutive bar chars (block elements).
-		for _, line := range strings.Split(out, "\n") {
-			barCount := 0
-			for _, c := range line {
-				if c == '\u2588' || c == '\u2591' { // filled or empty block
-					barCount++
-				} else {
-					if barCount > output.MaxBarWidth {
-						t.Errorf("bar width %d exceeds max %d in line: %s", barCount, output.MaxBarWidth, line)
-					}
-					barCount = 0
-				}
-			}
+		// Count the bar characters in a single pass over the output. With
+		// MaxBarWidth=60, no run of consecutive bar chars (block elements)
+		// may be longer than 60; any other rune, including a newline, ends
+		// the run. The offending line is only sliced out on failure.
+		barCount, lineStart := 0, 0
+		checkRun := func() {
 			if barCount > output.MaxBarWidth {
-				t.Errorf("bar width %d exceeds max %d", barCount, output.MaxBarWidth)
+				line, _, _ := strings.Cut(out[lineStart:], "\n")
+				t.Errorf("bar width %d exceeds max %d in line: %s", barCount, output.MaxBarWidth, line)
+			}
+			barCount = 0
+		}
+		for i, c := range out {
+			if c == '\u2588' || c == '\u2591' { // filled or empty block
+				barCount++
+				continue
+			}
+			checkRun()
+			if c == '\n' {
+				lineStart = i + 1
 			}
 		}
+		checkRun()
 	})
 }
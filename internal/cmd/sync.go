@@ -2,6 +2,7 @@ package cmd
 
 import (
 	"fmt"
+	"io"
 	"os"
 	"strings"
 
@@ -177,7 +178,7 @@ func runSync(cmd *cobra.Command, args []string) error {
 	}
 
 	// Print summary
-	printSyncSummary(result)
+	printSyncSummary(os.Stdout, result)
 
 	if len(result.Errors) > 0 {
 		return NewExitError(1, "sync completed with errors")
@@ -479,21 +480,21 @@ func runBidirectional(adapter adapters.ServiceAdapter, cfg *config.Config, confl
 	return result
 }
 
-func printSyncSummary(result *SyncResult) {
-	fmt.Printf("\n%sSync Summary:%s\n", output.Bold, output.Reset)
-	fmt.Printf("  %s\n", result.Summary())
+func printSyncSummary(w io.Writer, result *SyncResult) {
+	fmt.Fprintf(w, "\n%sSync Summary:%s\n", output.Bold, output.Reset)
+	fmt.Fprintf(w, "  %s\n", result.Summary())
 
 	if len(result.Conflicts) > 0 {
-		fmt.Printf("\n%sConflicts requiring attention:%s\n", output.Yellow, output.Reset)
+		fmt.Fprintf(w, "\n%sConflicts requiring attention:%s\n", output.Yellow, output.Reset)
 		for _, c := range result.Conflicts {
-			fmt.Printf("  • %s: %s\n", c.ID, c.Reason)
+			fmt.Fprintf(w, "  • %s: %s\n", c.ID, c.Reason)
 		}
 	}
 
 	if len(result.Errors) > 0 {
-		fmt.Printf("\n%sErrors:%s\n", output.Red, output.Reset)
+		fmt.Fprintf(w, "\n%sErrors:%s\n", output.Red, output.Reset)
 		for _, e := range result.Errors {
-			fmt.Printf("  • %s: %s\n", e.ID, e.Error)
+			fmt.Fprintf(w, "  • %s: %s\n", e.ID, e.Error)
 		}
 	}
 }
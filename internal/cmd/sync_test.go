@@ -1,6 +1,7 @@
 package cmd
 
 import (
+	"bytes"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -364,20 +365,10 @@ func TestGetAdapterJiraDisabled(t *testing.T) {
 // --- Tests for printSyncSummary ---
 
 func TestPrintSyncSummaryNoChanges(t *testing.T) {
-	// Capture stdout
-	oldStdout := os.Stdout
-	r, w, _ := os.Pipe()
-	os.Stdout = w
-
 	result := &SyncResult{}
-	printSyncSummary(result)
-
-	_ = w.Close()
-	os.Stdout = oldStdout
-
-	buf := make([]byte, 4096)
-	n, _ := r.Read(buf)
-	output := string(buf[:n])
+	var buf bytes.Buffer
+	printSyncSummary(&buf, result)
+	output := buf.String()
 
 	if !strings.Contains(output, "No changes") {
 		t.Errorf("expected 'No changes' in output, got: %s", output)
@@ -388,24 +379,15 @@ func TestPrintSyncSummaryNoChanges(t *testing.T) {
 }
 
 func TestPrintSyncSummaryWithConflicts(t *testing.T) {
-	oldStdout := os.Stdout
-	r, w, _ := os.Pipe()
-	os.Stdout = w
-
 	result := &SyncResult{
 		Updated: []string{"REQ-001"},
 		Conflicts: []SyncConflict{
 			{ID: "REQ-002", Reason: "Status conflict: COMPLETE vs MISSING"},
 		},
 	}
-	printSyncSummary(result)
-
-	_ = w.Close()
-	os.Stdout = oldStdout
-
-	buf := make([]byte, 4096)
-	n, _ := r.Read(buf)
-	output := string(buf[:n])
+	var buf bytes.Buffer
+	printSyncSummary(&buf, result)
+	output := buf.String()
 
 	if !strings.Contains(output, "Conflicts requiring attention") {
 		t.Errorf("expected conflicts section in output, got: %s", output)
@@ -416,23 +398,14 @@ func TestPrintSyncSummaryWithConflicts(t *testing.T) {
 }
 
 func TestPrintSyncSummaryWithErrors(t *testing.T) {
-	oldStdout := os.Stdout
-	r, w, _ := os.Pipe()
-	os.Stdout = w
-
 	result := &SyncResult{
 		Errors: []SyncError{
 			{ID: "REQ-003", Error: "connection timeout"},
 		},
 	}
-	printSyncSummary(result)
-
-	_ = w.Close()
-	os.Stdout = oldStdout
-
-	buf := make([]byte, 4096)
-	n, _ := r.Read(buf)
-	output := string(buf[:n])
+	var buf bytes.Buffer
+	printSyncSummary(&buf, result)
+	output := buf.String()
 
 	if !strings.Contains(output, "Errors") {
 		t.Errorf("expected errors section in output, got: %s", output)
@@ -9,6 +9,7 @@ import (
 	"io"
 	"io/fs"
 	"net/http"
+	"sync"
 )
 
 //go:embed static templates
@@ -43,7 +44,7 @@ type LayoutData struct {
 
 // RenderLayout renders the base layout template with the given data.
 func RenderLayout(w io.Writer, data LayoutData) error {
-	tmpl, err := template.ParseFS(assets, "templates/layout.html")
+	tmpl, err := parseTemplate("templates/layout.html")
 	if err != nil {
 		return err
 	}
@@ -52,10 +53,31 @@ func RenderLayout(w io.Writer, data LayoutData) error {
 
 // RenderPartial renders a named partial template.
 func RenderPartial(w io.Writer, name string, data interface{}) error {
-	path := "templates/partials/" + name + ".html"
-	tmpl, err := template.ParseFS(assets, path)
+	tmpl, err := parseTemplate("templates/partials/" + name + ".html")
 	if err != nil {
 		return err
 	}
 	return tmpl.Execute(w, data)
 }
+
+var (
+	templatesMu sync.Mutex
+	templates   = make(map[string]*template.Template)
+)
+
+// parseTemplate returns the embedded template at path, parsing it on first
+// use. The templates are compiled into the binary, so a parsed template never
+// goes stale and can be executed concurrently by every request.
+func parseTemplate(path string) (*template.Template, error) {
+	templatesMu.Lock()
+	defer templatesMu.Unlock()
+	if tmpl, ok := templates[path]; ok {
+		return tmpl, nil
+	}
+	tmpl, err := template.ParseFS(assets, path)
+	if err != nil {
+		return nil, err
+	}
+	templates[path] = tmpl
+	return tmpl, nil
+}
@@ -190,17 +190,25 @@ func TestDatabaseUpdate(t *testing.T) {
 	}
 }
 
+// coverageReq builds a requirement from NewRequirement's defaults, varying
+// only the fields the aggregation tests group, filter and sort by.
+func coverageReq(id, category string, phase int, status Status, priority Priority) *Requirement {
+	req := NewRequirement(id)
+	req.Category = category
+	req.Phase = phase
+	req.Status = status
+	req.Priority = priority
+	return req
+}
+
 // TestPriorityCounts tests the PriorityCounts method.
 func TestPriorityCounts(t *testing.T) {
 	db := NewDatabase()
 
 	reqs := []*Requirement{
-		{ReqID: "REQ-001", Category: "A", Status: StatusComplete, Priority: PriorityHigh,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-002", Category: "A", Status: StatusMissing, Priority: PriorityHigh,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-003", Category: "B", Status: StatusComplete, Priority: PriorityLow,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
+		coverageReq("REQ-001", "A", 0, StatusComplete, PriorityHigh),
+		coverageReq("REQ-002", "A", 0, StatusMissing, PriorityHigh),
+		coverageReq("REQ-003", "B", 0, StatusComplete, PriorityLow),
 	}
 	for _, req := range reqs {
 		_ = db.Add(req)
@@ -220,12 +228,9 @@ func TestCategories(t *testing.T) {
 	db := NewDatabase()
 
 	reqs := []*Requirement{
-		{ReqID: "REQ-001", Category: "CLI", Status: StatusComplete, Priority: PriorityHigh,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-002", Category: "DATA", Status: StatusMissing, Priority: PriorityMedium,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-003", Category: "CLI", Status: StatusPartial, Priority: PriorityLow,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
+		coverageReq("REQ-001", "CLI", 0, StatusComplete, PriorityHigh),
+		coverageReq("REQ-002", "DATA", 0, StatusMissing, PriorityMedium),
+		coverageReq("REQ-003", "CLI", 0, StatusPartial, PriorityLow),
 	}
 	for _, req := range reqs {
 		_ = db.Add(req)
@@ -246,14 +251,10 @@ func TestPhases(t *testing.T) {
 	db := NewDatabase()
 
 	reqs := []*Requirement{
-		{ReqID: "REQ-001", Category: "A", Phase: 2, Status: StatusComplete, Priority: PriorityHigh,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-002", Category: "A", Phase: 1, Status: StatusMissing, Priority: PriorityMedium,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-003", Category: "B", Phase: 2, Status: StatusPartial, Priority: PriorityLow,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-004", Category: "B", Phase: 0, Status: StatusMissing, Priority: PriorityMedium,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
+		coverageReq("REQ-001", "A", 2, StatusComplete, PriorityHigh),
+		coverageReq("REQ-002", "A", 1, StatusMissing, PriorityMedium),
+		coverageReq("REQ-003", "B", 2, StatusPartial, PriorityLow),
+		coverageReq("REQ-004", "B", 0, StatusMissing, PriorityMedium),
 	}
 	for _, req := range reqs {
 		_ = db.Add(req)
@@ -274,12 +275,9 @@ func TestByCategory(t *testing.T) {
 	db := NewDatabase()
 
 	reqs := []*Requirement{
-		{ReqID: "REQ-001", Category: "CLI", Status: StatusComplete, Priority: PriorityHigh,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-002", Category: "DATA", Status: StatusMissing, Priority: PriorityMedium,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-003", Category: "CLI", Status: StatusPartial, Priority: PriorityLow,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
+		coverageReq("REQ-001", "CLI", 0, StatusComplete, PriorityHigh),
+		coverageReq("REQ-002", "DATA", 0, StatusMissing, PriorityMedium),
+		coverageReq("REQ-003", "CLI", 0, StatusPartial, PriorityLow),
 	}
 	for _, req := range reqs {
 		_ = db.Add(req)
@@ -299,12 +297,9 @@ func TestByPhase(t *testing.T) {
 	db := NewDatabase()
 
 	reqs := []*Requirement{
-		{ReqID: "REQ-001", Category: "A", Phase: 1, Status: StatusComplete, Priority: PriorityHigh,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-002", Category: "A", Phase: 2, Status: StatusMissing, Priority: PriorityMedium,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-003", Category: "B", Phase: 1, Status: StatusPartial, Priority: PriorityLow,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
+		coverageReq("REQ-001", "A", 1, StatusComplete, PriorityHigh),
+		coverageReq("REQ-002", "A", 2, StatusMissing, PriorityMedium),
+		coverageReq("REQ-003", "B", 1, StatusPartial, PriorityLow),
 	}
 	for _, req := range reqs {
 		_ = db.Add(req)
@@ -324,12 +319,9 @@ func TestIncompleteAndComplete(t *testing.T) {
 	db := NewDatabase()
 
 	reqs := []*Requirement{
-		{ReqID: "REQ-001", Category: "A", Status: StatusComplete, Priority: PriorityHigh,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-002", Category: "A", Status: StatusMissing, Priority: PriorityMedium,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-003", Category: "B", Status: StatusPartial, Priority: PriorityLow,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
+		coverageReq("REQ-001", "A", 0, StatusComplete, PriorityHigh),
+		coverageReq("REQ-002", "A", 0, StatusMissing, PriorityMedium),
+		coverageReq("REQ-003", "B", 0, StatusPartial, PriorityLow),
 	}
 	for _, req := range reqs {
 		_ = db.Add(req)
@@ -351,14 +343,10 @@ func TestBacklog(t *testing.T) {
 	db := NewDatabase()
 
 	reqs := []*Requirement{
-		{ReqID: "REQ-001", Category: "A", Status: StatusComplete, Priority: PriorityHigh, Phase: 1,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-002", Category: "A", Status: StatusMissing, Priority: PriorityLow, Phase: 2,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-003", Category: "B", Status: StatusPartial, Priority: PriorityP0, Phase: 1,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
-		{ReqID: "REQ-004", Category: "B", Status: StatusMissing, Priority: PriorityP0, Phase: 2,
-			Dependencies: make(StringSet), Blocks: make(StringSet), Extra: make(map[string]string)},
+		coverageReq("REQ-001", "A", 1, StatusComplete, PriorityHigh),
+		coverageReq("REQ-002", "A", 2, StatusMissing, PriorityLow),
+		coverageReq("REQ-003", "B", 1, StatusPartial, PriorityP0),
+		coverageReq("REQ-004", "B", 2, StatusMissing, PriorityP0),
 	}
 	for _, req := range reqs {
 		_ = db.Add(req)
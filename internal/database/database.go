@@ -31,6 +31,22 @@ func NewDatabase() *Database {
 	}
 }
 
+// NewDatabaseFrom creates a database holding reqs in the given order. The
+// index is sized once up front, so this is the cheapest way to build a
+// database whose contents are already known.
+func NewDatabaseFrom(reqs ...*Requirement) (*Database, error) {
+	db := &Database{
+		requirements: make(map[string]*Requirement, len(reqs)),
+		order:        make([]string, 0, len(reqs)),
+	}
+	for _, req := range reqs {
+		if err := db.Add(req); err != nil {
+			return nil, err
+		}
+	}
+	return db, nil
+}
+
 // Path returns the file path this database was loaded from.
 func (db *Database) Path() string {
 	return db.path
@@ -362,10 +378,8 @@ func (db *Database) ByVersion() map[string][]*Requirement {
 // FilteredCopy returns a new Database containing only requirements matching the filter.
 // The copy is not linked to the original file path.
 func (db *Database) FilteredCopy(opts FilterOptions) *Database {
-	filtered := NewDatabase()
-	for _, req := range db.Filter(opts) {
-		_ = filtered.Add(req)
-	}
+	// Requirement IDs are already unique, so this cannot fail.
+	filtered, _ := NewDatabaseFrom(db.Filter(opts)...)
 	return filtered
 }
 
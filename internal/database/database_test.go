@@ -2,7 +2,10 @@ package database
 
 import (
 	"bytes"
+	"os"
+	"path/filepath"
 	"strings"
+	"sync"
 	"testing"
 
 	"github.com/rtmx-ai/rtmx/pkg/rtmx"
@@ -201,6 +204,23 @@ func TestDatabase(t *testing.T) {
 	}
 }
 
+func TestNewDatabaseFrom(t *testing.T) {
+	db, err := NewDatabaseFrom(NewRequirement("REQ-002"), NewRequirement("REQ-001"))
+	if err != nil {
+		t.Fatalf("NewDatabaseFrom failed: %v", err)
+	}
+	if ids := db.IDs(); len(ids) != 2 || ids[0] != "REQ-002" || ids[1] != "REQ-001" {
+		t.Errorf("IDs = %v, want given order", ids)
+	}
+
+	if _, err := NewDatabaseFrom(NewRequirement("REQ-001"), NewRequirement("REQ-001")); err == nil {
+		t.Error("NewDatabaseFrom should fail for duplicate ID")
+	}
+	if _, err := NewDatabaseFrom(NewRequirement("")); err == nil {
+		t.Error("NewDatabaseFrom should fail for empty ID")
+	}
+}
+
 func TestDatabaseFilter(t *testing.T) {
 	db := NewDatabase()
 
@@ -399,24 +419,59 @@ func TestCSVRoundTrip(t *testing.T) {
 	}
 }
 
-func TestLoadRealDatabase(t *testing.T) {
-	// Try multiple paths to find the database
-	paths := []string{
-		".rtmx/database.csv",
-		"../../.rtmx/database.csv", // From internal/database/
-	}
-
-	var db *Database
-	var err error
-	for _, path := range paths {
-		db, err = Load(path)
-		if err == nil {
-			break
+// realDatabasePaths are the locations the project's RTM database is looked
+// up from, relative to the repository root and to this package's directory.
+var realDatabasePaths = []string{
+	".rtmx/database.csv",
+	"../../.rtmx/database.csv", // From internal/database/
+}
+
+// realDatabasePath returns the first existing realDatabasePaths entry. It
+// only stats the candidates, so tests that need the path alone never parse
+// the CSV. The test is skipped when no database is found.
+func realDatabasePath(t *testing.T) string {
+	t.Helper()
+	for _, path := range realDatabasePaths {
+		if info, err := os.Stat(path); err == nil && !info.IsDir() {
+			return path
 		}
 	}
-	if err != nil {
-		t.Skipf("Skipping real database test: %v", err)
+	t.Skip("Skipping real database test: no .rtmx/database.csv found")
+	return ""
+}
+
+var (
+	realDBOnce sync.Once
+	realDB     *Database
+	realDBErr  error
+)
+
+// realDatabase returns the project's own RTM database. It is parsed once per
+// test binary and shared, so callers must not modify it; use cloneDatabase
+// for a copy that can be changed.
+func realDatabase(t *testing.T) *Database {
+	t.Helper()
+	path := realDatabasePath(t)
+	realDBOnce.Do(func() {
+		realDB, realDBErr = Load(path)
+	})
+	if realDBErr != nil {
+		t.Skipf("Skipping real database test: %v", realDBErr)
+	}
+	return realDB
+}
+
+// cloneDatabase returns a deep copy of db.
+func cloneDatabase(db *Database) *Database {
+	clone := NewDatabase()
+	for _, req := range db.All() {
+		_ = clone.Add(req.Clone())
 	}
+	return clone
+}
+
+func TestLoadRealDatabase(t *testing.T) {
+	db := realDatabase(t)
 
 	// Verify we loaded some requirements
 	if db.Len() == 0 {
@@ -448,6 +503,44 @@ func TestLoadRealDatabase(t *testing.T) {
 	t.Logf("Completion: %.1f%%", pct)
 }
 
+func TestFindRealDatabase(t *testing.T) {
+	// Only the path is needed here, so the CSV is never parsed.
+	path := realDatabasePath(t)
+	root := filepath.Dir(filepath.Dir(path))
+
+	found, err := FindDatabase(root)
+	if err != nil {
+		t.Fatalf("FindDatabase(%q) error: %v", root, err)
+	}
+	if filepath.Clean(found) != filepath.Clean(path) {
+		t.Errorf("FindDatabase(%q) = %q, want %q", root, found, path)
+	}
+}
+
+func TestRealDatabaseReciprocityFixes(t *testing.T) {
+	t.Parallel()
+
+	shared := realDatabase(t)
+	before := len(shared.ReciprocityViolations())
+
+	db := cloneDatabase(shared)
+	for _, v := range db.ReciprocityViolations() {
+		req := db.Get(v.ReqID)
+		if v.Kind == MissingBlock {
+			req.Blocks.Add(v.Missing)
+		} else {
+			req.Dependencies.Add(v.Missing)
+		}
+	}
+
+	if remaining := db.ReciprocityViolations(); len(remaining) != 0 {
+		t.Errorf("expected applying every fix to leave no violations, got %v", remaining)
+	}
+	if after := len(shared.ReciprocityViolations()); after != before {
+		t.Errorf("shared database was modified: %d violations before, %d after", before, after)
+	}
+}
+
 func TestNormalizeColumnName(t *testing.T) {
 	tests := []struct {
 		input    string
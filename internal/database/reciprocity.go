@@ -0,0 +1,47 @@
+package database
+
+// ReciprocityKind identifies which side of a dependency edge is missing.
+type ReciprocityKind string
+
+const (
+	// MissingBlock means a dependency is not mirrored by a blocks entry:
+	// A depends on B, but B does not block A.
+	MissingBlock ReciprocityKind = "add_block"
+	// MissingDependency means a blocks entry is not mirrored by a dependency:
+	// A blocks B, but B does not depend on A.
+	MissingDependency ReciprocityKind = "add_dep"
+)
+
+// ReciprocityViolation describes a dependency edge without its reciprocal.
+// ReqID is the requirement that needs updating and Missing is the ID that
+// should be added to its Blocks or Dependencies, according to Kind.
+type ReciprocityViolation struct {
+	ReqID   string          `json:"req_id"`
+	Missing string          `json:"missing"`
+	Kind    ReciprocityKind `json:"kind"`
+}
+
+// ReciprocityViolations returns every dependency and blocks edge whose
+// reciprocal is missing. Edges pointing at requirements that are not in the
+// database are ignored. Missing blocks are reported first, then missing
+// dependencies, each in database order.
+func (db *Database) ReciprocityViolations() []ReciprocityViolation {
+	reqs := db.All()
+
+	var violations []ReciprocityViolation
+	for _, req := range reqs {
+		for _, dep := range req.Dependencies.Slice() {
+			if other := db.Get(dep); other != nil && !other.Blocks.Contains(req.ReqID) {
+				violations = append(violations, ReciprocityViolation{ReqID: dep, Missing: req.ReqID, Kind: MissingBlock})
+			}
+		}
+	}
+	for _, req := range reqs {
+		for _, blocked := range req.Blocks.Slice() {
+			if other := db.Get(blocked); other != nil && !other.Dependencies.Contains(req.ReqID) {
+				violations = append(violations, ReciprocityViolation{ReqID: blocked, Missing: req.ReqID, Kind: MissingDependency})
+			}
+		}
+	}
+	return violations
+}
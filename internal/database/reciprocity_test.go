@@ -0,0 +1,93 @@
+package database
+
+import (
+	"reflect"
+	"strings"
+	"testing"
+
+	"github.com/rtmx-ai/rtmx/pkg/rtmx"
+)
+
+func reciprocityTestDB(t *testing.T, reqs ...*Requirement) *Database {
+	t.Helper()
+	db, err := NewDatabaseFrom(reqs...)
+	if err != nil {
+		t.Fatalf("NewDatabaseFrom failed: %v", err)
+	}
+	return db
+}
+
+func reciprocityReq(id string, deps, blocks []string) *Requirement {
+	req := NewRequirement(id)
+	req.Dependencies = NewStringSet(deps...)
+	req.Blocks = NewStringSet(blocks...)
+	return req
+}
+
+func TestReciprocityViolations(t *testing.T) {
+	rtmx.Req(t, "REQ-GO-021")
+	t.Parallel()
+
+	// One database holds every pattern under its own ID prefix, so the
+	// violations are computed once and each case inspects its own slice.
+	db := reciprocityTestDB(t,
+		reciprocityReq("REQ-OK-A", []string{"REQ-OK-B"}, nil),
+		reciprocityReq("REQ-OK-B", nil, []string{"REQ-OK-A"}),
+		reciprocityReq("REQ-DWB-A", []string{"REQ-DWB-B"}, nil),
+		reciprocityReq("REQ-DWB-B", nil, nil),
+		reciprocityReq("REQ-BWD-A", nil, []string{"REQ-BWD-B"}),
+		reciprocityReq("REQ-BWD-B", nil, nil),
+		reciprocityReq("REQ-DNE-A", []string{"REQ-DNE-GONE"}, nil),
+		reciprocityReq("REQ-BNE-A", nil, []string{"REQ-BNE-GONE"}),
+	)
+	violations := db.ReciprocityViolations()
+
+	tests := []struct {
+		name   string
+		prefix string
+		want   []ReciprocityViolation
+	}{
+		{"reciprocal", "REQ-OK-", nil},
+		{"dependency without block", "REQ-DWB-", []ReciprocityViolation{{ReqID: "REQ-DWB-B", Missing: "REQ-DWB-A", Kind: MissingBlock}}},
+		{"block without dependency", "REQ-BWD-", []ReciprocityViolation{{ReqID: "REQ-BWD-B", Missing: "REQ-BWD-A", Kind: MissingDependency}}},
+		{"depends on nonexistent", "REQ-DNE-", nil},
+		{"blocks nonexistent", "REQ-BNE-", nil},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var got []ReciprocityViolation
+			for _, v := range violations {
+				if strings.HasPrefix(v.ReqID, tt.prefix) {
+					got = append(got, v)
+				}
+			}
+			if !reflect.DeepEqual(got, tt.want) {
+				t.Errorf("violations for %s = %+v, want %+v", tt.prefix, got, tt.want)
+			}
+		})
+	}
+
+	if got := NewDatabase().ReciprocityViolations(); len(got) != 0 {
+		t.Errorf("empty database: expected no violations, got %+v", got)
+	}
+}
+
+func TestReciprocityViolationsOrdering(t *testing.T) {
+	rtmx.Req(t, "REQ-GO-021")
+	t.Parallel()
+
+	db := reciprocityTestDB(t,
+		reciprocityReq("REQ-A", nil, []string{"REQ-C"}),
+		reciprocityReq("REQ-B", []string{"REQ-A", "REQ-C"}, nil),
+		reciprocityReq("REQ-C", nil, nil),
+	)
+	want := []ReciprocityViolation{
+		{ReqID: "REQ-A", Missing: "REQ-B", Kind: MissingBlock},
+		{ReqID: "REQ-C", Missing: "REQ-B", Kind: MissingBlock},
+		{ReqID: "REQ-C", Missing: "REQ-A", Kind: MissingDependency},
+	}
+	if got := db.ReciprocityViolations(); !reflect.DeepEqual(got, want) {
+		t.Errorf("expected missing blocks before missing dependencies:\ngot  %+v\nwant %+v", got, want)
+	}
+}
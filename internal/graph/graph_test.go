@@ -1,6 +1,7 @@
 package graph
 
 import (
+	"strings"
 	"testing"
 
 	"github.com/rtmx-ai/rtmx/internal/database"
@@ -8,8 +9,6 @@ import (
 )
 
 func createTestDB() *database.Database {
-	db := database.NewDatabase()
-
 	// Create a simple dependency graph:
 	// A -> B -> D
 	// A -> C -> D
@@ -30,15 +29,12 @@ func createTestDB() *database.Database {
 
 	for _, req := range reqs {
 		req.Extra = make(map[string]string)
-		_ = db.Add(req)
 	}
-
+	db, _ := database.NewDatabaseFrom(reqs...)
 	return db
 }
 
 func createCyclicDB() *database.Database {
-	db := database.NewDatabase()
-
 	// Create a cycle: A -> B -> C -> A
 	reqs := []*database.Requirement{
 		{ReqID: "A", Category: "TEST", Status: database.StatusMissing, Priority: database.PriorityHigh,
@@ -51,9 +47,8 @@ func createCyclicDB() *database.Database {
 
 	for _, req := range reqs {
 		req.Extra = make(map[string]string)
-		_ = db.Add(req)
 	}
-
+	db, _ := database.NewDatabaseFrom(reqs...)
 	return db
 }
 
@@ -167,6 +162,8 @@ func TestIsBlocked(t *testing.T) {
 }
 
 func TestFindCyclesNone(t *testing.T) {
+	t.Parallel()
+
 	db := createTestDB()
 	g := NewGraph(db)
 
@@ -180,21 +177,68 @@ func TestFindCyclesNone(t *testing.T) {
 	}
 }
 
+// createMultiCycleDB holds several independent components, one per cycle
+// detection case, so a single FindCycles pass serves every case:
+// a 2-cycle (C2A <-> C2B), a 3-cycle (C3A -> C3B -> C3C -> C3A),
+// and an acyclic chain (AC1 -> AC2 -> AC3).
+func createMultiCycleDB() *database.Database {
+	deps := []struct {
+		id   string
+		deps []string
+	}{
+		{"C2A", []string{"C2B"}},
+		{"C2B", []string{"C2A"}},
+		{"C3A", []string{"C3C"}},
+		{"C3B", []string{"C3A"}},
+		{"C3C", []string{"C3B"}},
+		{"AC1", nil},
+		{"AC2", []string{"AC1"}},
+		{"AC3", []string{"AC2"}},
+	}
+	reqs := make([]*database.Requirement, len(deps))
+	for i, d := range deps {
+		reqs[i] = &database.Requirement{ReqID: d.id, Category: "TEST", Status: database.StatusMissing,
+			Dependencies: database.NewStringSet(d.deps...), Blocks: database.NewStringSet(),
+			Extra: make(map[string]string)}
+	}
+	db, _ := database.NewDatabaseFrom(reqs...)
+	return db
+}
+
 func TestFindCyclesPresent(t *testing.T) {
-	db := createCyclicDB()
-	g := NewGraph(db)
+	t.Parallel()
 
+	g := NewGraph(createMultiCycleDB())
 	cycles := g.FindCycles()
-	if len(cycles) != 1 {
-		t.Errorf("Should have 1 cycle, got %d", len(cycles))
-	}
 
 	if !g.HasCycles() {
 		t.Error("HasCycles should return true")
 	}
+	if len(cycles) != 2 {
+		t.Errorf("Should have 2 cycles, got %d: %v", len(cycles), cycles)
+	}
 
-	if len(cycles) > 0 && len(cycles[0]) != 3 {
-		t.Errorf("Cycle should have 3 members, got %d", len(cycles[0]))
+	tests := []struct {
+		prefix  string
+		members int // expected cycle size; 0 means no cycle
+	}{
+		{"C2", 2},
+		{"C3", 3},
+		{"AC", 0},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.prefix, func(t *testing.T) {
+			var found []string
+			for _, cycle := range cycles {
+				if strings.HasPrefix(cycle[0], tt.prefix) {
+					found = cycle
+				}
+			}
+			if len(found) != tt.members {
+				t.Errorf("Cycle for %s should have %d members, got %v", tt.prefix, tt.members, found)
+			}
+		})
 	}
 }
 
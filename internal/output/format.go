@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"os"
 	"strings"
+	"sync/atomic"
 )
 
 // ANSI color codes
@@ -40,13 +41,29 @@ func IsColorEnabled() bool {
 	return useColor && isTerminal()
 }
 
+// terminalCheck records whether a given stdout file is a terminal.
+type terminalCheck struct {
+	file     *os.File
+	terminal bool
+}
+
+// stdoutTerminal caches the last isTerminal result. Color consults it for
+// every string it decorates, so the stat is done once per stdout file
+// instead of once per call; replacing os.Stdout triggers a fresh check.
+var stdoutTerminal atomic.Pointer[terminalCheck]
+
 // isTerminal checks if stdout is a terminal.
 func isTerminal() bool {
-	info, err := os.Stdout.Stat()
-	if err != nil {
-		return false
+	f := os.Stdout
+	if c := stdoutTerminal.Load(); c != nil && c.file == f {
+		return c.terminal
+	}
+	terminal := false
+	if info, err := f.Stat(); err == nil {
+		terminal = info.Mode()&os.ModeCharDevice != 0
 	}
-	return info.Mode()&os.ModeCharDevice != 0
+	stdoutTerminal.Store(&terminalCheck{file: f, terminal: terminal})
+	return terminal
 }
 
 // Color applies a color to text if color is enabled.
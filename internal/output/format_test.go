@@ -1,6 +1,8 @@
 package output
 
 import (
+	"os"
+	"runtime"
 	"testing"
 
 	"github.com/rtmx-ai/rtmx/pkg/rtmx"
@@ -113,3 +115,35 @@ func TestFormatPercent(t *testing.T) {
 		}
 	}
 }
+
+func TestIsTerminalRechecksReplacedStdout(t *testing.T) {
+	if runtime.GOOS == "windows" {
+		t.Skip("os.DevNull is not a character device on windows")
+	}
+	orig := os.Stdout
+	defer func() { os.Stdout = orig }()
+
+	devNull, err := os.OpenFile(os.DevNull, os.O_WRONLY, 0)
+	if err != nil {
+		t.Fatalf("open %s: %v", os.DevNull, err)
+	}
+	defer func() { _ = devNull.Close() }()
+	r, w, err := os.Pipe()
+	if err != nil {
+		t.Fatalf("pipe: %v", err)
+	}
+	defer func() { _ = r.Close(); _ = w.Close() }()
+
+	os.Stdout = devNull
+	if !isTerminal() {
+		t.Errorf("isTerminal() = false for %s, want true (character device)", os.DevNull)
+	}
+	os.Stdout = w
+	if isTerminal() {
+		t.Error("isTerminal() = true for a pipe, want false")
+	}
+	os.Stdout = devNull
+	if !isTerminal() {
+		t.Errorf("isTerminal() = false after switching back to %s, want true", os.DevNull)
+	}
+}
@@ -135,22 +135,29 @@ func displayWidth(s string) int {
 	return utf8.RuneCountInString(stripped)
 }
 
-// stripANSI removes ANSI escape codes from a string.
+// stripANSI removes ANSI escape codes from a string. Escape sequences are
+// pure ASCII, so it scans bytes in a single pass; strings without an escape
+// byte are returned as-is without allocating.
 func stripANSI(s string) string {
+	if strings.IndexByte(s, '\033') < 0 {
+		return s
+	}
 	var result strings.Builder
+	result.Grow(len(s))
 	inEscape := false
-	for _, r := range s {
-		if r == '\033' {
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		if c == '\033' {
 			inEscape = true
 			continue
 		}
 		if inEscape {
-			if (r >= 'a' && r <= 'z') || (r >= 'A' && r <= 'Z') {
+			if (c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z') {
 				inEscape = false
 			}
 			continue
 		}
-		result.WriteRune(r)
+		result.WriteByte(c)
 	}
 	return result.String()
 }
@@ -98,6 +98,7 @@ func TestStripANSI(t *testing.T) {
 		{"\033[32mgreen\033[0m", "green"},
 		{"\033[1;31mred bold\033[0m", "red bold"},
 		{"no codes", "no codes"},
+		{"\033[33m✓ done\033[0m – ok", "✓ done – ok"},
 	}
 
 	for _, tt := range tests {
@@ -1,12 +1,27 @@
 package results
 
 import (
+	"fmt"
 	"strings"
 	"testing"
 
 	"github.com/rtmx-ai/rtmx/pkg/rtmx"
 )
 
+// Marker options shared by the unit tests in this package.
+var (
+	unitNominalMarkers = []rtmx.Option{
+		rtmx.Scope("unit"),
+		rtmx.Technique("nominal"),
+		rtmx.Env("simulation"),
+	}
+	unitBoundaryMarkers = []rtmx.Option{
+		rtmx.Scope("unit"),
+		rtmx.Technique("boundary"),
+		rtmx.Env("simulation"),
+	}
+)
+
 // REQ-VERIFY-002: RTMX Results JSON Schema Validation
 
 func TestResultsSchemaValidation(t *testing.T) {
@@ -52,11 +67,7 @@ func TestResultsSchemaValidation(t *testing.T) {
 }
 
 func TestParseValidResultsMinimal(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-VERIFY-002", unitNominalMarkers...)
 
 	input := `[
 		{
@@ -88,11 +99,7 @@ func TestParseValidResultsMinimal(t *testing.T) {
 }
 
 func TestParseValidResultsAllFields(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-VERIFY-002", unitNominalMarkers...)
 
 	input := `[
 		{
@@ -139,11 +146,7 @@ func TestParseValidResultsAllFields(t *testing.T) {
 }
 
 func TestParseMultipleResults(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-VERIFY-002", unitNominalMarkers...)
 
 	input := `[
 		{
@@ -176,11 +179,7 @@ func TestParseMultipleResults(t *testing.T) {
 }
 
 func TestParseEmptyArray(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("boundary"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-VERIFY-002", unitBoundaryMarkers...)
 
 	results, err := Parse(strings.NewReader("[]"))
 	if err != nil {
@@ -192,11 +191,7 @@ func TestParseEmptyArray(t *testing.T) {
 }
 
 func TestParseInvalidJSON(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("boundary"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-VERIFY-002", unitBoundaryMarkers...)
 
 	_, err := Parse(strings.NewReader("not json"))
 	if err == nil {
@@ -205,11 +200,7 @@ func TestParseInvalidJSON(t *testing.T) {
 }
 
 func TestValidateValidResults(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-VERIFY-002", unitNominalMarkers...)
 
 	results := []Result{
 		{
@@ -229,187 +220,68 @@ func TestValidateValidResults(t *testing.T) {
 	}
 }
 
-func TestValidateInvalidReqID(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("boundary"),
-		rtmx.Env("simulation"),
-	)
-
-	results := []Result{
-		{
-			Marker: Marker{
-				ReqID:    "INVALID-ID",
-				TestName: "test_foo",
-				TestFile: "test.py",
-			},
-			Passed: true,
-		},
-	}
-
-	errs := Validate(results)
-	if len(errs) == 0 {
-		t.Fatal("Validate() expected errors for invalid req_id")
-	}
-	found := false
-	for _, e := range errs {
-		if strings.Contains(e.Error(), "req_id") {
-			found = true
-			break
-		}
-	}
-	if !found {
-		t.Errorf("Validate() errors should mention req_id: %v", errs)
-	}
+// invalidFieldCases holds one result per schema violation. They are
+// validated together in a single pass; each error is attributed back to its
+// case by the result[i] prefix.
+var invalidFieldCases = []struct {
+	name   string
+	field  string
+	marker Marker
+}{
+	{"InvalidReqID", "req_id", Marker{ReqID: "INVALID-ID", TestName: "test_foo", TestFile: "test.py"}},
+	{"MissingTestName", "test_name", Marker{ReqID: "REQ-AUTH-001", TestFile: "test.py"}},
+	{"MissingTestFile", "test_file", Marker{ReqID: "REQ-AUTH-001", TestName: "test_foo"}},
+	{"InvalidScope", "scope", Marker{ReqID: "REQ-AUTH-001", TestName: "test_foo", TestFile: "test.py", Scope: "not_a_valid_scope"}},
+	{"InvalidTechnique", "technique", Marker{ReqID: "REQ-AUTH-001", TestName: "test_foo", TestFile: "test.py", Technique: "invalid_technique"}},
+	{"InvalidEnv", "env", Marker{ReqID: "REQ-AUTH-001", TestName: "test_foo", TestFile: "test.py", Env: "invalid_env"}},
 }
 
-func TestValidateMissingTestName(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("boundary"),
-		rtmx.Env("simulation"),
-	)
-
-	results := []Result{
-		{
-			Marker: Marker{
-				ReqID:    "REQ-AUTH-001",
-				TestFile: "test.py",
-			},
-			Passed: true,
-		},
-	}
-
-	errs := Validate(results)
-	if len(errs) == 0 {
-		t.Fatal("Validate() expected errors for missing test_name")
-	}
-	found := false
-	for _, e := range errs {
-		if strings.Contains(e.Error(), "test_name") {
-			found = true
-			break
-		}
-	}
-	if !found {
-		t.Errorf("Validate() errors should mention test_name: %v", errs)
-	}
-}
-
-func TestValidateMissingTestFile(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("boundary"),
-		rtmx.Env("simulation"),
-	)
+func TestValidateInvalidFields(t *testing.T) {
+	rtmx.Req(t, "REQ-VERIFY-002", unitBoundaryMarkers...)
 
-	results := []Result{
-		{
-			Marker: Marker{
-				ReqID:    "REQ-AUTH-001",
-				TestName: "test_foo",
-			},
-			Passed: true,
-		},
+	results := make([]Result, len(invalidFieldCases))
+	for i, tc := range invalidFieldCases {
+		results[i] = Result{Marker: tc.marker, Passed: true}
 	}
 
 	errs := Validate(results)
-	if len(errs) == 0 {
-		t.Fatal("Validate() expected errors for missing test_file")
+	if len(errs) != len(invalidFieldCases) {
+		t.Fatalf("Validate() got %d errors, want %d: %v", len(errs), len(invalidFieldCases), errs)
 	}
-}
-
-func TestValidateInvalidScope(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("boundary"),
-		rtmx.Env("simulation"),
-	)
 
-	results := []Result{
-		{
-			Marker: Marker{
-				ReqID:    "REQ-AUTH-001",
-				TestName: "test_foo",
-				TestFile: "test.py",
-				Scope:    "not_a_valid_scope",
-			},
-			Passed: true,
-		},
+	// Validate delegates to ValidateWithVocabulary with an empty vocabulary;
+	// both must report the same errors for the same batch.
+	withVocab := ValidateWithVocabulary(results, Vocabulary{})
+	if len(withVocab) != len(errs) {
+		t.Fatalf("ValidateWithVocabulary() got %d errors, Validate() got %d", len(withVocab), len(errs))
 	}
-
-	errs := Validate(results)
-	if len(errs) == 0 {
-		t.Fatal("Validate() expected errors for invalid scope")
-	}
-	found := false
-	for _, e := range errs {
-		if strings.Contains(e.Error(), "scope") {
-			found = true
-			break
+	for i := range errs {
+		if withVocab[i].Error() != errs[i].Error() {
+			t.Errorf("error %d: ValidateWithVocabulary() = %q, Validate() = %q", i, withVocab[i], errs[i])
 		}
 	}
-	if !found {
-		t.Errorf("Validate() errors should mention scope: %v", errs)
-	}
-}
-
-func TestValidateInvalidTechnique(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("boundary"),
-		rtmx.Env("simulation"),
-	)
-
-	results := []Result{
-		{
-			Marker: Marker{
-				ReqID:     "REQ-AUTH-001",
-				TestName:  "test_foo",
-				TestFile:  "test.py",
-				Technique: "invalid_technique",
-			},
-			Passed: true,
-		},
-	}
 
-	errs := Validate(results)
-	if len(errs) == 0 {
-		t.Fatal("Validate() expected errors for invalid technique")
-	}
-}
-
-func TestValidateInvalidEnv(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("boundary"),
-		rtmx.Env("simulation"),
-	)
-
-	results := []Result{
-		{
-			Marker: Marker{
-				ReqID:    "REQ-AUTH-001",
-				TestName: "test_foo",
-				TestFile: "test.py",
-				Env:      "invalid_env",
-			},
-			Passed: true,
-		},
-	}
-
-	errs := Validate(results)
-	if len(errs) == 0 {
-		t.Fatal("Validate() expected errors for invalid env")
+	for i, tc := range invalidFieldCases {
+		t.Run(tc.name, func(t *testing.T) {
+			prefix := fmt.Sprintf("result[%d]: ", i)
+			var msgs []string
+			for _, e := range errs {
+				if strings.HasPrefix(e.Error(), prefix) {
+					msgs = append(msgs, e.Error())
+				}
+			}
+			if len(msgs) != 1 {
+				t.Fatalf("got %d errors for %s, want 1: %v", len(msgs), tc.name, msgs)
+			}
+			if !strings.Contains(msgs[0], tc.field) {
+				t.Errorf("error should mention %s: %s", tc.field, msgs[0])
+			}
+		})
 	}
 }
 
 func TestValidateOptionalFieldsOmitted(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-VERIFY-002", unitNominalMarkers...)
 
 	// All optional fields empty - should be valid
 	results := []Result{
@@ -474,11 +346,7 @@ func TestParseAndValidateRoundTrip(t *testing.T) {
 }
 
 func TestGroupByRequirement(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-002",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-VERIFY-002", unitNominalMarkers...)
 
 	results := []Result{
 		{Marker: Marker{ReqID: "REQ-AUTH-001", TestName: "test_a", TestFile: "t.py"}, Passed: true},
@@ -503,11 +371,7 @@ func TestGroupByRequirement(t *testing.T) {
 // Covers the v0.2.4 bug where flat-form payloads silently produced
 // zero-valued markers, plus the new strictness on unknown fields.
 func TestResultUnmarshalForms(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-004",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-VERIFY-004", unitNominalMarkers...)
 
 	tests := []struct {
 		name        string
@@ -616,11 +480,7 @@ func TestResultUnmarshalForms(t *testing.T) {
 // TestParseRejectsUnknownFieldArray ensures Parse propagates the strict
 // per-element decode error for the v0.2.4 bug repro shape with a typo.
 func TestParseRejectsUnknownFieldArray(t *testing.T) {
-	rtmx.Req(t, "REQ-VERIFY-004",
-		rtmx.Scope("unit"),
-		rtmx.Technique("nominal"),
-		rtmx.Env("simulation"),
-	)
+	rtmx.Req(t, "REQ-VERIFY-004", unitNominalMarkers...)
 
 	input := `[{"reqid":"REQ-X-1","test_name":"t","test_file":"t.go","passed":true}]`
 	if _, err := Parse(strings.NewReader(input)); err == nil {
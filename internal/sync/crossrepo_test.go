@@ -9,6 +9,18 @@ import (
 	"github.com/rtmx-ai/rtmx/pkg/rtmx"
 )
 
+// Marker options shared by the cross-repository move and clone tests.
+var (
+	integrationNominalMarkers = []rtmx.Option{
+		rtmx.Scope("integration"),
+		rtmx.Technique("nominal"),
+	}
+	integrationErrorMarkers = []rtmx.Option{
+		rtmx.Scope("integration"),
+		rtmx.Technique("error"),
+	}
+)
+
 // setupTestProject creates a temp directory with .rtmx/database.csv containing the given requirements.
 // Returns the project dir path.
 func setupTestProject(t *testing.T, reqs []*database.Requirement) string {
@@ -57,10 +69,7 @@ func loadTestDB(t *testing.T, dir string) *database.Database {
 }
 
 func TestMoveRequirement(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", integrationNominalMarkers...)
 
 	srcReq := database.NewRequirement("REQ-SRC-001")
 	srcReq.Category = "CORE"
@@ -125,10 +134,7 @@ func TestMoveRequirement(t *testing.T) {
 }
 
 func TestMoveRequirementWithIDOverride(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", integrationNominalMarkers...)
 
 	srcReq := database.NewRequirement("REQ-SRC-001")
 	srcReq.Category = "CORE"
@@ -166,10 +172,7 @@ func TestMoveRequirementWithIDOverride(t *testing.T) {
 }
 
 func TestCloneRequirement(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", integrationNominalMarkers...)
 
 	srcReq := database.NewRequirement("REQ-SRC-001")
 	srcReq.Category = "CORE"
@@ -227,10 +230,7 @@ func TestCloneRequirement(t *testing.T) {
 }
 
 func TestCloneRequirementPreservesOriginal(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", integrationNominalMarkers...)
 
 	srcReq := database.NewRequirement("REQ-SRC-001")
 	srcReq.Category = "CORE"
@@ -268,10 +268,7 @@ func TestCloneRequirementPreservesOriginal(t *testing.T) {
 }
 
 func TestDryRunMove(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", integrationNominalMarkers...)
 
 	srcReq := database.NewRequirement("REQ-SRC-001")
 	srcReq.Category = "CORE"
@@ -309,10 +306,7 @@ func TestDryRunMove(t *testing.T) {
 }
 
 func TestDryRunClone(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", integrationNominalMarkers...)
 
 	srcReq := database.NewRequirement("REQ-SRC-001")
 	srcReq.Category = "CORE"
@@ -344,10 +338,7 @@ func TestDryRunClone(t *testing.T) {
 }
 
 func TestMoveErrorNotRtmxEnabled(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("error"),
-	)
+	rtmx.Req(t, "REQ-GO-075", integrationErrorMarkers...)
 
 	srcReq := database.NewRequirement("REQ-SRC-001")
 	srcReq.Category = "CORE"
@@ -370,10 +361,7 @@ func TestMoveErrorNotRtmxEnabled(t *testing.T) {
 }
 
 func TestMoveErrorRequirementNotFound(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("error"),
-	)
+	rtmx.Req(t, "REQ-GO-075", integrationErrorMarkers...)
 
 	srcDir := setupTestProject(t, nil) // empty database
 	dstDir := setupTestProject(t, nil)
@@ -392,10 +380,7 @@ func TestMoveErrorRequirementNotFound(t *testing.T) {
 }
 
 func TestCloneErrorRequirementNotFound(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("error"),
-	)
+	rtmx.Req(t, "REQ-GO-075", integrationErrorMarkers...)
 
 	srcDir := setupTestProject(t, nil)
 	dstDir := setupTestProject(t, nil)
@@ -414,10 +399,7 @@ func TestCloneErrorRequirementNotFound(t *testing.T) {
 }
 
 func TestMoveRequirementWithSpecFile(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", integrationNominalMarkers...)
 
 	srcReq := database.NewRequirement("REQ-SRC-001")
 	srcReq.Category = "CORE"
@@ -462,10 +444,7 @@ func TestMoveRequirementWithSpecFile(t *testing.T) {
 }
 
 func TestCloneWithIDOverride(t *testing.T) {
-	rtmx.Req(t, "REQ-GO-075",
-		rtmx.Scope("integration"),
-		rtmx.Technique("nominal"),
-	)
+	rtmx.Req(t, "REQ-GO-075", integrationNominalMarkers...)
 
 	srcReq := database.NewRequirement("REQ-SRC-001")
 	srcReq.Category = "CORE"
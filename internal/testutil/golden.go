@@ -5,6 +5,7 @@ import (
 	"flag"
 	"os"
 	"path/filepath"
+	"strings"
 	"testing"
 )
 
@@ -83,7 +84,10 @@ func StripANSI(data []byte) []byte {
 
 // StripANSIString removes ANSI escape codes from a string.
 func StripANSIString(s string) string {
-	var result []byte
+	if strings.IndexByte(s, '\033') < 0 {
+		return s
+	}
+	result := make([]byte, 0, len(s))
 	inEscape := false
 	for i := 0; i < len(s); i++ {
 		if s[i] == '\033' {
@@ -32,7 +32,7 @@ func TestTUIAgentMonitor(t *testing.T) {
 	})
 
 	t.Run("no_dbpath_shows_no_active", func(t *testing.T) {
-		db, _ := testDB(t)
+		db := newTestDB()
 		v := NewAgentsView(db, "")
 		v.SetSize(120, 30)
 		view := v.View()
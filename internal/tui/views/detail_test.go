@@ -15,7 +15,7 @@ import (
 func TestTUIDetailPane(t *testing.T) {
 	rtmx.Req(t, "REQ-TUI-003")
 
-	db, _ := testDB(t)
+	db := newTestDB()
 	g := graph.NewGraph(db)
 
 	t.Run("empty_shows_select_prompt", func(t *testing.T) {
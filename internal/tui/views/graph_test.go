@@ -17,7 +17,7 @@ import (
 func TestTUIGraphView(t *testing.T) {
 	rtmx.Req(t, "REQ-TUI-004")
 
-	db, _ := testDB(t)
+	db := newTestDB()
 	g := graph.NewGraph(db)
 
 	t.Run("renders_header_with_counts", func(t *testing.T) {
@@ -13,8 +13,8 @@ import (
 	"github.com/rtmx-ai/rtmx/pkg/rtmx"
 )
 
-func testDB(t *testing.T) (*database.Database, string) {
-	t.Helper()
+// newTestDB builds the in-memory fixture database shared by the view tests.
+func newTestDB() *database.Database {
 	db := database.NewDatabase()
 	reqs := []*database.Requirement{
 		{ReqID: "REQ-CLI-001", Category: "CLI", RequirementText: "Build CLI framework", Status: database.StatusComplete, Priority: database.PriorityP0, Phase: 1, EffortWeeks: 1.0},
@@ -32,6 +32,15 @@ func testDB(t *testing.T) (*database.Database, string) {
 	db.Get("REQ-CLI-001").Blocks.Add("REQ-CLI-002")
 	db.Get("REQ-MCP-002").Dependencies.Add("REQ-MCP-001")
 	db.Get("REQ-MCP-001").Blocks.Add("REQ-MCP-002")
+	return db
+}
+
+// testDB returns the fixture database saved to a fresh .rtmx/database.csv, for
+// views that read or write the file. Views that only render db should use
+// newTestDB and skip the disk write.
+func testDB(t *testing.T) (*database.Database, string) {
+	t.Helper()
+	db := newTestDB()
 
 	tmpDir := t.TempDir()
 	rtmxDir := filepath.Join(tmpDir, ".rtmx")
@@ -47,7 +56,7 @@ func testDB(t *testing.T) (*database.Database, string) {
 func TestTUIRequirementsTable(t *testing.T) {
 	rtmx.Req(t, "REQ-TUI-002")
 
-	db, _ := testDB(t)
+	db := newTestDB()
 	g := graph.NewGraph(db)
 
 	t.Run("renders_column_headers", func(t *testing.T) {
@@ -5,7 +5,6 @@ import (
 	"os"
 	"os/exec"
 	"path/filepath"
-	"runtime"
 	"strings"
 	"testing"
 
@@ -20,7 +19,7 @@ import (
 func TestCommandSurface(t *testing.T) {
 	rtmx.Req(t, "REQ-GO-020")
 
-	binaryPath := buildTestBinary(t)
+	binaryPath := buildBinary(t)
 	projectRoot := findTestProjectRoot(t)
 
 	// Get all registered top-level commands from the real rootCmd
@@ -196,30 +195,6 @@ func TestCommandSurface(t *testing.T) {
 	})
 }
 
-// buildTestBinary builds the rtmx binary and returns the path.
-func buildTestBinary(t *testing.T) string {
-	t.Helper()
-	tmpDir := t.TempDir()
-	name := "rtmx"
-	if runtime.GOOS == "windows" {
-		name = "rtmx.exe"
-	}
-	binaryPath := filepath.Join(tmpDir, name)
-
-	wd, _ := os.Getwd()
-	projectRoot := filepath.Dir(wd)
-	if _, err := os.Stat(filepath.Join(projectRoot, "cmd/rtmx")); err != nil {
-		projectRoot = wd
-	}
-
-	buildCmd := exec.Command("go", "build", "-o", binaryPath, "./cmd/rtmx")
-	buildCmd.Dir = projectRoot
-	if out, err := buildCmd.CombinedOutput(); err != nil {
-		t.Fatalf("failed to build binary: %v\n%s", err, out)
-	}
-	return binaryPath
-}
-
 // findTestProjectRoot locates the project root directory.
 func findTestProjectRoot(t *testing.T) string {
 	t.Helper()
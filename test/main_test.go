@@ -0,0 +1,55 @@
+package test
+
+import (
+	"fmt"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"sync"
+	"testing"
+)
+
+// The rtmx binary is built once per test run and shared by every test that
+// executes it; TestMain removes it after all tests have finished.
+var (
+	sharedBinaryOnce sync.Once
+	sharedBinaryDir  string
+	sharedBinaryPath string
+	sharedBinaryErr  error
+)
+
+func TestMain(m *testing.M) {
+	code := m.Run()
+	if sharedBinaryDir != "" {
+		_ = os.RemoveAll(sharedBinaryDir)
+	}
+	os.Exit(code)
+}
+
+// buildBinary returns the path to an rtmx binary built from ./cmd/rtmx. The
+// binary is compiled on first use and reused afterwards, so callers must not
+// modify or remove it. Tests that need the binary are skipped with -short.
+func buildBinary(t *testing.T) string {
+	t.Helper()
+	if testing.Short() {
+		t.Skip("skipping end-to-end test that builds the rtmx binary in short mode")
+	}
+	sharedBinaryOnce.Do(func() {
+		sharedBinaryDir, sharedBinaryErr = os.MkdirTemp("", "rtmx-test-bin")
+		if sharedBinaryErr != nil {
+			return
+		}
+		binaryPath := filepath.Join(sharedBinaryDir, binaryName())
+		buildCmd := exec.Command("go", "build", "-o", binaryPath, "./cmd/rtmx")
+		buildCmd.Dir = findTestProjectRoot(t)
+		if output, err := buildCmd.CombinedOutput(); err != nil {
+			sharedBinaryErr = fmt.Errorf("%w\n%s", err, output)
+			return
+		}
+		sharedBinaryPath = binaryPath
+	})
+	if sharedBinaryErr != nil {
+		t.Fatalf("Failed to build binary: %v", sharedBinaryErr)
+	}
+	return sharedBinaryPath
+}
@@ -8,30 +8,6 @@ import (
 	"testing"
 )
 
-// buildBinary builds the rtmx binary and returns the path. Skips the test on failure.
-func buildBinary(t *testing.T) string {
-	t.Helper()
-	tmpDir, err := os.MkdirTemp("", "rtmx-onboard-bin")
-	if err != nil {
-		t.Fatalf("Failed to create temp dir: %v", err)
-	}
-	t.Cleanup(func() { _ = os.RemoveAll(tmpDir) })
-
-	binaryPath := filepath.Join(tmpDir, binaryName())
-	wd, _ := os.Getwd()
-	projectRoot := filepath.Dir(wd)
-	if _, err := os.Stat(filepath.Join(projectRoot, "cmd/rtmx")); err != nil {
-		projectRoot = wd
-	}
-
-	buildCmd := exec.Command("go", "build", "-o", binaryPath, "./cmd/rtmx")
-	buildCmd.Dir = projectRoot
-	if output, err := buildCmd.CombinedOutput(); err != nil {
-		t.Fatalf("Failed to build binary: %v\n%s", err, output)
-	}
-	return binaryPath
-}
-
 // runRtmx runs the rtmx binary in the given directory with the given args.
 func runRtmx(t *testing.T, binary, dir string, args ...string) (string, error) {
 	t.Helper()
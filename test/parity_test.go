@@ -2,9 +2,7 @@ package test
 
 import (
 	"bytes"
-	"os"
 	"os/exec"
-	"path/filepath"
 	"runtime"
 	"strings"
 	"testing"
@@ -24,29 +22,8 @@ func binaryName() string {
 // REQ-GO-020: Go CLI v1.0.0 shall achieve full feature parity
 func TestFullParity(t *testing.T) {
 	rtmx.Req(t, "REQ-GO-020")
-	// Build the Go CLI binary
-	tmpDir, err := os.MkdirTemp("", "rtmx-parity-test")
-	if err != nil {
-		t.Fatalf("Failed to create temp dir: %v", err)
-	}
-	defer func() { _ = os.RemoveAll(tmpDir) }()
-
-	binaryPath := filepath.Join(tmpDir, binaryName())
-	buildCmd := exec.Command("go", "build", "-o", binaryPath, "../cmd/rtmx")
-	buildCmd.Dir = filepath.Dir(tmpDir)
-
-	// Get the actual project root
-	wd, _ := os.Getwd()
-	projectRoot := filepath.Dir(wd)
-	if _, err := os.Stat(filepath.Join(projectRoot, "cmd/rtmx")); err != nil {
-		projectRoot = wd
-	}
-
-	buildCmd = exec.Command("go", "build", "-o", binaryPath, "./cmd/rtmx")
-	buildCmd.Dir = projectRoot
-	if output, err := buildCmd.CombinedOutput(); err != nil {
-		t.Fatalf("Failed to build Go CLI: %v\n%s", err, output)
-	}
+	binaryPath := buildBinary(t)
+	projectRoot := findTestProjectRoot(t)
 
 	// Test command availability - all these commands must exist and work
 	commands := []struct {
@@ -122,25 +99,8 @@ func TestFullParity(t *testing.T) {
 // TestStatusParity validates status command output format
 func TestStatusParity(t *testing.T) {
 	// Build binary
-	tmpDir, err := os.MkdirTemp("", "rtmx-status-parity")
-	if err != nil {
-		t.Fatalf("Failed to create temp dir: %v", err)
-	}
-	defer func() { _ = os.RemoveAll(tmpDir) }()
-
-	binaryPath := filepath.Join(tmpDir, binaryName())
-
-	wd, _ := os.Getwd()
-	projectRoot := filepath.Dir(wd)
-	if _, err := os.Stat(filepath.Join(projectRoot, "cmd/rtmx")); err != nil {
-		projectRoot = wd
-	}
-
-	buildCmd := exec.Command("go", "build", "-o", binaryPath, "./cmd/rtmx")
-	buildCmd.Dir = projectRoot
-	if output, err := buildCmd.CombinedOutput(); err != nil {
-		t.Fatalf("Failed to build: %v\n%s", err, output)
-	}
+	binaryPath := buildBinary(t)
+	projectRoot := findTestProjectRoot(t)
 
 	// Run status command
 	cmd := exec.Command(binaryPath, "status")
@@ -169,25 +129,8 @@ func TestStatusParity(t *testing.T) {
 
 // TestBacklogParity validates backlog command output format
 func TestBacklogParity(t *testing.T) {
-	tmpDir, err := os.MkdirTemp("", "rtmx-backlog-parity")
-	if err != nil {
-		t.Fatalf("Failed to create temp dir: %v", err)
-	}
-	defer func() { _ = os.RemoveAll(tmpDir) }()
-
-	binaryPath := filepath.Join(tmpDir, binaryName())
-
-	wd, _ := os.Getwd()
-	projectRoot := filepath.Dir(wd)
-	if _, err := os.Stat(filepath.Join(projectRoot, "cmd/rtmx")); err != nil {
-		projectRoot = wd
-	}
-
-	buildCmd := exec.Command("go", "build", "-o", binaryPath, "./cmd/rtmx")
-	buildCmd.Dir = projectRoot
-	if output, err := buildCmd.CombinedOutput(); err != nil {
-		t.Fatalf("Failed to build: %v\n%s", err, output)
-	}
+	binaryPath := buildBinary(t)
+	projectRoot := findTestProjectRoot(t)
 
 	// Run backlog command
 	cmd := exec.Command(binaryPath, "backlog")
@@ -211,25 +154,8 @@ func TestBacklogParity(t *testing.T) {
 
 // TestHealthParity validates health command output format
 func TestHealthParity(t *testing.T) {
-	tmpDir, err := os.MkdirTemp("", "rtmx-health-parity")
-	if err != nil {
-		t.Fatalf("Failed to create temp dir: %v", err)
-	}
-	defer func() { _ = os.RemoveAll(tmpDir) }()
-
-	binaryPath := filepath.Join(tmpDir, binaryName())
-
-	wd, _ := os.Getwd()
-	projectRoot := filepath.Dir(wd)
-	if _, err := os.Stat(filepath.Join(projectRoot, "cmd/rtmx")); err != nil {
-		projectRoot = wd
-	}
-
-	buildCmd := exec.Command("go", "build", "-o", binaryPath, "./cmd/rtmx")
-	buildCmd.Dir = projectRoot
-	if output, err := buildCmd.CombinedOutput(); err != nil {
-		t.Fatalf("Failed to build: %v\n%s", err, output)
-	}
+	binaryPath := buildBinary(t)
+	projectRoot := findTestProjectRoot(t)
 
 	// Run health command
 	cmd := exec.Command(binaryPath, "health")
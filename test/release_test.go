@@ -17,26 +17,8 @@ import (
 // REQ-GO-073: Go CLI v0.1.0 release signals architectural transition from Python
 func TestV010Release(t *testing.T) {
 	rtmx.Req(t, "REQ-GO-073")
-	// Build the Go CLI binary
-	tmpDir, err := os.MkdirTemp("", "rtmx-release-test")
-	if err != nil {
-		t.Fatalf("Failed to create temp dir: %v", err)
-	}
-	defer func() { _ = os.RemoveAll(tmpDir) }()
-
-	binaryPath := filepath.Join(tmpDir, binaryName())
-
-	wd, _ := os.Getwd()
-	projectRoot := filepath.Dir(wd)
-	if _, err := os.Stat(filepath.Join(projectRoot, "cmd/rtmx")); err != nil {
-		projectRoot = wd
-	}
-
-	buildCmd := exec.Command("go", "build", "-o", binaryPath, "./cmd/rtmx")
-	buildCmd.Dir = projectRoot
-	if output, err := buildCmd.CombinedOutput(); err != nil {
-		t.Fatalf("Failed to build Go CLI: %v\n%s", err, output)
-	}
+	binaryPath := buildBinary(t)
+	projectRoot := findTestProjectRoot(t)
 
 	// Test 1: Binary exists and is executable
 	t.Run("binary_exists", func(t *testing.T) {
@@ -169,26 +151,8 @@ func TestV010ReleaseNotes(t *testing.T) {
 func TestV1Release(t *testing.T) {
 	rtmx.Req(t, "REQ-GO-047")
 
-	// Build the Go CLI binary
-	tmpDir, err := os.MkdirTemp("", "rtmx-v1-release-test")
-	if err != nil {
-		t.Fatalf("Failed to create temp dir: %v", err)
-	}
-	defer func() { _ = os.RemoveAll(tmpDir) }()
-
-	binaryPath := filepath.Join(tmpDir, binaryName())
-
-	wd, _ := os.Getwd()
-	projectRoot := filepath.Dir(wd)
-	if _, err := os.Stat(filepath.Join(projectRoot, "cmd/rtmx")); err != nil {
-		projectRoot = wd
-	}
-
-	buildCmd := exec.Command("go", "build", "-o", binaryPath, "./cmd/rtmx")
-	buildCmd.Dir = projectRoot
-	if output, err := buildCmd.CombinedOutput(); err != nil {
-		t.Fatalf("Failed to build Go CLI: %v\n%s", err, output)
-	}
+	binaryPath := buildBinary(t)
+	projectRoot := findTestProjectRoot(t)
 
 	// Test 1: Binary builds and is executable
 	t.Run("binary_builds", func(t *testing.T) {
@@ -37,19 +37,36 @@ func TestUnitCoverage(t *testing.T) {
 		{"./internal/output/", 85.0, "Output package coverage"},
 	}
 
+	// Run every package in one go test invocation so the toolchain starts
+	// once and builds the packages concurrently, then check each result.
+	// A failing package makes go test exit non-zero, so the error is only
+	// reported by the subtests whose packages did not pass.
+	args := []string{"test", "-cover"}
+	for _, pkg := range packages {
+		args = append(args, pkg.pkg)
+	}
+	cmd := exec.Command("go", args...)
+	cmd.Dir = projectRoot
+	out, err := cmd.CombinedOutput()
+	lines := packageOutputLines(string(out))
+
 	for _, pkg := range packages {
 		t.Run(pkg.pkg, func(t *testing.T) {
-			cmd := exec.Command("go", "test", "-cover", pkg.pkg)
-			cmd.Dir = projectRoot
-			out, err := cmd.CombinedOutput()
-			if err != nil {
-				t.Fatalf("go test -cover %s failed: %v\n%s", pkg.pkg, err, string(out))
+			rel := strings.TrimSuffix(strings.TrimPrefix(pkg.pkg, "./"), "/")
+			line, ok := lines[rel]
+			if !ok {
+				t.Errorf("No go test output for %s (go %s: %v):\n%s", pkg.pkg, strings.Join(args, " "), err, string(out))
+				return
+			}
+			if !strings.HasPrefix(line, "ok") {
+				t.Errorf("go test failed for %s:\n%s", pkg.pkg, string(out))
+				return
 			}
 
 			// Parse coverage from output like "coverage: 75.2% of statements"
-			coverage := parseCoveragePercent(string(out))
+			coverage := parseCoveragePercent(line)
 			if coverage < 0 {
-				t.Fatalf("Could not parse coverage from output:\n%s", string(out))
+				t.Fatalf("Could not parse coverage from output:\n%s", line)
 			}
 
 			t.Logf("%s: %.1f%% (threshold: %.1f%%)", pkg.desc, coverage, pkg.minCover)
@@ -62,6 +79,22 @@ func TestUnitCoverage(t *testing.T) {
 	}
 }
 
+// packageOutputLines indexes go test summary lines such as
+// "ok  \tgithub.com/rtmx-ai/rtmx/internal/graph\t0.01s\tcoverage: 90.0% of statements"
+// by the package path relative to the module root ("internal/graph").
+func packageOutputLines(output string) map[string]string {
+	const modulePrefix = "github.com/rtmx-ai/rtmx/"
+	lines := make(map[string]string)
+	for _, line := range strings.Split(output, "\n") {
+		fields := strings.Fields(line)
+		if len(fields) < 2 || !strings.HasPrefix(fields[1], modulePrefix) {
+			continue
+		}
+		lines[strings.TrimPrefix(fields[1], modulePrefix)] = line
+	}
+	return lines
+}
+
 // parseCoveragePercent extracts the coverage percentage from go test -cover output.
 func parseCoveragePercent(output string) float64 {
 	// Look for "coverage: XX.X% of statements"